@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+from settings import *
+from assets import ASSETS
+
+class ArtFactory:
+    """Cache of procedurally drawn entity art keyed by (kind, type, size)
+
+    Each entity module registers a builder for its kind that draws the art for
+    a type and (width, height), returning a Surface or a list of frames. Every
+    entity asking for the same key shares one drawing, so placing hundreds of
+    coins or pipes costs a dictionary lookup each rather than a redraw.
+
+    Art of atlas kinds is packed into the global atlas once and kept for the
+    run, since its atlas region can't be freed; past max_packed keys it is no
+    longer packed. Everything else lives in a bounded LRU, so churning through
+    pipe heights only ever evicts other unpacked art.
+    """
+
+    def __init__(self, max_entries=ART_CACHE_SIZE, max_packed=ART_ATLAS_ENTRIES):
+        self.max_entries = max_entries
+        self.max_packed = max_packed
+        self.builders = {}  # kind -> (builder(type, size), pack into the sprite atlas)
+        self.packed = {}  # (kind, type, size) -> art packed into the global atlas, never evicted
+        self.art = OrderedDict()  # (kind, type, size) -> unpacked Surface or tuple of frames
+        self.lock = threading.Lock()  # Streamed levels build pipes on a worker thread
+
+        # Counters for debugging and benchmarks
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, kind, builder, atlas=True):
+        """Set the builder for a kind; atlas=False keeps art that is only baked (not blitted each frame) out of the atlas"""
+        self.builders[kind] = (builder, atlas)
+
+    def lookup(self, key):
+        """Get cached art for a key, marking it recently used; call with the lock held"""
+        art = self.packed.get(key)
+        if art is None:
+            art = self.art.get(key)
+            if art is not None:
+                self.art.move_to_end(key)
+        return art
+
+    def get(self, kind, art_type, size):
+        """Get the art for a kind, type and (width, height), drawing it only when not cached"""
+        key = (kind, art_type, size)
+        with self.lock:
+            art = self.lookup(key)
+            if art is not None:
+                self.hits += 1
+                return art
+
+        # Draw without holding the lock, so other threads only wait on their own misses
+        builder, packed = self.builders[kind]
+        art = builder(art_type, size)
+
+        with self.lock:
+            cached = self.lookup(key)
+            if cached is not None:
+                self.hits += 1
+                return cached  # Another thread drew it first; share that one
+
+            self.misses += 1
+            if packed and len(self.packed) < self.max_packed:
+                # Shared for the whole run, so it goes in the global atlas whatever the current scope
+                with ASSETS.lock:
+                    atlas = ASSETS.atlas(ASSETS.GLOBAL_SCOPE)
+                    art = tuple(atlas.pack(frame) for frame in art) if isinstance(art, list) else atlas.pack(art)
+                self.packed[key] = art
+                return art
+
+            if isinstance(art, list):
+                art = tuple(art)
+            self.art[key] = art
+            if len(self.art) > self.max_entries:
+                self.art.popitem(last=False)  # Evict the least recently used art
+            return art
+
+    def clear(self):
+        """Drop the unpacked art; packed art stays, as dropping it would only pack it again"""
+        with self.lock:
+            self.art.clear()
+
+    def stats(self):
+        """Get the cache sizes and hit counts"""
+        return {"entries": len(self.art), "packed": len(self.packed), "hits": self.hits, "misses": self.misses}
+
+# Shared factory for pipe, coin, power-up and goomba art
+ART = ArtFactory()
@@ -0,0 +1,242 @@
+import threading
+import pygame
+from settings import *
+from atlas import TextureAtlas
+
+# Headless mode skips the display, surface conversion and audio
+_headless = False
+
+# Images and sounds each kind of level object needs, keyed by level data field
+LEVEL_ASSETS = {
+    "enemies": ([("koopa", (ENEMY_WIDTH, ENEMY_HEIGHT))], {"enemy_hit": None}),
+    "jumping_blocks": ([("question_block", (50, 50))], {"block_hit": None, "coin": None, "powerup": None}),
+    "powerups": ([], {"powerup": None}),
+    "flag_position": ([], {"level_complete": None}),
+}
+
+class FrameSet:
+    """Animation frames with every facing and effect variant built up front"""
+
+    def __init__(self, frames, effects=None):
+        # effects maps an effect name to the RGBA colour added over the frame
+        self.effects = effects or {}
+        self.variants = {}  # (index, flipped, effect) -> Surface
+        for index, frame in enumerate(frames):
+            for flipped in (False, True):
+                base = pygame.transform.flip(frame, True, False) if flipped else frame
+                self.variants[(index, flipped, None)] = base
+                for effect, color in self.effects.items():
+                    variant = base.copy()
+                    overlay = pygame.Surface(variant.get_size(), pygame.SRCALPHA)
+                    overlay.fill(color)
+                    variant.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                    self.variants[(index, flipped, effect)] = variant
+        self.count = len(frames)
+
+    def __len__(self):
+        return self.count
+
+    def pack(self, atlas):
+        """Move every variant into a texture atlas"""
+        self.variants = {key: atlas.pack(variant) for key, variant in self.variants.items()}
+
+    def get(self, index, flipped=False, effect=None):
+        """Get a prebuilt frame variant"""
+        return self.variants[(index, flipped, effect)]
+
+class AssetCache:
+    """Process-wide registry that loads each image and sound once and shares it
+
+    Streamed levels build sprites on a worker thread while the main thread
+    renders, so the cache's dictionaries and atlases are only touched under
+    its lock. Images and derived surfaces are loaded or built outside it; if
+    two threads miss the same key at once, the first one stored is shared.
+    """
+
+    GLOBAL_SCOPE = "global"
+    LEVEL_SCOPE = "level"
+
+    def __init__(self):
+        self.images = {}  # (path, size) -> Surface
+        self.sounds = {}  # (name, volume) -> Sound or None
+        self.derived = {}  # key -> Surface or FrameSet built from other assets
+        self.scopes = {}  # cache key -> scope it was first loaded in
+        self.scope = self.GLOBAL_SCOPE
+        self.atlases = {}  # scope -> TextureAtlas holding that scope's sprite frames
+        self.lock = threading.RLock()  # Held by atlas users such as ArtFactory while they pack
+
+        # Load counters for debugging and benchmarks
+        self.hits = 0
+        self.misses = 0
+
+    def begin_scope(self, scope):
+        """Tag assets loaded from now on with the given scope"""
+        with self.lock:
+            self.scope = scope
+
+    def image(self, path, size=None):
+        """Get an image, loading and scaling it on first use"""
+        key = (path, size)
+        with self.lock:
+            image = self.images.get(key)
+            if image is not None:
+                self.hits += 1
+                return image
+
+        image = pygame.image.load(path)
+        if not _headless:
+            image = image.convert_alpha()
+        if size:
+            image = pygame.transform.scale(image, size)
+
+        with self.lock:
+            cached = self.images.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached  # Another thread loaded it first
+            self.misses += 1
+            image = self.atlas().pack(image)
+            self.images[key] = image
+            self.scopes[("image",) + key] = self.scope
+            return image
+
+    def sound(self, name, volume=None):
+        """Get a sound effect by SOUND_EFFECTS name, or None if unavailable"""
+        key = (name, volume)
+        with self.lock:
+            if key in self.sounds:
+                self.hits += 1
+                return self.sounds[key]
+
+            self.misses += 1
+            sound = None
+            if not _headless:
+                try:
+                    sound = pygame.mixer.Sound(SOUND_EFFECTS[name])
+                    if volume is not None:
+                        sound.set_volume(volume)
+                except Exception:
+                    sound = None
+            self.sounds[key] = sound
+            self.scopes[("sound",) + key] = self.scope
+            return sound
+
+    def surface(self, key, factory):
+        """Get a surface (or frame set) derived from other assets, building it with factory() on first use"""
+        with self.lock:
+            surface = self.derived.get(key)
+            if surface is not None:
+                self.hits += 1
+                return surface
+
+        surface = factory()  # May load other assets itself
+
+        with self.lock:
+            cached = self.derived.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached  # Another thread built it first
+            self.misses += 1
+            if isinstance(surface, FrameSet):
+                surface.pack(self.atlas())
+            else:
+                surface = self.atlas().pack(surface)
+            self.derived[key] = surface
+            self.scopes[("derived", key)] = self.scope
+            return surface
+
+    def frames(self, key, build_frames, effects=None):
+        """Get a FrameSet, building it from build_frames() on first use"""
+        return self.surface(("frames", key), lambda: FrameSet(build_frames(), effects))
+
+    def atlas(self, scope=None):
+        """Get the texture atlas for assets of a scope (the current one by default)"""
+        with self.lock:
+            scope = scope or self.scope
+            atlas = self.atlases.get(scope)
+            if atlas is None:
+                atlas = self.atlases[scope] = TextureAtlas(convert=not _headless)
+            return atlas
+
+    def preload_level(self, level_data):
+        """Load everything a level's objects need before they are created"""
+        for field, (images, sounds) in LEVEL_ASSETS.items():
+            if not level_data.get(field):
+                continue
+            for name, size in images:
+                try:
+                    self.image(SPRITE_IMAGES[name], size)
+                except Exception as e:
+                    print(f"Error preloading {name}: {e}")
+            for name, volume in sounds.items():
+                self.sound(name, volume)
+
+    def release(self, scope):
+        """Drop every asset loaded in the given scope"""
+        with self.lock:
+            for cache_key, asset_scope in list(self.scopes.items()):
+                if asset_scope != scope:
+                    continue
+                del self.scopes[cache_key]
+                kind = cache_key[0]
+                if kind == "image":
+                    self.images.pop(cache_key[1:], None)
+                elif kind == "sound":
+                    self.sounds.pop(cache_key[1:], None)
+                else:
+                    self.derived.pop(cache_key[1], None)
+            self.atlases.pop(scope, None)  # Sprites still showing keep their page alive until they go
+
+    def clear(self):
+        """Drop every cached asset"""
+        with self.lock:
+            self.images.clear()
+            self.sounds.clear()
+            self.derived.clear()
+            self.scopes.clear()
+            self.atlases.clear()
+
+    def stats(self):
+        """Get cache sizes and hit counts"""
+        with self.lock:
+            return {
+                "images": len(self.images),
+                "sounds": len(self.sounds),
+                "derived": len(self.derived),
+                "atlas_pages": sum(len(atlas.pages) for atlas in self.atlases.values()),
+                "atlas_frames": sum(len(atlas.index) for atlas in self.atlases.values()),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+# Shared cache used by every entity class
+ASSETS = AssetCache()
+
+def set_headless(enabled):
+    """Enable or disable headless asset loading"""
+    global _headless
+    if enabled != _headless:
+        # Cached surfaces were converted (or not) for the previous mode
+        ASSETS.clear()
+    _headless = enabled
+
+def is_headless():
+    """Check if assets are being loaded for headless simulation"""
+    return _headless
+
+def load_image(path, size=None):
+    """Load an image through the shared cache; the result must not be modified"""
+    return ASSETS.image(path, size)
+
+def load_sound(name, volume=None):
+    """Load a sound effect through the shared cache, or None in headless mode"""
+    return ASSETS.sound(name, volume)
+
+def load_sounds(volumes):
+    """Load several sound effects from a {name: volume} dict, skipping any that fail"""
+    sounds = {}
+    for name, volume in volumes.items():
+        sound = load_sound(name, volume)
+        if sound:
+            sounds[name] = sound
+    return sounds
@@ -0,0 +1,77 @@
+import pygame
+from settings import *
+
+class AtlasPage:
+    """One atlas surface, filled shelf by shelf from the top left"""
+
+    def __init__(self, size, convert):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        if convert:
+            self.surface = self.surface.convert_alpha()
+        self.x = 0  # Next free column on the current shelf
+        self.shelf_top = 0
+        self.shelf_height = 0
+
+    def place(self, width, height):
+        """Reserve room for a frame, returning its rect or None if the page is full"""
+        page_width, page_height = self.surface.get_size()
+        if self.x + width > page_width:
+            # Start a new shelf under the tallest frame of this one
+            self.shelf_top += self.shelf_height
+            self.x = 0
+            self.shelf_height = 0
+        if self.shelf_top + height > page_height:
+            return None
+        rect = pygame.Rect(self.x, self.shelf_top, width, height)
+        self.x += width
+        self.shelf_height = max(self.shelf_height, height)
+        return rect
+
+class TextureAtlas:
+    """Packs sprite frames into shared page surfaces and hands back sub-surfaces of them
+
+    Every frame drawn from the atlas is a view into the same page, so frames
+    cost no memory of their own and consecutive blits keep reading from one
+    surface. Pages never move or grow, so handed-out sub-surfaces stay valid
+    until the atlas is dropped.
+    """
+
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, max_frame=ATLAS_MAX_FRAME, convert=True):
+        self.page_size = page_size
+        self.max_frame = max_frame
+        self.convert = convert
+        self.pages = []
+        self.index = []  # (page number, rect) of every packed frame, in packing order
+
+    def packable(self, surface):
+        """Check if a surface can live in the atlas without changing how it draws"""
+        width, height = surface.get_size()
+        if width == 0 or height == 0 or width > self.max_frame or height > self.max_frame:
+            return False
+        # Pages have per-pixel alpha: opaque frames would gain an alpha channel (changing how
+        # later blends onto copies of them behave), and colour keys or surface alpha would be lost
+        return (surface.get_flags() & pygame.SRCALPHA and surface.get_colorkey() is None
+                and surface.get_alpha() in (None, 255))
+
+    def pack(self, surface):
+        """Copy a frame into the atlas and return its sub-surface (or the frame itself if it can't be packed)"""
+        if surface.get_parent() is not None:
+            return surface  # Already a view into a page, e.g. a shared frame seen again in a frame set
+        if not self.packable(surface):
+            return surface
+
+        width, height = surface.get_size()
+        rect = self.pages[-1].place(width, height) if self.pages else None
+        if rect is None:
+            self.pages.append(AtlasPage(self.page_size, self.convert))
+            rect = self.pages[-1].place(width, height)
+        page = self.pages[-1]
+        page.surface.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)  # An exact copy onto the clear page
+        self.index.append((len(self.pages) - 1, rect))
+        return page.surface.subsurface(rect)
+
+    def stats(self):
+        """Get page and frame counts and the fraction of page area in use"""
+        used = sum(rect.width * rect.height for _, rect in self.index)
+        area = len(self.pages) * self.page_size[0] * self.page_size[1]
+        return {"pages": len(self.pages), "frames": len(self.index), "fill": used / area if area else 0.0}
@@ -0,0 +1,209 @@
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pygame
+from settings import *
+from game import MarioGame
+from level_loader import LEVELS
+from level_generator import LevelGenerator
+from profiling import SectionProfiler, game_sections
+
+# Phases reported for every scenario, in display order
+PHASES = ("input", "player", "enemies", "collision", "particles", "update", "draw", "hud")
+
+def scripted_controls(frame):
+    """The input track every scenario replays: run right in bursts, back off, hop regularly"""
+    step = frame % 200
+    return step >= 170, step < 150, frame % 40 < 20
+
+def make_stress_level(level_data, factor):
+    """Copy a level with factor times as many enemies, coins, blocks and power-ups"""
+    stress = dict(level_data)
+    for key in ("enemies", "coins", "powerups"):
+        # Spread the copies a little so they don't move in lockstep
+        stress[key] = [(item[0] + (copy * 23) % 160 - 80 if copy else item[0],) + tuple(item[1:])
+                       for copy in range(factor) for item in level_data[key]]
+    # Blocks stay in place so the level remains playable
+    stress["jumping_blocks"] = [block for copy in range(factor) for block in level_data["jumping_blocks"]]
+    return stress
+
+def default_scenarios():
+    """(name, level index, level data or None) for each level and stress level"""
+    scenarios = [(f"level-{index + 1}", index, None) for index in range(len(LEVELS))]
+    for factor in BENCHMARK_STRESS_FACTORS:
+        scenarios.append((f"stress-{factor}x", 0, make_stress_level(LEVELS[0], factor)))
+    for width, density in BENCHMARK_GENERATED_LEVELS:
+        level = LevelGenerator(BENCHMARK_SEED, width, density).generate()
+        scenarios.append((f"gen-{width // 1000}k", 0, level))
+    return scenarios
+
+def summarize(values):
+    """Mean, median, 99th percentile and max of a series, in milliseconds"""
+    values = np.asarray(values) * 1000.0
+    return {
+        "mean": round(float(values.mean()), 4),
+        "p50": round(float(np.percentile(values, 50)), 4),
+        "p99": round(float(np.percentile(values, 99)), 4),
+        "max": round(float(values.max()), 4)
+    }
+
+def start_level(game, level_index, level_data):
+    """Start a new game on a scenario's level"""
+    game.start_game(level_index)
+    if level_data is not None:
+        game.load_level(level_index, level_data)
+        game.camera.reset()
+
+def run_scenario(level_index, level_data, frames, seed, trace_allocations=False):
+    """Play one scenario headless and collect frame, phase and memory statistics
+
+    With trace_allocations, tracemalloc also records how many bytes each frame
+    allocates above the heap it started with (peak minus start, so memory freed
+    within the frame still counts). Tracing slows every allocation, so frame
+    times from such a run aren't comparable with untraced ones.
+    """
+    game = MarioGame(headless=True, seed=seed)
+    start_level(game, level_index, level_data)
+
+    # Losing or finishing the level rewinds to the start so every frame is gameplay.
+    # Streamed levels can't be snapshotted, so they are reloaded instead
+    start_state = None if game.streamer else game.snapshot()
+    restarts = 0
+
+    profiler = SectionProfiler()
+    profiler.attach_all(game_sections(game))
+    frame_times = []
+    phase_times = {phase: [] for phase in PHASES}
+    block_growth = []
+    frame_peaks = []
+
+    collections = [0]
+    def count_collection(phase, info):
+        if phase == "start":
+            collections[0] += 1
+    gc.collect()
+    gc.callbacks.append(count_collection)
+    if trace_allocations:
+        tracemalloc.start()
+
+    try:
+        for frame in range(frames):
+            left, right, jump = scripted_controls(frame)
+            game.set_controls(left, right, jump)
+
+            if trace_allocations:
+                tracemalloc.reset_peak()
+                traced = tracemalloc.get_traced_memory()[0]
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            game.update()
+            game.draw()
+            frame_times.append(time.perf_counter() - start)
+            block_growth.append(sys.getallocatedblocks() - blocks)
+            if trace_allocations:
+                frame_peaks.append(tracemalloc.get_traced_memory()[1] - traced)
+
+            sections = profiler.end_frame()
+            for phase in PHASES:
+                phase_times[phase].append(sections.get(phase, 0.0))
+
+            if game.game_state != PLAYING:
+                if start_state is not None:
+                    game.restore(start_state)
+                else:
+                    start_level(game, level_index, level_data)
+                restarts += 1
+    finally:
+        if trace_allocations:
+            tracemalloc.stop()
+        gc.callbacks.remove(count_collection)
+        profiler.detach()
+
+    result = {
+        "level": level_index + 1,
+        "entities": {
+            "enemies": len(game.enemies),
+            "coins": len(game.coins),
+            "jumping_blocks": len(game.jumping_blocks),
+            "powerups": len(game.powerups),
+            "platforms": len(game.platforms)
+        },
+        "frames": frames,
+        "restarts": restarts,
+        "frame_ms": summarize(frame_times),
+        "phases_ms": {phase: summarize(times) for phase, times in phase_times.items()},
+        # Blocks alive after the frame minus before it; steady churn nets out to about zero
+        "net_block_growth_per_frame": {
+            "mean": round(float(np.mean(block_growth)), 2),
+            "max": int(np.max(block_growth))
+        },
+        "gc_collections": collections[0]
+    }
+    if trace_allocations:
+        result["allocated_bytes_per_frame"] = {
+            "mean": round(float(np.mean(frame_peaks)), 1),
+            "p99": int(np.percentile(frame_peaks, 99)),
+            "max": int(np.max(frame_peaks))
+        }
+    return result
+
+def print_report(results):
+    """Print a table of frame and phase means per scenario"""
+    header = f"{'scenario':<14}{'mean':>8}{'p50':>8}{'p99':>8}{'max':>8}  " + "".join(f"{phase:>10}" for phase in PHASES)
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        frame = result["frame_ms"]
+        phases = "".join(f"{result['phases_ms'][phase]['mean']:>10.3f}" for phase in PHASES)
+        print(f"{name:<14}{frame['mean']:>8.3f}{frame['p50']:>8.3f}{frame['p99']:>8.3f}{frame['max']:>8.3f}  {phases}")
+    print("(milliseconds; phases are means of exclusive time)")
+
+    traced = {name: result["allocated_bytes_per_frame"] for name, result in results.items()
+              if "allocated_bytes_per_frame" in result}
+    if traced:
+        print()
+        print(f"{'scenario':<14}{'mean':>10}{'p99':>10}{'max':>10}")
+        for name, allocated in traced.items():
+            print(f"{name:<14}{allocated['mean'] / 1024:>10.1f}{allocated['p99'] / 1024:>10.1f}{allocated['max'] / 1024:>10.1f}")
+        print("(KiB allocated per frame, traced)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark")
+    parser.add_argument("--frames", type=int, default=BENCHMARK_FRAMES, help="frames per scenario")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument("--scenario", action="append", help="only run scenarios with this name (repeatable)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--trace-allocations", action="store_true",
+                        help="measure bytes allocated per frame with tracemalloc (slows every frame)")
+    args = parser.parse_args(argv)
+
+    scenarios = default_scenarios()
+    if args.scenario:
+        scenarios = [scenario for scenario in scenarios if scenario[0] in args.scenario]
+
+    results = {}
+    for name, level_index, level_data in scenarios:
+        results[name] = run_scenario(level_index, level_data, args.frames, args.seed, args.trace_allocations)
+    print_report(results)
+
+    report = {
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "frames": args.frames,
+        "seed": args.seed,
+        "trace_allocations": args.trace_allocations,
+        "scenarios": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,11 @@
 import pygame
 import math
-import random
 from settings import *
+from rng import RNG
+from text_cache import TEXT_CACHE
+
+# Seeded stream for camera shake, reproducible with RNG.seed()
+rng = RNG.stream("camera")
 
 class Camera:
     def __init__(self, screen_width, screen_height):
@@ -14,6 +18,13 @@ class Camera:
         self.target_x = 0
         self.target_y = 0
         
+        # Render interpolation between fixed simulation steps
+        self.prev_x = 0
+        self.prev_y = 0
+        self.sim_x = 0
+        self.sim_y = 0
+        self.alpha = 1.0
+        
         # Camera modes
         self.CAMERA_FOLLOW = "follow"
         self.CAMERA_LERP = "lerp"
@@ -32,6 +43,9 @@ class Camera:
         self.target_zoom = 1.0
         self.zoom_speed = CAMERA_ZOOM_SPEED
         
+        # Off-screen surface the world is drawn on at 1x while zoomed, reused while its size holds
+        self.target = None
+        
         # Shake system
         self.shake_intensity = 0
         self.shake_duration = 0
@@ -63,6 +77,30 @@ class Camera:
         self.shake_intensity = max(self.shake_intensity, intensity)
         self.shake_duration = max(self.shake_duration, duration)
     
+    def store_previous(self):
+        """Remember the current position as the previous simulation step"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def begin_interpolation(self, alpha):
+        """Blend the camera position between the last two simulation steps for drawing"""
+        self.alpha = alpha
+        self.sim_x = self.x
+        self.sim_y = self.y
+        self.x = self.prev_x + (self.x - self.prev_x) * alpha
+        self.y = self.prev_y + (self.y - self.prev_y) * alpha
+    
+    def end_interpolation(self):
+        """Restore the simulated camera position after drawing"""
+        self.x = self.sim_x
+        self.y = self.sim_y
+        self.alpha = 1.0
+    
+    def interpolate_pos(self, x, y, prev_x, prev_y):
+        """Blend a world position between its previous and current simulation step"""
+        return (prev_x + (x - prev_x) * self.alpha,
+                prev_y + (y - prev_y) * self.alpha)
+    
     def update(self, target):
         """Update camera position based on target"""
         if not target:
@@ -85,9 +123,11 @@ class Camera:
             self.y += (target_y - self.y) * self.smoothness
         # CAMERA_LOCKED doesn't update position
         
-        # Update zoom
+        # Update zoom, settling exactly on the target so a stable zoom keeps its render target
         if abs(self.zoom_level - self.target_zoom) > 0.01:
             self.zoom_level += (self.target_zoom - self.zoom_level) * self.zoom_speed
+        else:
+            self.zoom_level = self.target_zoom
         
         # Update shake effect
         self.update_shake()
@@ -99,8 +139,8 @@ class Camera:
             
             # Calculate shake offset
             if self.shake_intensity > 0:
-                self.shake_offset_x = random.randint(-int(self.shake_intensity), int(self.shake_intensity))
-                self.shake_offset_y = random.randint(-int(self.shake_intensity), int(self.shake_intensity))
+                self.shake_offset_x = rng.randint(-int(self.shake_intensity), int(self.shake_intensity))
+                self.shake_offset_y = rng.randint(-int(self.shake_intensity), int(self.shake_intensity))
                 
                 # Decay shake intensity
                 self.shake_intensity *= self.shake_decay
@@ -113,47 +153,43 @@ class Camera:
             self.shake_offset_y = 0
             self.shake_intensity = 0
     
+    def view_offset(self):
+        """Get the whole-pixel shift from world space to the 1x render target"""
+        return (math.floor(self.shake_offset_x - self.x + 0.5),
+                math.floor(self.shake_offset_y - self.y + 0.5))
+    
     def apply(self, sprite):
-        """Apply camera transformation to a sprite"""
-        # Calculate position with shake and zoom
-        x = (sprite.rect.x - self.x + self.shake_offset_x) * self.zoom_level
-        y = (sprite.rect.y - self.y + self.shake_offset_y) * self.zoom_level
-        
-        # Create transformed rect
-        transformed_rect = sprite.rect.copy()
-        transformed_rect.x = x
-        transformed_rect.y = y
-        transformed_rect.width *= self.zoom_level
-        transformed_rect.height *= self.zoom_level
-        
-        return transformed_rect
+        """Apply camera transformation to a sprite, giving its rect on the render target"""
+        return sprite.rect.move(self.view_offset())
     
     def apply_rect(self, rect):
         """Apply camera transformation to a rect"""
-        # Calculate position with shake and zoom
-        x = (rect.x - self.x + self.shake_offset_x) * self.zoom_level
-        y = (rect.y - self.y + self.shake_offset_y) * self.zoom_level
-        
-        # Create transformed rect
-        transformed_rect = rect.copy()
-        transformed_rect.x = x
-        transformed_rect.y = y
-        transformed_rect.width *= self.zoom_level
-        transformed_rect.height *= self.zoom_level
-        
-        return transformed_rect
+        return rect.move(self.view_offset())
     
     def apply_pos(self, x, y):
-        """Apply camera transformation to coordinates"""
-        # Calculate position with shake and zoom
-        transformed_x = (x - self.x + self.shake_offset_x) * self.zoom_level
-        transformed_y = (y - self.y + self.shake_offset_y) * self.zoom_level
-        
-        return (transformed_x, transformed_y)
+        """Apply camera transformation to coordinates, snapping them to the pixel a rect there would use"""
+        offset_x, offset_y = self.view_offset()
+        return (math.floor(x + 0.5) + offset_x, math.floor(y + 0.5) + offset_y)
     
     def world_to_screen(self, world_x, world_y):
         """Convert world coordinates to screen coordinates"""
-        return self.apply_pos(world_x, world_y)
+        x, y = self.apply_pos(world_x, world_y)
+        return (x * self.zoom_level, y * self.zoom_level)
+    
+    def render_target(self, screen):
+        """Get the surface to draw the world on: the screen itself at 1x zoom, otherwise
+        an off-screen surface covering the zoomed view at 1x, scaled up by present()"""
+        if self.zoom_level == 1.0:
+            return screen
+        size = (math.ceil(self.screen_width / self.zoom_level), math.ceil(self.screen_height / self.zoom_level))
+        if self.target is None or self.target.get_size() != size:
+            self.target = pygame.Surface(size, 0, screen)  # Same pixel format as the screen
+        return self.target
+    
+    def present(self, target, screen):
+        """Scale a world drawn by render_target() onto the screen in a single pass"""
+        if target is not screen:
+            pygame.transform.scale(target, screen.get_size(), screen)
     
     def screen_to_world(self, screen_x, screen_y):
         """Convert screen coordinates to world coordinates"""
@@ -165,11 +201,11 @@ class Camera:
         """Check if a sprite is visible on screen"""
         transformed_rect = self.apply(sprite)
         
-        # Check if sprite is within screen bounds
+        # Check if sprite is within the zoomed view
         return (transformed_rect.right > 0 and 
-                transformed_rect.left < self.screen_width and
+                transformed_rect.left < self.screen_width / self.zoom_level and
                 transformed_rect.bottom > 0 and 
-                transformed_rect.top < self.screen_height)
+                transformed_rect.top < self.screen_height / self.zoom_level)
     
     def get_visible_area(self):
         """Get the visible world area"""
@@ -185,12 +221,20 @@ class Camera:
             'height': bottom_right[1] - top_left[1]
         }
     
+    def get_active_rect(self, margin=0):
+        """Get the visible world area as a Rect grown by margin on every side"""
+        area = self.get_visible_area()
+        return pygame.Rect(int(area['left']) - margin, int(area['top']) - margin,
+                           int(area['width']) + margin * 2, int(area['height']) + margin * 2)
+    
     def reset(self):
         """Reset camera to initial state"""
         self.x = 0
         self.y = 0
         self.target_x = 0
         self.target_y = 0
+        self.prev_x = 0
+        self.prev_y = 0
         self.zoom_level = 1.0
         self.target_zoom = 1.0
         self.shake_intensity = 0
@@ -198,31 +242,47 @@ class Camera:
         self.shake_offset_x = 0
         self.shake_offset_y = 0
     
+    def get_state(self):
+        """Get position, zoom and shake state as a list of numbers"""
+        modes = (self.CAMERA_FOLLOW, self.CAMERA_LERP, self.CAMERA_LOCKED)
+        return [self.x, self.y, self.target_x, self.target_y, self.prev_x, self.prev_y,
+                modes.index(self.current_mode), self.zoom_level, self.target_zoom,
+                self.shake_intensity, self.shake_duration, self.shake_offset_x, self.shake_offset_y]
+    
+    def set_state(self, values):
+        """Restore state from get_state()"""
+        modes = (self.CAMERA_FOLLOW, self.CAMERA_LERP, self.CAMERA_LOCKED)
+        (self.x, self.y, self.target_x, self.target_y, self.prev_x, self.prev_y, mode,
+         self.zoom_level, self.target_zoom, self.shake_intensity, shake_duration,
+         shake_offset_x, shake_offset_y) = values
+        self.current_mode = modes[int(mode)]
+        self.shake_duration = int(shake_duration)
+        self.shake_offset_x = int(shake_offset_x)
+        self.shake_offset_y = int(shake_offset_y)
+    
     def draw_debug_info(self, screen):
         """Draw debug information about the camera"""
         if not self.debug_mode:
             return
         
-        font = pygame.font.Font(None, 24)
-        
         # Camera position
-        pos_text = font.render(f"Camera: ({self.x:.1f}, {self.y:.1f})", True, (255, 255, 0))
+        pos_text = TEXT_CACHE.render(f"Camera: ({self.x:.1f}, {self.y:.1f})", DEBUG_FONT_SIZE, (255, 255, 0))
         screen.blit(pos_text, (10, 10))
         
         # Zoom level
-        zoom_text = font.render(f"Zoom: {self.zoom_level:.2f}", True, (255, 255, 0))
+        zoom_text = TEXT_CACHE.render(f"Zoom: {self.zoom_level:.2f}", DEBUG_FONT_SIZE, (255, 255, 0))
         screen.blit(zoom_text, (10, 35))
         
         # Camera mode
-        mode_text = font.render(f"Mode: {self.current_mode}", True, (255, 255, 0))
+        mode_text = TEXT_CACHE.render(f"Mode: {self.current_mode}", DEBUG_FONT_SIZE, (255, 255, 0))
         screen.blit(mode_text, (10, 60))
         
         # Shake info
         if self.shake_intensity > 0:
-            shake_text = font.render(f"Shake: {self.shake_intensity:.1f}", True, (255, 0, 0))
+            shake_text = TEXT_CACHE.render(f"Shake: {self.shake_intensity:.1f}", DEBUG_FONT_SIZE, (255, 0, 0))
             screen.blit(shake_text, (10, 85))
         
         # Visible area
         visible_area = self.get_visible_area()
-        area_text = font.render(f"Area: {visible_area['left']:.0f},{visible_area['top']:.0f} to {visible_area['right']:.0f},{visible_area['bottom']:.0f}", True, (255, 255, 0))
+        area_text = TEXT_CACHE.render(f"Area: {visible_area['left']:.0f},{visible_area['top']:.0f} to {visible_area['right']:.0f},{visible_area['bottom']:.0f}", DEBUG_FONT_SIZE, (255, 255, 0))
         screen.blit(area_text, (10, 110)) 
\ No newline at end of file
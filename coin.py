@@ -1,16 +1,13 @@
 import pygame
 import math
 from settings import *
+from art import ART
 
 class Coin(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        # Create a transparent surface for the coin
-        self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
-        # Draw a proper circular coin
-        pygame.draw.circle(self.image, (255, 215, 0), (10, 10), 10)  # Gold circle
-        pygame.draw.circle(self.image, (255, 165, 0), (10, 10), 8)   # Darker gold inner circle
-        pygame.draw.circle(self.image, (255, 215, 0), (10, 10), 6)   # Bright gold center
+        # Every coin shares one image
+        self.image = ART.get("coin", "gold", (20, 20))
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -25,4 +22,32 @@ class Coin(pygame.sprite.Sprite):
         # Simple bobbing animation
         self.animation_timer += self.animation_speed
         self.bob_offset = int(3 * abs(math.sin(self.animation_timer)))
-        self.rect.y = self.original_y - self.bob_offset 
\ No newline at end of file
+        self.rect.y = self.original_y - self.bob_offset
+        
+    def get_state(self):
+        """Get animation state as a list of numbers"""
+        return [self.rect.y, self.animation_timer, self.bob_offset]
+        
+    def set_state(self, values):
+        """Restore state from get_state()"""
+        y, self.animation_timer, bob_offset = values
+        self.rect.y = y
+        self.bob_offset = int(bob_offset)
+        
+    def draw(self, screen, camera):
+        """Draw the coin with camera offset"""
+        screen.blit(self.image, camera.apply(self))
+
+def draw_coin(coin_type, size):
+    """Draw a coin at (width, height)"""
+    width, height = size
+    center = (width // 2, height // 2)
+    # Create a transparent surface for the coin
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    # Draw a proper circular coin
+    pygame.draw.circle(image, (255, 215, 0), center, width // 2)  # Gold circle
+    pygame.draw.circle(image, (255, 165, 0), center, width * 2 // 5)   # Darker gold inner circle
+    pygame.draw.circle(image, (255, 215, 0), center, width * 3 // 10)   # Bright gold center
+    return image
+
+ART.register("coin", draw_coin)
@@ -1,5 +1,7 @@
 import pygame
 from settings import *
+from spatial_hash import SpatialHash
+from jumping_block import JumpingBlock
 
 class CollisionSystem:
     """Improved collision system with better physics and collision detection"""
@@ -7,104 +9,154 @@ class CollisionSystem:
     def __init__(self):
         self.debug_mode = False  # Set to True to see collision boxes
         
+        # Broadphase grids of static level geometry (None tests every object)
+        self.platform_index = None
+        self.block_index = None
+        self.pipe_index = None
+        
+    def build_static_index(self, platforms, jumping_blocks=None, pipes=None):
+        """Index static level geometry so movers only test nearby objects"""
+        self.platform_index = SpatialHash()
+        for platform in platforms:
+            self.platform_index.insert(platform)
+        
+        self.block_index = SpatialHash()
+        for block in jumping_blocks or []:
+            # Blocks bob in place, so index a slightly taller area
+            self.block_index.insert(block, block.rect.inflate(0, BLOCK_BOB_MARGIN * 2))
+        
+        self.pipe_index = SpatialHash()
+        for pipe in pipes or []:
+            self.pipe_index.insert(pipe)
+    
+    def add_static(self, platforms=(), jumping_blocks=(), pipes=()):
+        """Add geometry to the broadphase grids, e.g. as a streamed level sector spawns"""
+        for platform in platforms:
+            self.platform_index.insert(platform)
+        for block in jumping_blocks:
+            self.block_index.insert(block, block.rect.inflate(0, BLOCK_BOB_MARGIN * 2))
+        for pipe in pipes:
+            self.pipe_index.insert(pipe)
+    
+    def remove_static(self, sprite):
+        """Drop one piece of geometry from the broadphase grids"""
+        for index in (self.platform_index, self.block_index, self.pipe_index):
+            index.remove(sprite)
+    
+    def clear_static_index(self):
+        """Drop the broadphase grids"""
+        self.platform_index = None
+        self.block_index = None
+        self.pipe_index = None
+    
+    def nearby(self, index, rect, objects):
+        """Get the objects that may overlap rect, or all of them without an index"""
+        if index is None or objects is None:
+            return objects
+        return index.query(rect)
+    
+    def nearby_platforms(self, rect, platforms):
+        """Get the platforms that may overlap rect"""
+        return self.nearby(self.platform_index, rect, platforms)
+    
+    def nearby_blocks(self, rect, jumping_blocks):
+        """Get the jumping blocks that may overlap rect"""
+        return self.nearby(self.block_index, rect, jumping_blocks)
+    
+    def nearby_pipes(self, rect, pipes):
+        """Get the pipes that may overlap rect"""
+        return self.nearby(self.pipe_index, rect, pipes)
+        
+    def sweep_horizontal(self, rect, velocity_x, obstacles):
+        """Move rect sideways, stopping flush against the first obstacle its path crosses
+        
+        The whole swept span is tested, so thin geometry can't be skipped by fast
+        moves. Obstacles the rect already overlaps by more than COLLISION_SKIN are
+        left alone rather than pushed out through. Returns the obstacles it stopped
+        against (empty if the move was clear).
+        """
+        left = rect.left
+        right = rect.right
+        rect.x += velocity_x  # Rounded like any Rect move
+        if rect.left > left:
+            blockers = [obstacle for obstacle in obstacles
+                        if obstacle.rect.top < rect.bottom and obstacle.rect.bottom > rect.top
+                        and obstacle.rect.left >= right - COLLISION_SKIN and obstacle.rect.left < rect.right]
+            if blockers:
+                rect.right = min(obstacle.rect.left for obstacle in blockers)
+                return [obstacle for obstacle in blockers if obstacle.rect.left == rect.right]
+        elif rect.left < left:
+            blockers = [obstacle for obstacle in obstacles
+                        if obstacle.rect.top < rect.bottom and obstacle.rect.bottom > rect.top
+                        and obstacle.rect.right <= left + COLLISION_SKIN and obstacle.rect.right > rect.left]
+            if blockers:
+                rect.left = max(obstacle.rect.right for obstacle in blockers)
+                return [obstacle for obstacle in blockers if obstacle.rect.right == rect.left]
+        return []
+    
+    def sweep_vertical(self, rect, velocity_y, obstacles):
+        """Move rect up or down, stopping flush against the first obstacle its path crosses
+        
+        Returns the obstacles it landed on or bumped into (empty if the move was clear).
+        """
+        top = rect.top
+        bottom = rect.bottom
+        rect.y += velocity_y  # Rounded like any Rect move
+        if rect.top > top:
+            blockers = [obstacle for obstacle in obstacles
+                        if obstacle.rect.left < rect.right and obstacle.rect.right > rect.left
+                        and obstacle.rect.top >= bottom - COLLISION_SKIN and obstacle.rect.top < rect.bottom]
+            if blockers:
+                rect.bottom = min(obstacle.rect.top for obstacle in blockers)
+                return [obstacle for obstacle in blockers if obstacle.rect.top == rect.bottom]
+        elif rect.top < top:
+            blockers = [obstacle for obstacle in obstacles
+                        if obstacle.rect.left < rect.right and obstacle.rect.right > rect.left
+                        and obstacle.rect.bottom <= top + COLLISION_SKIN and obstacle.rect.bottom > rect.top]
+            if blockers:
+                rect.top = max(obstacle.rect.bottom for obstacle in blockers)
+                return [obstacle for obstacle in blockers if obstacle.rect.bottom == rect.top]
+        return []
+    
     def update_player_collisions(self, player, platforms, jumping_blocks=None, pipes=None, enemies=None):
         """Main collision update method for player"""
         
-        # Store original position for collision resolution
-        original_x = player.rect.x
-        original_y = player.rect.y
-        
-        # Apply horizontal movement and collision
-        player.rect.x += player.velocity_x
-        self.resolve_horizontal_collisions(player, platforms, jumping_blocks, pipes)
+        # Only test geometry near the path covered by this move (padded for rounding)
+        area = player.rect.union(player.rect.move(player.velocity_x, player.velocity_y)).inflate(2, 2)
+        solids = list(self.nearby_platforms(area, platforms))
+        if jumping_blocks:
+            solids += self.nearby_blocks(area, jumping_blocks)
+        if pipes:
+            solids += self.nearby_pipes(area, pipes)
         
-        # Apply vertical movement and collision
-        player.rect.y += player.velocity_y
-        self.resolve_vertical_collisions(player, platforms, jumping_blocks, pipes)
+        # Sweep horizontally, then vertically
+        self.resolve_horizontal_collisions(player, solids)
+        self.resolve_vertical_collisions(player, solids)
         
         # Check enemy collisions (separate from movement collisions)
         if enemies:
             self.check_enemy_collisions(player, enemies)
     
-    def resolve_horizontal_collisions(self, player, platforms, jumping_blocks=None, pipes=None):
-        """Resolve horizontal collisions with proper collision response"""
-        
-        # Check platforms
-        for platform in platforms:
-            if player.rect.colliderect(platform.rect):
-                if player.velocity_x > 0:  # Moving right
-                    player.rect.right = platform.rect.left
-                    player.velocity_x = 0
-                elif player.velocity_x < 0:  # Moving left
-                    player.rect.left = platform.rect.right
-                    player.velocity_x = 0
-        
-        # Check jumping blocks
-        if jumping_blocks:
-            for block in jumping_blocks:
-                if player.rect.colliderect(block.rect):
-                    if player.velocity_x > 0:  # Moving right
-                        player.rect.right = block.rect.left
-                        player.velocity_x = 0
-                    elif player.velocity_x < 0:  # Moving left
-                        player.rect.left = block.rect.right
-                        player.velocity_x = 0
-        
-        # Check pipes
-        if pipes:
-            for pipe in pipes:
-                if player.rect.colliderect(pipe.rect):
-                    if player.velocity_x > 0:  # Moving right
-                        player.rect.right = pipe.rect.left
-                        player.velocity_x = 0
-                    elif player.velocity_x < 0:  # Moving left
-                        player.rect.left = pipe.rect.right
-                        player.velocity_x = 0
-    
-    def resolve_vertical_collisions(self, player, platforms, jumping_blocks=None, pipes=None):
-        """Resolve vertical collisions with proper collision response"""
-        
+    def resolve_horizontal_collisions(self, player, solids):
+        """Move the player sideways, stopping at walls"""
+        if self.sweep_horizontal(player.rect, player.velocity_x, solids):
+            player.velocity_x = 0
+    
+    def resolve_vertical_collisions(self, player, solids):
+        """Move the player vertically, landing on tops and recording blocks bumped from below"""
         player.on_ground = False
+        player.ceiling_hits = []
         
-        # Check platforms
-        for platform in platforms:
-            if player.rect.colliderect(platform.rect):
-                if player.velocity_y > 0:  # Falling down
-                    player.rect.bottom = platform.rect.top
-                    player.velocity_y = 0
-                    player.on_ground = True
-                    player.is_jumping = False
-                elif player.velocity_y < 0:  # Jumping up
-                    player.rect.top = platform.rect.bottom
-                    player.velocity_y = 0
-        
-        # Check jumping blocks
-        if jumping_blocks:
-            for block in jumping_blocks:
-                if player.rect.colliderect(block.rect):
-                    if player.velocity_y > 0:  # Landing on top
-                        player.rect.bottom = block.rect.top
-                        player.velocity_y = 0
-                        player.on_ground = True
-                        player.is_jumping = False
-                    elif player.velocity_y < 0:  # Hitting from below
-                        player.rect.top = block.rect.bottom
-                        player.velocity_y = 0
-                        # Trigger block hit effect
-                        block.hit()
-        
-        # Check pipes
-        if pipes:
-            for pipe in pipes:
-                if player.rect.colliderect(pipe.rect):
-                    if player.velocity_y > 0:  # Landing on top
-                        player.rect.bottom = pipe.rect.top
-                        player.velocity_y = 0
-                        player.on_ground = True
-                        player.is_jumping = False
-                    elif player.velocity_y < 0:  # Hitting from below
-                        player.rect.top = pipe.rect.bottom
-                        player.velocity_y = 0
+        velocity_y = player.velocity_y
+        contacts = self.sweep_vertical(player.rect, velocity_y, solids)
+        if not contacts:
+            return
+        player.velocity_y = 0
+        if velocity_y > 0:  # Landed on top
+            player.on_ground = True
+            player.is_jumping = False
+        else:  # Hit from below; the game rewards the blocks
+            player.ceiling_hits = [contact for contact in contacts if isinstance(contact, JumpingBlock)]
     
     def check_enemy_collisions(self, player, enemies):
         """Check and handle enemy collisions with proper response"""
@@ -161,40 +213,6 @@ class CollisionSystem:
                 return True
         return False
     
-    def update_enemy_collisions(self, enemy, platforms):
-        """Update enemy collisions with platforms"""
-        
-        # Apply gravity
-        enemy.velocity_y += GRAVITY
-        
-        # Move horizontally
-        enemy.rect.x += enemy.velocity_x
-        
-        # Check horizontal collisions
-        for platform in platforms:
-            if enemy.rect.colliderect(platform.rect):
-                if enemy.velocity_x > 0:  # Moving right
-                    enemy.rect.right = platform.rect.left
-                    enemy.change_direction()  # Use enemy's change_direction method
-                elif enemy.velocity_x < 0:  # Moving left
-                    enemy.rect.left = platform.rect.right
-                    enemy.change_direction()  # Use enemy's change_direction method
-        
-        # Move vertically
-        enemy.rect.y += enemy.velocity_y
-        
-        # Check vertical collisions
-        enemy.on_ground = False
-        for platform in platforms:
-            if enemy.rect.colliderect(platform.rect):
-                if enemy.velocity_y > 0:  # Falling
-                    enemy.rect.bottom = platform.rect.top
-                    enemy.velocity_y = 0
-                    enemy.on_ground = True
-                elif enemy.velocity_y < 0:  # Jumping up
-                    enemy.rect.top = platform.rect.bottom
-                    enemy.velocity_y = 0
-    
     def draw_debug_collisions(self, screen, player, platforms, enemies=None, coins=None):
         """Draw collision boxes for debugging"""
         if not self.debug_mode:
@@ -1,15 +1,46 @@
 import pygame
-import math
-import random
 from settings import *
+from assets import ASSETS, load_image, load_sounds
+from enemy_manager import EnemyManager, rng
+from art import ART
+
+def slot_attribute(name, kind):
+    """Property reading and writing one field of an enemy's manager slot as a Python value"""
+    def get(self):
+        return kind(getattr(self.manager, name)[self.slot])
+    def set(self, value):
+        getattr(self.manager, name)[self.slot] = value
+    return property(get, set)
 
 class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, direction="left", enemy_type="goomba"):
+    """An enemy sprite whose physics, AI and animation state live in an EnemyManager slot"""
+    velocity_x = slot_attribute("velocity_x", float)
+    velocity_y = slot_attribute("velocity_y", float)
+    on_ground = slot_attribute("on_ground", bool)
+    is_jumping = slot_attribute("is_jumping", bool)
+    animation_timer = slot_attribute("animation_timer", float)
+    animation_index = slot_attribute("animation_index", int)
+    frame_count = slot_attribute("frame_count", int)
+    behavior_timer = slot_attribute("behavior_timer", int)
+    behavior_interval = slot_attribute("behavior_interval", int)
+    patrol_distance = slot_attribute("patrol_distance", int)
+    start_x = slot_attribute("start_x", int)
+    jump_cooldown = slot_attribute("jump_cooldown", int)
+    is_alive = slot_attribute("is_alive", bool)
+    is_stunned = slot_attribute("is_stunned", bool)
+    stun_timer = slot_attribute("stun_timer", int)
+    health = slot_attribute("health", int)
+    
+    def __init__(self, x, y, direction="left", enemy_type="goomba", manager=None):
         super().__init__()
+        # Standalone enemies get a private manager; the game shares one across the level
+        self.manager = manager or EnemyManager(1)
+        self.slot = self.manager.add()
         self.x = x
         self.y = y
         self.direction = direction
         self.enemy_type = enemy_type
+        self.manager.is_koopa[self.slot] = enemy_type == "koopa"
         self.width = ENEMY_WIDTH
         self.height = ENEMY_HEIGHT
         
@@ -17,31 +48,29 @@ class Enemy(pygame.sprite.Sprite):
         self.velocity_x = ENEMY_SPEED if direction == "right" else -ENEMY_SPEED
         self.velocity_y = 0
         self.on_ground = False
-        self.gravity = GRAVITY
         
         # Animation
         self.animation_timer = 0
-        self.animation_speed = 0.15
         self.animation_index = 0
         self.frame_count = 0
         
         # AI behavior - varied initialization
-        self.behavior_timer = random.randint(0, 60)  # Random start time
-        self.behavior_interval = random.randint(60, 180)  # 1-3 seconds
-        self.patrol_distance = random.randint(50, 150)
+        self.behavior_timer = rng.randint(0, 60)  # Random start time
+        self.behavior_interval = rng.randint(60, 180)  # 1-3 seconds
+        self.patrol_distance = rng.randint(50, 150)
         self.start_x = x
         self.is_jumping = False
-        self.jump_cooldown = random.randint(0, 30)  # Random initial cooldown
+        self.jump_cooldown = rng.randint(0, 30)  # Random initial cooldown
         
         # Enemy-specific variations
         if self.enemy_type == "koopa":
             # Koopas are more aggressive and jump more
-            self.behavior_interval = random.randint(40, 120)  # Faster behavior changes
-            self.patrol_distance = random.randint(80, 200)  # Larger patrol area
+            self.behavior_interval = rng.randint(40, 120)  # Faster behavior changes
+            self.patrol_distance = rng.randint(80, 200)  # Larger patrol area
         else:  # Goomba
             # Goombas are slower and more predictable
-            self.behavior_interval = random.randint(80, 240)  # Slower behavior changes
-            self.patrol_distance = random.randint(30, 100)  # Smaller patrol area
+            self.behavior_interval = rng.randint(80, 240)  # Slower behavior changes
+            self.patrol_distance = rng.randint(30, 100)  # Smaller patrol area
         
         # State
         self.is_alive = True
@@ -49,27 +78,42 @@ class Enemy(pygame.sprite.Sprite):
         self.stun_timer = 0
         self.health = 1
         
-        # Particle effects
-        self.particles = []
-        self.death_particles = []
+        # Shared particle engine (set by the game)
+        self.particle_system = None
         
         # Load sprites and create rect
         self.load_sprites()
-        self.image = self.walk_sprites[0]
-        self.rect = self.image.get_rect()
+        self.manager.frame_total[self.slot] = len(self.walk_sprites)
+        
+        # Prebuild facing and stun-flash variants of every frame (shared per enemy type)
+        self.frames = ASSETS.frames(
+            ("enemy", self.enemy_type), lambda: self.walk_sprites, {"stun": (255, 255, 255, 128)})
+        self.rect = self.walk_sprites[0].get_rect()
         self.rect.x = x
         self.rect.y = y
         
         # Sound effects
         self.sounds = {}
         self.load_sounds()
+    
+    @property
+    def direction(self):
+        return "right" if self.manager.facing_right[self.slot] else "left"
+    
+    @direction.setter
+    def direction(self, direction):
+        self.manager.facing_right[self.slot] = direction == "right"
+    
+    @property
+    def image(self):
+        """Current frame, flipped to the facing and flashing while stunned"""
+        manager, slot = self.manager, self.slot
+        stun_effect = "stun" if manager.flash[slot] else None
+        return self.frames.get(int(manager.animation_index[slot]), not manager.facing_right[slot], stun_effect)
         
     def load_sounds(self):
         """Load sound effects"""
-        try:
-            self.sounds["enemy_hit"] = pygame.mixer.Sound(SOUND_EFFECTS["enemy_hit"])
-        except:
-            self.sounds = {}
+        self.sounds = load_sounds({"enemy_hit": None})
     
     def load_sprites(self):
         """Load enemy sprites based on type"""
@@ -86,19 +130,20 @@ class Enemy(pygame.sprite.Sprite):
         """Load Koopa sprites"""
         try:
             # Load Koopa sprite from assets
-            koopa_sprite = pygame.image.load("assets/images/koopas/koopa.png").convert_alpha()
-            koopa_sprite = pygame.transform.scale(koopa_sprite, (ENEMY_WIDTH, ENEMY_HEIGHT))
+            koopa_sprite = load_image(SPRITE_IMAGES["koopa"], (ENEMY_WIDTH, ENEMY_HEIGHT))
             
             # Create walk animation frames
             self.walk_sprites = [koopa_sprite]
             
-            # Create a second frame by slightly modifying the first
-            frame2 = koopa_sprite.copy()
-            # Add some visual variation
-            overlay = pygame.Surface((ENEMY_WIDTH, ENEMY_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 30))
-            frame2.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            self.walk_sprites.append(frame2)
+            # Create a second frame by slightly modifying the first (shared by all Koopas)
+            def build_frame2():
+                frame2 = koopa_sprite.copy()
+                # Add some visual variation
+                overlay = pygame.Surface((ENEMY_WIDTH, ENEMY_HEIGHT), pygame.SRCALPHA)
+                overlay.fill((255, 255, 255, 30))
+                frame2.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                return frame2
+            self.walk_sprites.append(ASSETS.surface("koopa_frame2", build_frame2))
             
         except Exception as e:
             print(f"Error loading Koopa sprites: {e}")
@@ -107,34 +152,8 @@ class Enemy(pygame.sprite.Sprite):
     def load_goomba_sprites(self):
         """Load Goomba sprites"""
         try:
-            # Create Goomba sprites (brown mushroom-like enemy)
-            self.walk_sprites = []
-            
-            # Frame 1: Normal Goomba
-            frame1 = pygame.Surface((ENEMY_WIDTH, ENEMY_HEIGHT), pygame.SRCALPHA)
-            # Body (brown circle)
-            pygame.draw.circle(frame1, BROWN, (ENEMY_WIDTH//2, ENEMY_HEIGHT//2), ENEMY_WIDTH//3)
-            # Eyes (white circles with black pupils)
-            pygame.draw.circle(frame1, WHITE, (ENEMY_WIDTH//2 - 8, ENEMY_HEIGHT//2 - 5), 4)
-            pygame.draw.circle(frame1, WHITE, (ENEMY_WIDTH//2 + 8, ENEMY_HEIGHT//2 - 5), 4)
-            pygame.draw.circle(frame1, BLACK, (ENEMY_WIDTH//2 - 8, ENEMY_HEIGHT//2 - 5), 2)
-            pygame.draw.circle(frame1, BLACK, (ENEMY_WIDTH//2 + 8, ENEMY_HEIGHT//2 - 5), 2)
-            # Angry eyebrows
-            pygame.draw.line(frame1, BLACK, (ENEMY_WIDTH//2 - 12, ENEMY_HEIGHT//2 - 8), 
-                           (ENEMY_WIDTH//2 - 4, ENEMY_HEIGHT//2 - 10), 2)
-            pygame.draw.line(frame1, BLACK, (ENEMY_WIDTH//2 + 4, ENEMY_HEIGHT//2 - 10), 
-                           (ENEMY_WIDTH//2 + 12, ENEMY_HEIGHT//2 - 8), 2)
-            self.walk_sprites.append(frame1)
-            
-            # Frame 2: Slightly different
-            frame2 = frame1.copy()
-            # Move eyebrows down slightly
-            pygame.draw.rect(frame2, (0, 0, 0, 0), (ENEMY_WIDTH//2 - 12, ENEMY_HEIGHT//2 - 10, 24, 4))
-            pygame.draw.line(frame2, BLACK, (ENEMY_WIDTH//2 - 12, ENEMY_HEIGHT//2 - 6), 
-                           (ENEMY_WIDTH//2 - 4, ENEMY_HEIGHT//2 - 8), 2)
-            pygame.draw.line(frame2, BLACK, (ENEMY_WIDTH//2 + 4, ENEMY_HEIGHT//2 - 8), 
-                           (ENEMY_WIDTH//2 + 12, ENEMY_HEIGHT//2 - 6), 2)
-            self.walk_sprites.append(frame2)
+            # Create Goomba sprites (brown mushroom-like enemy, drawn once and shared)
+            self.walk_sprites = list(ART.get("goomba", "walk", (ENEMY_WIDTH, ENEMY_HEIGHT)))
             
         except Exception as e:
             print(f"Error loading Goomba sprites: {e}")
@@ -157,172 +176,15 @@ class Enemy(pygame.sprite.Sprite):
     
     def create_death_particles(self):
         """Create death particle effects"""
-        for _ in range(12):
-            particle = {
-                'x': int(self.rect.centerx) + random.randint(-10, 10),
-                'y': int(self.rect.centery) + random.randint(-10, 10),
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-5, -2),
-                'life': random.randint(30, 60),
-                'color': RED if self.enemy_type == "koopa" else BROWN,
-                'size': random.randint(2, 4)
-            }
-            self.death_particles.append(particle)
-    
-    def update_particles(self):
-        """Update particle effects"""
-        # Update death particles
-        for particle in self.death_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.3  # Gravity
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.death_particles.remove(particle)
-    
-    def draw_particles(self, screen, camera):
-        """Draw particle effects"""
-        # Draw death particles
-        for particle in self.death_particles:
-            alpha = int(255 * (particle['life'] / 60))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), particle['size'])
+        if self.particle_system:
+            self.particle_system.emit(
+                12, self.rect.centerx, self.rect.centery, vx=(-3, 3), vy=(-5, -2),
+                life=(30, 60), color=RED if self.enemy_type == "koopa" else BROWN,
+                size=(2, 4), gravity=0.3, spread_x=10, spread_y=10)
     
     def update(self, platforms):
-        """Update enemy physics and AI"""
-        if not self.is_alive:
-            self.update_particles()
-            return
-        
-        # Update behavior timer
-        self.behavior_timer += 1
-        
-        # AI behavior
-        self.update_ai()
-        
-        # Apply gravity
-        self.velocity_y += self.gravity
-        
-        # Limit fall speed
-        if self.velocity_y > MAX_FALL_SPEED:
-            self.velocity_y = MAX_FALL_SPEED
-        
-        # Update position
-        self.rect.x += self.velocity_x
-        self.handle_horizontal_collision(platforms)
-        
-        self.rect.y += self.velocity_y
-        self.handle_vertical_collision(platforms)
-        
-        # Update animation
-        self.update_animation()
-        
-        # Update frame count
-        self.frame_count += 1
-        
-        # Update stun timer
-        if self.is_stunned:
-            self.stun_timer -= 1
-            if self.stun_timer <= 0:
-                self.is_stunned = False
-        
-        # Update jump cooldown
-        if self.jump_cooldown > 0:
-            self.jump_cooldown -= 1
-    
-    def update_ai(self):
-        """Update enemy AI behavior with varied movements"""
-        # Patrol behavior
-        if abs(self.rect.x - self.start_x) > self.patrol_distance:
-            self.direction = "left" if self.rect.x > self.start_x else "right"
-            self.velocity_x = ENEMY_SPEED if self.direction == "right" else -ENEMY_SPEED
-        
-        # Random behavior changes
-        if self.behavior_timer >= self.behavior_interval:
-            self.behavior_timer = 0
-            # Varied behavior intervals based on enemy type
-            if self.enemy_type == "koopa":
-                self.behavior_interval = random.randint(40, 120)  # Faster for Koopas
-            else:
-                self.behavior_interval = random.randint(80, 240)  # Slower for Goombas
-            
-            # Random direction change (varies by enemy type)
-            if self.enemy_type == "koopa":
-                if random.random() < 0.4:  # 40% chance for Koopas
-                    self.direction = "right" if self.direction == "left" else "left"
-                    self.velocity_x = ENEMY_SPEED if self.direction == "right" else -ENEMY_SPEED
-            else:  # Goomba
-                if random.random() < 0.2:  # 20% chance for Goombas
-                    self.direction = "right" if self.direction == "left" else "left"
-                    self.velocity_x = ENEMY_SPEED if self.direction == "right" else -ENEMY_SPEED
-            
-            # Random jump (for Koopas) - more aggressive
-            if self.enemy_type == "koopa" and self.on_ground and self.jump_cooldown <= 0:
-                if random.random() < 0.6:  # 60% chance for Koopas
-                    self.velocity_y = ENEMY_JUMP_SPEED
-                    self.on_ground = False
-                    self.is_jumping = True
-                    self.jump_cooldown = random.randint(30, 90)  # Variable cooldown
-            
-            # Random speed changes
-            if random.random() < 0.3:  # 30% chance
-                speed_multiplier = random.uniform(0.5, 1.5)
-                self.velocity_x = ENEMY_SPEED * speed_multiplier if self.direction == "right" else -ENEMY_SPEED * speed_multiplier
-            
-            # Random pause (especially for Goombas)
-            if self.enemy_type == "goomba" and random.random() < 0.2:  # 20% chance
-                self.velocity_x = 0
-                self.behavior_interval = random.randint(30, 90)  # Shorter pause
-    
-    def handle_horizontal_collision(self, platforms):
-        """Handle horizontal collisions with platforms"""
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                if self.velocity_x > 0:
-                    self.rect.right = platform.rect.left
-                    self.direction = "left"
-                    self.velocity_x = -ENEMY_SPEED
-                elif self.velocity_x < 0:
-                    self.rect.left = platform.rect.right
-                    self.direction = "right"
-                    self.velocity_x = ENEMY_SPEED
-                    
-    def handle_vertical_collision(self, platforms):
-        """Handle vertical collisions with platforms"""
-        self.on_ground = False
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                if self.velocity_y > 0:
-                    self.rect.bottom = platform.rect.top
-                    self.velocity_y = 0
-                    self.on_ground = True
-                    self.is_jumping = False
-                elif self.velocity_y < 0:
-                    self.rect.top = platform.rect.bottom
-                    self.velocity_y = 0
-    
-    def update_animation(self):
-        """Update enemy animation"""
-        self.animation_timer += self.animation_speed
-        
-        if self.animation_timer >= 1:
-            self.animation_index = (self.animation_index + 1) % len(self.walk_sprites)
-            self.animation_timer = 0
-        
-        self.image = self.walk_sprites[self.animation_index]
-        
-        # Flip sprite based on direction
-        if self.direction == "left":
-            self.image = pygame.transform.flip(self.image, True, False)
-        
-        # Apply stun effect
-        if self.is_stunned and self.frame_count % 4 < 2:
-            # Create a transparent overlay
-            overlay = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 128))
-            self.image.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        """Update enemy physics and AI (the game batches this through its EnemyManager)"""
+        self.manager.update([self], platforms)
     
     def take_damage(self):
         """Handle enemy taking damage"""
@@ -347,12 +209,71 @@ class Enemy(pygame.sprite.Sprite):
         if "enemy_hit" in self.sounds:
             self.sounds["enemy_hit"].play()
     
+    def get_state(self):
+        """Get physics, AI and health state as a list of numbers"""
+        return [self.rect.x, self.rect.y, self.velocity_x, self.velocity_y, self.direction == "right",
+                self.on_ground, self.is_jumping, self.animation_timer, self.animation_index,
+                self.frame_count, self.behavior_timer, self.behavior_interval, self.patrol_distance,
+                self.start_x, self.jump_cooldown, self.is_alive, self.is_stunned, self.stun_timer,
+                self.health]
+    
+    def set_state(self, values):
+        """Restore state from get_state(); the stun flash catches up on the next update"""
+        (x, y, self.velocity_x, self.velocity_y, facing_right, on_ground, is_jumping,
+         self.animation_timer, animation_index, frame_count, behavior_timer, behavior_interval,
+         patrol_distance, start_x, jump_cooldown, is_alive, is_stunned, stun_timer, health) = values
+        self.rect.x = x
+        self.rect.y = y
+        self.direction = "right" if facing_right else "left"
+        self.on_ground = bool(on_ground)
+        self.is_jumping = bool(is_jumping)
+        self.animation_index = int(animation_index)
+        self.frame_count = int(frame_count)
+        self.behavior_timer = int(behavior_timer)
+        self.behavior_interval = int(behavior_interval)
+        self.patrol_distance = int(patrol_distance)
+        self.start_x = int(start_x)
+        self.jump_cooldown = int(jump_cooldown)
+        self.is_alive = bool(is_alive)
+        self.is_stunned = bool(is_stunned)
+        self.stun_timer = int(stun_timer)
+        self.health = int(health)
+    
     def draw(self, screen, camera):
-        """Draw the enemy with particles"""
-        # Draw particles first
-        self.draw_particles(screen, camera)
-        
+        """Draw the enemy"""
         if self.is_alive:
             # Draw the enemy
             enemy_rect = camera.apply(self)
-            screen.blit(self.image, enemy_rect) 
\ No newline at end of file
+            screen.blit(self.image, enemy_rect)
+
+def draw_goomba(goomba_type, size):
+    """Draw the Goomba walk frames at (width, height)"""
+    width, height = size
+    # Frame 1: Normal Goomba
+    frame1 = pygame.Surface((width, height), pygame.SRCALPHA)
+    # Body (brown circle)
+    pygame.draw.circle(frame1, BROWN, (width//2, height//2), width//3)
+    # Eyes (white circles with black pupils)
+    pygame.draw.circle(frame1, WHITE, (width//2 - 8, height//2 - 5), 4)
+    pygame.draw.circle(frame1, WHITE, (width//2 + 8, height//2 - 5), 4)
+    pygame.draw.circle(frame1, BLACK, (width//2 - 8, height//2 - 5), 2)
+    pygame.draw.circle(frame1, BLACK, (width//2 + 8, height//2 - 5), 2)
+    # Angry eyebrows
+    pygame.draw.line(frame1, BLACK, (width//2 - 12, height//2 - 8), 
+                   (width//2 - 4, height//2 - 10), 2)
+    pygame.draw.line(frame1, BLACK, (width//2 + 4, height//2 - 10), 
+                   (width//2 + 12, height//2 - 8), 2)
+    frames = [frame1]
+    
+    # Frame 2: Slightly different
+    frame2 = frame1.copy()
+    # Move eyebrows down slightly
+    pygame.draw.rect(frame2, (0, 0, 0, 0), (width//2 - 12, height//2 - 10, 24, 4))
+    pygame.draw.line(frame2, BLACK, (width//2 - 12, height//2 - 6), 
+                   (width//2 - 4, height//2 - 8), 2)
+    pygame.draw.line(frame2, BLACK, (width//2 + 4, height//2 - 8), 
+                   (width//2 + 12, height//2 - 6), 2)
+    frames.append(frame2)
+    return frames
+
+ART.register("goomba", draw_goomba)
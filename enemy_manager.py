@@ -0,0 +1,246 @@
+import numpy as np
+import pygame
+from settings import *
+from rng import RNG
+
+# Seeded stream for enemy AI, shared with enemy.py so spawn and AI draws stay in one sequence
+rng = RNG.stream("enemy")
+
+# Per-enemy state kept in the manager's arrays, as (name, dtype)
+ENEMY_FIELDS = (
+    ("velocity_x", np.float64), ("velocity_y", np.float64), ("on_ground", np.bool_),
+    ("is_jumping", np.bool_), ("facing_right", np.bool_), ("is_koopa", np.bool_),
+    ("animation_timer", np.float64), ("animation_index", np.int64), ("frame_total", np.int64),
+    ("frame_count", np.int64), ("flash", np.bool_), ("behavior_timer", np.int64),
+    ("behavior_interval", np.int64), ("patrol_distance", np.int64), ("start_x", np.int64),
+    ("jump_cooldown", np.int64), ("is_alive", np.bool_), ("is_stunned", np.bool_),
+    ("stun_timer", np.int64), ("health", np.int64),
+)
+
+# Fields of Enemy.get_state() after the rect position, in order
+STATE_FIELDS = (
+    "velocity_x", "velocity_y", "facing_right", "on_ground", "is_jumping", "animation_timer",
+    "animation_index", "frame_count", "behavior_timer", "behavior_interval", "patrol_distance",
+    "start_x", "jump_cooldown", "is_alive", "is_stunned", "stun_timer", "health",
+)
+
+def round_half_away(values):
+    """Round like a pygame Rect does when given a float (halves away from zero)"""
+    whole = np.trunc(values)
+    return (whole + np.where(np.abs(values - whole) >= 0.5, np.sign(values), 0)).astype(np.int64)
+
+class EnemyManager:
+    """Every enemy's physics, AI and animation state in parallel NumPy arrays
+
+    Enemy sprites keep their rect for collisions, culling and drawing, and read
+    the rest of their state from their slot here. update() steps a whole batch
+    at once; only the rare random AI decisions run per enemy, in batch order,
+    so the seeded AI stream is consumed exactly as when enemies updated
+    themselves one by one.
+    """
+
+    def __init__(self, capacity=ENEMY_CAPACITY):
+        self.capacity = 0
+        self.free = []  # Unused slots, lowest last
+        self.allocate(capacity)
+        self.collision_system = None  # Set by the game for broadphase platform queries
+
+    def allocate(self, capacity):
+        """Create (or grow) the state arrays, keeping existing enemies"""
+        for name, dtype in ENEMY_FIELDS:
+            new = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                new[:len(old)] = old
+            setattr(self, name, new)
+        self.free = list(range(capacity - 1, self.capacity - 1, -1)) + self.free
+        self.capacity = capacity
+
+    def add(self):
+        """Reserve a zeroed slot for a new enemy"""
+        if not self.free:
+            self.allocate(self.capacity * 2)
+        slot = self.free.pop()
+        for name, _ in ENEMY_FIELDS:
+            getattr(self, name)[slot] = 0
+        return slot
+
+    def release(self, enemy):
+        """Free an enemy's slot once it has left the level for good"""
+        if enemy.slot is not None:
+            self.free.append(enemy.slot)
+            enemy.slot = None
+
+    def clear(self):
+        """Free every slot, e.g. when a level is unloaded"""
+        self.free = list(range(self.capacity - 1, -1, -1))
+
+    def get_states(self, enemies):
+        """Get the Enemy.get_state() values of a list of enemies as one float64 row each"""
+        slots = np.array([enemy.slot for enemy in enemies], dtype=np.int64)
+        states = np.empty((len(enemies), 2 + len(STATE_FIELDS)), dtype=np.float64)
+        states[:, 0] = [enemy.rect.x for enemy in enemies]
+        states[:, 1] = [enemy.rect.y for enemy in enemies]
+        for column, name in enumerate(STATE_FIELDS, 2):
+            states[:, column] = getattr(self, name)[slots]
+        return states
+
+    def set_states(self, enemies, states):
+        """Restore rows from get_states() to a list of enemies"""
+        slots = np.array([enemy.slot for enemy in enemies], dtype=np.int64)
+        for column, name in enumerate(STATE_FIELDS, 2):
+            getattr(self, name)[slots] = states[:, column]
+        for enemy, left, top in zip(enemies, states[:, 0].tolist(), states[:, 1].tolist()):
+            enemy.rect.x = left
+            enemy.rect.y = top
+
+    def update(self, enemies, platforms):
+        """Step AI, gravity, platform collisions, animation and timers for a list of enemies"""
+        slots = np.array([enemy.slot for enemy in enemies], dtype=np.int64)
+        alive = self.is_alive[slots]
+        if not alive.all():
+            enemies = [enemy for enemy, is_alive in zip(enemies, alive.tolist()) if is_alive]
+            slots = slots[alive]
+        if len(slots) == 0:
+            return
+        x = np.array([enemy.rect.x for enemy in enemies], dtype=np.int64)
+        y = np.array([enemy.rect.y for enemy in enemies], dtype=np.int64)
+
+        # Patrol: head back once too far from the spawn point
+        self.behavior_timer[slots] += 1
+        start_x = self.start_x[slots]
+        turn_back = np.abs(x - start_x) > self.patrol_distance[slots]
+        if turn_back.any():
+            turn_slots = slots[turn_back]
+            facing_right = x[turn_back] <= start_x[turn_back]
+            self.facing_right[turn_slots] = facing_right
+            self.velocity_x[turn_slots] = np.where(facing_right, ENEMY_SPEED, -ENEMY_SPEED)
+
+        # Random behaviour changes, for the few enemies whose timer ran out this step
+        due = self.behavior_timer[slots] >= self.behavior_interval[slots]
+        for slot in slots[due].tolist():
+            self.change_behavior(slot)
+
+        # Gravity
+        velocity_y = np.minimum(self.velocity_y[slots] + GRAVITY, MAX_FALL_SPEED)
+        velocity_x = self.velocity_x[slots]
+
+        # Sweep every enemy through the platforms near the whole batch
+        new_x, new_y, turned, landed, bumped = self.sweep(x, y, velocity_x, velocity_y, platforms)
+        if turned.any():
+            turn_slots = slots[turned]
+            facing_right = velocity_x[turned] <= 0
+            self.facing_right[turn_slots] = facing_right
+            self.velocity_x[turn_slots] = np.where(facing_right, ENEMY_SPEED, -ENEMY_SPEED)
+        self.velocity_y[slots] = np.where(landed | bumped, 0.0, velocity_y)
+        self.on_ground[slots] = landed
+        self.is_jumping[slots] &= ~landed
+
+        # Walk animation, and the stun flash shown on alternate pairs of frames
+        animation_timer = self.animation_timer[slots] + ANIMATION_SPEED
+        advance = animation_timer >= 1
+        self.animation_index[slots] = np.where(
+            advance, (self.animation_index[slots] + 1) % self.frame_total[slots], self.animation_index[slots])
+        self.animation_timer[slots] = np.where(advance, 0.0, animation_timer)
+        frame_count = self.frame_count[slots]
+        stunned = self.is_stunned[slots]
+        self.flash[slots] = stunned & (frame_count % 4 < 2)
+        self.frame_count[slots] = frame_count + 1
+
+        # Stun and jump timers
+        stun_timer = self.stun_timer[slots] - stunned
+        self.stun_timer[slots] = stun_timer
+        self.is_stunned[slots] = stunned & (stun_timer > 0)
+        cooldown = self.jump_cooldown[slots]
+        self.jump_cooldown[slots] = cooldown - (cooldown > 0)
+
+        for enemy, left, top in zip(enemies, new_x.tolist(), new_y.tolist()):
+            enemy.rect.x = left
+            enemy.rect.y = top
+
+    def change_behavior(self, slot):
+        """Pick a new random behaviour for one enemy"""
+        self.behavior_timer[slot] = 0
+        koopa = bool(self.is_koopa[slot])
+
+        # Varied behavior intervals based on enemy type
+        if koopa:
+            self.behavior_interval[slot] = rng.randint(40, 120)  # Faster for Koopas
+        else:
+            self.behavior_interval[slot] = rng.randint(80, 240)  # Slower for Goombas
+
+        # Random direction change (40% for Koopas, 20% for Goombas)
+        if rng.random() < (0.4 if koopa else 0.2):
+            facing_right = not self.facing_right[slot]
+            self.facing_right[slot] = facing_right
+            self.velocity_x[slot] = ENEMY_SPEED if facing_right else -ENEMY_SPEED
+
+        # Random jump (for Koopas) - more aggressive
+        if koopa and self.on_ground[slot] and self.jump_cooldown[slot] <= 0:
+            if rng.random() < 0.6:  # 60% chance for Koopas
+                self.velocity_y[slot] = ENEMY_JUMP_SPEED
+                self.on_ground[slot] = False
+                self.is_jumping[slot] = True
+                self.jump_cooldown[slot] = rng.randint(30, 90)  # Variable cooldown
+
+        # Random speed changes
+        if rng.random() < 0.3:  # 30% chance
+            speed_multiplier = rng.uniform(0.5, 1.5)
+            self.velocity_x[slot] = ENEMY_SPEED * speed_multiplier if self.facing_right[slot] else -ENEMY_SPEED * speed_multiplier
+
+        # Random pause (especially for Goombas)
+        if not koopa and rng.random() < 0.2:  # 20% chance
+            self.velocity_x[slot] = 0
+            self.behavior_interval[slot] = rng.randint(30, 90)  # Shorter pause
+
+    def sweep(self, x, y, velocity_x, velocity_y, platforms):
+        """Move a batch of enemies along x then y, stopping flush against platforms
+
+        Matches CollisionSystem.sweep_horizontal and sweep_vertical for every
+        enemy at once. Returns the new positions and masks of enemies that hit a
+        wall, landed or bumped their head.
+        """
+        width, height = ENEMY_WIDTH, ENEMY_HEIGHT
+        new_x = round_half_away(x + velocity_x)
+        new_y = round_half_away(y + velocity_y)
+        right = new_x > x
+        left_moving = new_x < x
+        falling = new_y > y
+        rising = new_y < y
+        no_hit = np.zeros(len(x), dtype=bool)
+
+        # One broadphase query around every enemy's path
+        left = int(min(x.min(), new_x.min())) - 1
+        top = int(min(y.min(), new_y.min())) - 1
+        area = pygame.Rect(left, top, int(max(x.max(), new_x.max())) + width + 1 - left,
+                           int(max(y.max(), new_y.max())) + height + 1 - top)
+        if self.collision_system:
+            platforms = self.collision_system.nearby_platforms(area, platforms)
+        rects = [platform.rect for platform in platforms]
+        if not rects:
+            return new_x, new_y, no_hit, no_hit, no_hit
+        bounds = np.array([(rect.left, rect.top, rect.right, rect.bottom) for rect in rects], dtype=np.int64)
+        p_left, p_top, p_right, p_bottom = (bounds[:, i] for i in range(4))
+
+        # Horizontal: platforms overlapping the enemy's rows and crossed by its move
+        rows = (p_top < (y + height)[:, None]) & (p_bottom > y[:, None])
+        ahead = rows & right[:, None] & (p_left >= (x + width - COLLISION_SKIN)[:, None]) & (p_left < (new_x + width)[:, None])
+        stop = np.where(ahead, p_left, np.iinfo(np.int64).max).min(axis=1)
+        hit_right = stop != np.iinfo(np.int64).max
+        new_x = np.where(hit_right, stop - width, new_x)
+        behind = rows & left_moving[:, None] & (p_right <= (x + COLLISION_SKIN)[:, None]) & (p_right > new_x[:, None])
+        stop = np.where(behind, p_right, np.iinfo(np.int64).min).max(axis=1)
+        hit_left = stop != np.iinfo(np.int64).min
+        new_x = np.where(hit_left, stop, new_x)
+
+        # Vertical, from the new column
+        columns = (p_left < (new_x + width)[:, None]) & (p_right > new_x[:, None])
+        below = columns & falling[:, None] & (p_top >= (y + height - COLLISION_SKIN)[:, None]) & (p_top < (new_y + height)[:, None])
+        stop = np.where(below, p_top, np.iinfo(np.int64).max).min(axis=1)
+        landed = stop != np.iinfo(np.int64).max
+        new_y = np.where(landed, stop - height, new_y)
+        above = columns & rising[:, None] & (p_bottom <= (y + COLLISION_SKIN)[:, None]) & (p_bottom > new_y[:, None])
+        stop = np.where(above, p_bottom, np.iinfo(np.int64).min).max(axis=1)
+        bumped = stop != np.iinfo(np.int64).min
+        new_y = np.where(bumped, stop, new_y)
+        return new_x, new_y, hit_right | hit_left, landed, bumped
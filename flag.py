@@ -2,6 +2,58 @@ import pygame
 import math
 import random
 from settings import *
+from assets import ASSETS, load_sounds
+
+# Part of the flag the waving cloth can cover, relative to its top left
+CLOTH_AREA = pygame.Rect(0, 22, 60, 56)
+
+def draw_flag(size, pole_color, base_color, gold_color):
+    """Draw the pole, top and base of a flag of (width, height); the cloth is drawn by draw_flag_cloth"""
+    width, height = size
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    
+    # Draw flag pole (vertical line)
+    pole_width = 8
+    pole_x = width - 20
+    pygame.draw.line(image, pole_color, (pole_x, 0), (pole_x, height - 30), pole_width)
+    
+    # Flag pole top decoration
+    pygame.draw.circle(image, gold_color, (pole_x, 15), 12)  # Gold circle
+    pygame.draw.circle(image, BLACK, (pole_x, 15), 12, 3)  # Border
+    
+    # Flag base/platform
+    base_width = 60
+    base_height = 30
+    base_x = pole_x - base_width // 2
+    base_y = height - base_height
+    pygame.draw.rect(image, base_color, (base_x, base_y, base_width, base_height))
+    pygame.draw.rect(image, BLACK, (base_x, base_y, base_width, base_height), 3)
+    
+    # Add small circles along the pole
+    for i in range(3):
+        y_pos = 50 + i * 40
+        pygame.draw.circle(image, gold_color, (pole_x, y_pos), 4)
+    return image
+
+def draw_flag_cloth(surface, color, wave_offset, wave_offset2):
+    """Draw the red cloth with a white border onto a surface covering CLOTH_AREA"""
+    # The cloth hangs 60x40 from the left of the pole, 30 px from the top of the flag
+    flag_x = -5 - CLOTH_AREA.x
+    flag_y = 30 - CLOTH_AREA.y
+    
+    # Draw wavy flag with multiple wave points
+    flag_points = [
+        (flag_x, flag_y),
+        (flag_x + 20, flag_y + wave_offset),
+        (flag_x + 40, flag_y + wave_offset2),
+        (flag_x + 60, flag_y + wave_offset),
+        (flag_x + 60, flag_y + 40 + wave_offset),
+        (flag_x + 40, flag_y + 40 + wave_offset2),
+        (flag_x + 20, flag_y + 40 + wave_offset),
+        (flag_x, flag_y + 40)
+    ]
+    pygame.draw.polygon(surface, color, flag_points)
+    pygame.draw.polygon(surface, WHITE, flag_points, 2)
 
 class Flag(pygame.sprite.Sprite):
     def __init__(self, x, y):
@@ -20,18 +72,21 @@ class Flag(pygame.sprite.Sprite):
         self.base_color = (101, 67, 33)  # Darker brown
         self.gold_color = (255, 215, 0)
         
-        # Particle effects
-        self.particles = []
-        self.sparkle_particles = []
+        # Shared particle engine (set by the game)
+        self.particle_system = None
+        self.sparkle_timer = 0
         
         # State
         self.is_reached = False
         self.reach_timer = 0
         self.celebration_mode = False
         
-        # Create Mario-style flag
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.create_flag_design()
+        # Create Mario-style flag (shared by every flag); the cloth is drawn as it waves
+        self.image = ASSETS.surface(
+            ("flag", (self.width, self.height), self.pole_color, self.base_color, self.gold_color),
+            lambda: draw_flag((self.width, self.height), self.pole_color, self.base_color, self.gold_color))
+        self.cloth = pygame.Surface(CLOTH_AREA.size, pygame.SRCALPHA)  # Scratch surface for the waving cloth
+        self.frame = None  # Scratch surface for the whole flag while it glows
         
         # Sound effects
         self.sounds = {}
@@ -39,157 +94,24 @@ class Flag(pygame.sprite.Sprite):
         
     def load_sounds(self):
         """Load sound effects"""
-        try:
-            self.sounds["level_complete"] = pygame.mixer.Sound(SOUND_EFFECTS["level_complete"])
-        except:
-            self.sounds = {}
-        
-    def create_flag_design(self):
-        """Create the flag design"""
-        # Clear the surface
-        self.image.fill((0, 0, 0, 0))
-        
-        # Draw flag pole (vertical line)
-        pole_width = 8
-        pole_x = self.width - 20
-        pygame.draw.line(self.image, self.pole_color, 
-                        (pole_x, 0), (pole_x, self.height - 30), pole_width)
-        
-        # Draw flag (red rectangle with white border)
-        flag_width = 60
-        flag_height = 40
-        flag_x = pole_x - flag_width - 5
-        flag_y = 30
-        
-        # Flag background
-        pygame.draw.rect(self.image, self.flag_color, 
-                        (flag_x, flag_y, flag_width, flag_height))
-        
-        # Flag border
-        pygame.draw.rect(self.image, WHITE, 
-                        (flag_x, flag_y, flag_width, flag_height), 3)
-        
-        # Flag pole top decoration
-        pygame.draw.circle(self.image, self.gold_color, (pole_x, 15), 12)  # Gold circle
-        pygame.draw.circle(self.image, BLACK, (pole_x, 15), 12, 3)  # Border
-        
-        # Flag base/platform
-        base_width = 60
-        base_height = 30
-        base_x = pole_x - base_width // 2
-        base_y = self.height - base_height
-        
-        pygame.draw.rect(self.image, self.base_color, 
-                        (base_x, base_y, base_width, base_height))
-        pygame.draw.rect(self.image, BLACK, 
-                        (base_x, base_y, base_width, base_height), 3)
-        
-        # Add some decorative elements
-        self.add_decorative_elements()
-        
-    def add_decorative_elements(self):
-        """Add decorative elements to the flag"""
-        pole_x = self.width - 20
-        
-        # Add small circles along the pole
-        for i in range(3):
-            y_pos = 50 + i * 40
-            pygame.draw.circle(self.image, self.gold_color, (pole_x, y_pos), 4)
-        
-        # Add a small star on the flag
-        flag_x = pole_x - 65
-        flag_y = 35
-        self.draw_star(self.image, (flag_x + 30, flag_y + 20), 8, WHITE)
-        
-        # Add some sparkles around the flag
-        self.create_sparkle_particles()
+        self.sounds = load_sounds({"level_complete": None})
         
     def create_sparkle_particles(self):
-        """Create sparkle particles around the flag"""
-        pole_x = self.width - 20
-        flag_x = pole_x - 65
-        flag_y = 35
-        
-        for _ in range(6):
-            particle = {
-                'x': int(flag_x) + random.randint(0, 60),
-                'y': int(flag_y) + random.randint(0, 40),
-                'vx': random.uniform(-0.5, 0.5),
-                'vy': random.uniform(-0.5, 0.5),
-                'life': random.randint(60, 120),
-                'max_life': random.randint(60, 120),
-                'color': self.gold_color,
-                'size': random.randint(2, 4)
-            }
-            self.sparkle_particles.append(particle)
+        """Create a sparkle particle around the flag"""
+        if self.particle_system:
+            self.particle_system.emit(
+                1, self.rect.x + self.width // 2, self.rect.y + self.height // 2,
+                vx=(-0.5, 0.5), vy=(-0.5, 0.5), life=(60, 120), color=self.gold_color,
+                size=(2, 4), spread_x=self.width // 2, spread_y=self.height // 2)
     
     def create_celebration_particles(self):
         """Create celebration particles when flag is reached"""
-        for _ in range(20):
-            particle = {
-                'x': int(self.rect.centerx) + random.randint(-30, 30),
-                'y': int(self.rect.centery) + random.randint(-50, 50),
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-5, -1),
-                'life': random.randint(40, 80),
-                'color': random.choice([RED, self.gold_color, WHITE, GREEN]),
-                'size': random.randint(3, 6)
-            }
-            self.particles.append(particle)
-    
-    def update_particles(self):
-        """Update particle effects"""
-        # Update sparkle particles
-        for particle in self.sparkle_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                # Reset particle
-                particle['life'] = particle['max_life']
-                particle['x'] = int(self.rect.x) + random.randint(0, self.width)
-                particle['y'] = int(self.rect.y) + random.randint(0, self.height)
-        
-        # Update celebration particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.2  # Gravity
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        if self.particle_system:
+            self.particle_system.emit(
+                20, self.rect.centerx, self.rect.centery, vx=(-3, 3), vy=(-5, -1),
+                life=(40, 80), color=[RED, self.gold_color, WHITE, GREEN],
+                size=(3, 6), gravity=0.2, spread_x=30, spread_y=50)
     
-    def draw_particles(self, screen, camera):
-        """Draw particle effects"""
-        # Draw sparkle particles
-        for particle in self.sparkle_particles:
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), particle['size'])
-        
-        # Draw celebration particles
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / 80))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), particle['size'])
-        
-    def draw_star(self, surface, center, size, color):
-        """Draw a simple star shape"""
-        points = []
-        for i in range(10):
-            angle = i * math.pi / 5
-            radius = size if i % 2 == 0 else size // 2
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            points.append((x, y))
-        
-        if len(points) >= 3:
-            pygame.draw.polygon(surface, color, points)
-        
     def update(self):
         """Update flag animation"""
         # Animate flag waving
@@ -203,55 +125,35 @@ class Flag(pygame.sprite.Sprite):
             if self.reach_timer % 10 == 0:  # Create particles every 10 frames
                 self.create_celebration_particles()
         
-        # Update particles
-        self.update_particles()
+        # Keep a few sparkles around the flag (about six alive at a time)
+        self.sparkle_timer += 1
+        if self.sparkle_timer >= 15:
+            self.sparkle_timer = 0
+            self.create_sparkle_particles()
         
     def draw(self, screen, camera):
-        """Draw the flag with wave animation and particles"""
-        # Draw particles first
-        self.draw_particles(screen, camera)
-        
-        # Create a copy of the image for animation
-        animated_image = self.image.copy()
-        
-        # Add wave effect to the flag
-        pole_x = self.width - 20
-        flag_x = pole_x - 65
-        flag_y = 30
-        
-        # Redraw flag with enhanced wave effect
+        """Draw the flag with wave animation"""
+        # Redraw the waving cloth on its scratch surface
         wave_offset = int(4 * math.sin(self.flag_wave_offset))
         wave_offset2 = int(2 * math.sin(self.flag_wave_offset * 2))
+        self.cloth.fill((0, 0, 0, 0))
+        draw_flag_cloth(self.cloth, self.flag_color, wave_offset, wave_offset2)
         
-        # Clear the flag area
-        pygame.draw.rect(animated_image, (0, 0, 0, 0), 
-                        (flag_x, flag_y, 60, 40))
-        
-        # Draw wavy flag with multiple wave points
-        flag_points = [
-            (flag_x, flag_y),
-            (flag_x + 20, flag_y + wave_offset),
-            (flag_x + 40, flag_y + wave_offset2),
-            (flag_x + 60, flag_y + wave_offset),
-            (flag_x + 60, flag_y + 40 + wave_offset),
-            (flag_x + 40, flag_y + 40 + wave_offset2),
-            (flag_x + 20, flag_y + 40 + wave_offset),
-            (flag_x, flag_y + 40)
-        ]
-        
-        pygame.draw.polygon(animated_image, self.flag_color, flag_points)
-        pygame.draw.polygon(animated_image, WHITE, flag_points, 2)
-        
-        # Add celebration glow effect
-        if self.celebration_mode:
-            glow_surface = pygame.Surface(animated_image.get_size(), pygame.SRCALPHA)
-            glow_intensity = int(50 + 30 * math.sin(self.reach_timer * 0.1))
-            glow_surface.fill((255, 255, 255, glow_intensity))
-            animated_image.blit(glow_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-        
-        # Apply camera transformation and draw
         flag_rect = camera.apply(self)
-        screen.blit(animated_image, flag_rect)
+        if not self.celebration_mode:
+            screen.blit(self.image, flag_rect)
+            screen.blit(self.cloth, flag_rect.move(CLOTH_AREA.topleft))
+            return
+        
+        # Add celebration glow effect over the whole flag, composed on a reused surface
+        if self.frame is None:
+            self.frame = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.frame.fill((0, 0, 0, 0))
+        self.frame.blit(self.image, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)  # An exact copy onto the clear frame
+        self.frame.blit(self.cloth, CLOTH_AREA)
+        glow_intensity = int(50 + 30 * math.sin(self.reach_timer * 0.1))
+        self.frame.fill((255, 255, 255, glow_intensity), special_flags=pygame.BLEND_RGBA_ADD)
+        screen.blit(self.frame, flag_rect)
         
     def check_collision(self, player):
         """Check if player collides with the flag"""
@@ -274,4 +176,16 @@ class Flag(pygame.sprite.Sprite):
         self.is_reached = False
         self.celebration_mode = False
         self.reach_timer = 0
-        self.particles.clear() 
\ No newline at end of file
+    
+    def get_state(self):
+        """Get animation and celebration state as a list of numbers"""
+        return [self.flag_wave_offset, self.sparkle_timer, self.is_reached, self.reach_timer,
+                self.celebration_mode]
+    
+    def set_state(self, values):
+        """Restore state from get_state()"""
+        self.flag_wave_offset, sparkle_timer, is_reached, reach_timer, celebration_mode = values
+        self.sparkle_timer = int(sparkle_timer)
+        self.is_reached = bool(is_reached)
+        self.reach_timer = int(reach_timer)
+        self.celebration_mode = bool(celebration_mode)
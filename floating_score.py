@@ -0,0 +1,12 @@
+class FloatingScore:
+    """Score text rising from a hit block, recycled through a Pool"""
+    __slots__ = ("text", "x", "y", "timer")
+
+    def __init__(self, text="", x=0, y=0, timer=0):
+        self.reset(text, x, y, timer)
+
+    def reset(self, text, x, y, timer):
+        self.text = text
+        self.x = x
+        self.y = y
+        self.timer = timer
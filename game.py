@@ -1,8 +1,11 @@
 import pygame
 import pygame.mixer
+import numpy as np
 from settings import *
+from assets import ASSETS, set_headless, load_image, load_sounds
 from player import Player
 from enemy import Enemy
+from enemy_manager import EnemyManager
 from game_platform import Ground, Platform
 from coin import Coin
 from jumping_block import JumpingBlock
@@ -11,25 +14,61 @@ from pipe import Pipe
 from flag import Flag
 from powerup import PowerUp
 from collision_system import CollisionSystem
+from static_layer import StaticLayer
+from spatial_hash import SpatialHash
+from particles import ParticleSystem
+from pool import Pool
+from floating_score import FloatingScore
+from text_cache import TEXT_CACHE
+from perf_overlay import PerfOverlay
+from rng import RNG
+from level_loader import LEVELS
+from level_streamer import LevelStreamer
 
 class MarioGame:
-    def __init__(self):
-        # Initialize screen
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Super Mario Enhanced Game")
+    def __init__(self, headless=False, seed=None):
+        # Headless mode simulates without a window, surface conversion or audio
+        self.headless = headless
+        set_headless(headless)
+        
+        # A fixed seed makes enemy AI, camera shake and particles reproducible
+        if seed is not None:
+            RNG.seed(seed)
+        
+        # Initialize screen (an off-screen surface when headless)
+        if headless:
+            pygame.font.init()
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Super Mario Enhanced Game")
         
         # Game state
         self.game_state = MENU
         self.current_level = 0
+        self.background_color = BLUE  # Loaded level's sky, which may not come from LEVELS
         self.score = 0
         self.lives = 3
         
-        # Floating score text for visual feedback
-        self.floating_scores = []  # List of (text, x, y, timer) tuples
+        # Floating score text for visual feedback, recycled so hits don't allocate
+        self.floating_scores = []  # Live FloatingScore records
+        self.score_pool = Pool(FloatingScore, FLOATING_SCORE_POOL_SIZE)
+        self.score_pool.prewarm(FLOATING_SCORE_POOL_SIZE)
+        
+        # Power-ups released from blocks are recycled rather than built mid-game, one pool per
+        # type so a recycled power-up never has to swap its art
+        self.powerup_pools = {powerup_type: Pool(PowerUp, POWERUP_POOL_SIZE) for powerup_type in POWERUP_TYPES}
         
         # Initialize collision system
         self.collision_system = CollisionSystem()
         
+        # Shared particle engine that every entity emits into
+        self.particle_system = ParticleSystem()
+        
+        # Enemy state lives in shared arrays so the whole batch steps at once
+        self.enemy_manager = EnemyManager()
+        self.enemy_manager.collision_system = self.collision_system
+        
         # Initialize sprites
         self.all_sprites = pygame.sprite.Group()
         self.platforms = pygame.sprite.Group()
@@ -43,16 +82,45 @@ class MarioGame:
         # Initialize player
         self.player = Player(100, 300)
         self.player.collision_system = self.collision_system  # Connect collision system
+        self.player.particle_system = self.particle_system
+        if headless:
+            self.player.controls = (False, False, False)  # No keyboard without a window
         self.all_sprites.add(self.player)
         
-        # Initialize ground
-        self.ground = Ground()
-        self.platforms.add(self.ground)
-        self.all_sprites.add(self.ground)
-        
         # Initialize camera
         self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
         
+        # Blits issued by the last draw_game(), shown by the performance overlay
+        self.draw_stats = {"static": 0, "sprites": 0, "particles": 0}
+        
+        # Static screens are composed once into frame_cache and only redrawn when frame_key changes
+        self.frame_cache = self.screen.copy()
+        self.frame_key = None
+        self.overlay_rect = None  # Screen area the performance overlay covered last frame
+        
+        # Dimming layer shared by the menu, pause and end screens
+        self.dim_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.dim_overlay.set_alpha(UI_BACKGROUND_ALPHA)
+        self.dim_overlay.fill(BLACK)
+        
+        # Pre-rendered platforms, pipes and ground
+        self.static_layer = StaticLayer()
+        
+        # Moving or animated sprites, drawn individually in this order after the static layer
+        self.draw_groups = (self.flags, self.coins, self.jumping_blocks, self.powerups, self.enemies)
+        
+        # Grids of those sprites per group, for culling drawing and updates to the view
+        self.entity_indexes = {group: SpatialHash(ENTITY_INDEX_CELL_SIZE, ENTITY_INDEX_CELL_HEIGHT) for group in self.draw_groups}
+        
+        # Every sprite each group has held since the level loaded, dead or alive, for snapshots.
+        # Power-ups stay listed until the level ends (or, when streaming, until they leave play)
+        # and then go back to the pool
+        self.level_sprites = {group: [] for group in self.draw_groups}
+        self.level_serial = 0  # Incremented per level load so snapshots know which objects they describe
+        
+        # Spawns sectors of very long levels around the view (None while the level is loaded whole)
+        self.streamer = None
+        
         # Load sounds
         self.load_sounds()
         
@@ -60,44 +128,40 @@ class MarioGame:
         self.load_background()
         
         # Initialize font
-        self.font = pygame.font.Font(None, UI_FONT_SIZE)
-        self.small_font = pygame.font.Font(None, UI_SMALL_FONT_SIZE)
+        self.font = TEXT_CACHE.font(UI_FONT_SIZE)
+        self.small_font = TEXT_CACHE.font(UI_SMALL_FONT_SIZE)
         
         # Level completion tracking
         self.level_complete_timer = 0
         self.level_complete_duration = 120  # 2 seconds at 60 FPS
         
+        # Frame-time graph and subsystem timings, toggled with F7
+        self.perf_overlay = PerfOverlay(self)
+        
     def load_sounds(self):
-        try:
-            self.jump_sound = pygame.mixer.Sound(SOUND_EFFECTS["jump"])
-            self.jump_sound.set_volume(0.7)  # Jump sound volume
-            self.coin_sound = pygame.mixer.Sound(SOUND_EFFECTS["coin"])
-            self.coin_sound.set_volume(0.6)  # Coin sound volume
-            self.powerup_sound = pygame.mixer.Sound(SOUND_EFFECTS["powerup"])
-            self.powerup_sound.set_volume(0.6)  # Powerup sound volume
-            self.enemy_hit_sound = pygame.mixer.Sound(SOUND_EFFECTS["enemy_hit"])
-            self.enemy_hit_sound.set_volume(0.5)  # Enemy hit sound volume
-            self.block_hit_sound = pygame.mixer.Sound(SOUND_EFFECTS["block_hit"])
-            self.block_hit_sound.set_volume(0.5)  # Block hit sound volume
-            self.level_complete_sound = pygame.mixer.Sound(SOUND_EFFECTS["level_complete"])
-            self.level_complete_sound.set_volume(0.8)  # Level complete sound volume
-            self.game_over_sound = pygame.mixer.Sound(SOUND_EFFECTS["game_over"])
-            self.game_over_sound.set_volume(0.6)  # Game over sound volume
-            self.main_theme = pygame.mixer.Sound(SOUND_EFFECTS["main_theme"])
-            self.main_theme.set_volume(0.5)  # Main theme volume
-        except:
-            self.jump_sound = None
-            self.coin_sound = None
-            self.powerup_sound = None
-            self.enemy_hit_sound = None
-            self.block_hit_sound = None
-            self.level_complete_sound = None
-            self.game_over_sound = None
-            self.main_theme = None
+        # Missing sounds (or headless mode) leave the attribute as None
+        sounds = load_sounds({
+            "jump": 0.7,  # Jump sound volume
+            "coin": 0.6,  # Coin sound volume
+            "powerup": 0.6,  # Powerup sound volume
+            "enemy_hit": 0.5,  # Enemy hit sound volume
+            "block_hit": 0.5,  # Block hit sound volume
+            "level_complete": 0.8,  # Level complete sound volume
+            "game_over": 0.6,  # Game over sound volume
+            "main_theme": 0.5,  # Main theme volume
+        })
+        self.jump_sound = sounds.get("jump")
+        self.coin_sound = sounds.get("coin")
+        self.powerup_sound = sounds.get("powerup")
+        self.enemy_hit_sound = sounds.get("enemy_hit")
+        self.block_hit_sound = sounds.get("block_hit")
+        self.level_complete_sound = sounds.get("level_complete")
+        self.game_over_sound = sounds.get("game_over")
+        self.main_theme = sounds.get("main_theme")
             
     def load_background(self):
         try:
-            self.background = pygame.image.load("assets/images/mario/cloud.png").convert_alpha()
+            self.background = load_image(SPRITE_IMAGES["cloud"])
             # Make the background much smaller like original Mario
             bg_rect = self.background.get_rect()
             scale = min(SCREEN_WIDTH / bg_rect.width, SCREEN_HEIGHT / bg_rect.height) * 0.1  # Much smaller scale
@@ -109,8 +173,14 @@ class MarioGame:
             print(f"Error loading background: {e}")
             self.background = None
             
+    def set_controls(self, left=False, right=False, jump=False):
+        """Drive the player from code instead of the keyboard"""
+        self.player.controls = (left, right, jump)
+        
     def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
+        if event.type == pygame.WINDOWEXPOSED:
+            self.frame_key = None  # The window lost its contents; compose the next frame in full
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and self.game_state == MENU:
                 self.start_game()
             elif event.key == pygame.K_r and self.game_state == GAME_OVER:
@@ -122,6 +192,8 @@ class MarioGame:
             elif event.key == pygame.K_F1:  # Debug key
                 self.collision_system.toggle_debug_mode()
                 self.camera.debug_mode = not self.camera.debug_mode
+            elif event.key == pygame.K_F7:  # Performance overlay
+                self.perf_overlay.toggle()
             elif event.key == pygame.K_F2:  # Camera mode toggle
                 if self.camera.current_mode == self.camera.CAMERA_LERP:
                     self.camera.set_camera_mode(self.camera.CAMERA_FOLLOW)
@@ -145,9 +217,9 @@ class MarioGame:
                 self.camera.set_zoom(1.0, instant=True)
                 print("Zoom reset to 1.0")
                 
-    def start_game(self):
+    def start_game(self, level=0):
         self.game_state = PLAYING
-        self.current_level = 0
+        self.current_level = level
         self.score = 0
         self.lives = 3
         self.load_level(self.current_level)
@@ -166,114 +238,164 @@ class MarioGame:
         self.stop_music()
         self.clear_level()
         
-    def load_level(self, level_index):
-        if level_index >= len(LEVELS):
-            self.game_state = GAME_WIN
-            return
-            
-        level_data = LEVELS[level_index]
+    def load_level(self, level_index, level_data=None):
+        # level_data overrides LEVELS[level_index], e.g. for generated or benchmark levels;
+        # like the packed levels it must be validated (level_loader.validate_level) already
+        if level_data is None:
+            if level_index >= len(LEVELS):
+                self.game_state = GAME_WIN
+                return
+                
+            level_data = LEVELS[level_index]
         
         # Clear existing level objects
         self.clear_level()
         
-        # Set camera level dimensions
-        self.camera.set_level_dimensions(level_data.get('level_width', 2000))
+        # Swap the previous level's assets for this level's
+        ASSETS.release(ASSETS.LEVEL_SCOPE)
+        ASSETS.begin_scope(ASSETS.LEVEL_SCOPE)
+        ASSETS.preload_level(level_data)
+        
+        # Build the power-ups this level can release up front, so blocks never construct one mid-game
+        for powerup_type, pool in self.powerup_pools.items():
+            needed = sum(1 for block in level_data['jumping_blocks'] if block[3] == powerup_type)
+            needed += sum(1 for powerup in level_data['powerups'] if powerup[2] == powerup_type)
+            pool.prewarm(needed, 0, 0, powerup_type)
+        
+        # Set camera level dimensions and sky
+        self.camera.set_level_dimensions(level_data['level_width'])
+        self.background_color = level_data['background_color']
+        
+        # Very long levels are streamed in sectors around the view instead of loaded whole
+        if level_data['level_width'] >= STREAM_MIN_LEVEL_WIDTH:
+            self.collision_system.build_static_index([], [], [])
+            self.streamer = LevelStreamer(self, level_data)
+            self.streamer.update(0, SCREEN_WIDTH)
+            self.level_serial += 1
+            self.player.reset(100, 300)
+            return
+        
+        # Cover the level with ground segments, from a screen left of the start
+        ground_right = max(level_data['level_width'] + SCREEN_WIDTH, SCREEN_WIDTH * 3)
+        for x in range(-SCREEN_WIDTH, ground_right, GROUND_SEGMENT_WIDTH):
+            ground = Ground(x)
+            self.platforms.add(ground)
+            self.all_sprites.add(ground)
         
         # Load platforms (tuple format: x, y, width, height)
-        for platform_data in level_data.get('platforms', []):
-            if len(platform_data) == 4:  # Tuple format
-                x, y, width, height = platform_data
-                platform = Platform(x, y, width, height)
-                self.platforms.add(platform)
-                self.all_sprites.add(platform)
+        for x, y, width, height in level_data['platforms']:
+            platform = Platform(x, y, width, height)
+            self.platforms.add(platform)
+            self.all_sprites.add(platform)
         
         # Load enemies (tuple format: x, y, direction, enemy_type)
-        for enemy_data in level_data.get('enemies', []):
-            if len(enemy_data) == 4:  # Tuple format with enemy type
-                x, y, direction, enemy_type = enemy_data
-            elif len(enemy_data) == 3:  # Tuple format without enemy type
-                x, y, direction = enemy_data
-                enemy_type = "goomba"
-            elif len(enemy_data) == 2:  # Tuple format without direction
-                x, y = enemy_data
-                direction = "left"
-                enemy_type = "goomba"
-            else:
-                continue
-                
-            enemy = Enemy(x, y, direction, enemy_type)
-            enemy.collision_system = self.collision_system  # Connect collision system
-            self.enemies.add(enemy)
-            self.all_sprites.add(enemy)
+        for enemy_data in level_data['enemies']:
+            self.spawn_level_entity("enemies", enemy_data)
         
         # Load coins (tuple format: x, y)
-        for coin_data in level_data.get('coins', []):
-            if len(coin_data) == 2:  # Tuple format
-                x, y = coin_data
-                coin = Coin(x, y)
-                self.coins.add(coin)
-                self.all_sprites.add(coin)
+        for coin_data in level_data['coins']:
+            self.spawn_level_entity("coins", coin_data)
         
         # Load jumping blocks (tuple format: x, y, block_type, content_type)
-        for block_data in level_data.get('jumping_blocks', []):
-            if len(block_data) == 4:  # Tuple format with content type
-                x, y, block_type, content_type = block_data
-                block = JumpingBlock(x, y, block_type, content_type)
-            elif len(block_data) == 3:  # Tuple format without content type
-                x, y, block_type = block_data
-                block = JumpingBlock(x, y, block_type)
-            elif len(block_data) == 2:  # Tuple format without block type
-                x, y = block_data
-                block = JumpingBlock(x, y)
-            else:
-                continue
-                
-            block.reset_points()  # Reset points for new level
-            self.jumping_blocks.add(block)
-            self.all_sprites.add(block)
+        for block_data in level_data['jumping_blocks']:
+            self.spawn_level_entity("jumping_blocks", block_data)
         
         # Load pipes (tuple format: x, y, height, pipe_type)
-        for pipe_data in level_data.get('pipes', []):
-            if len(pipe_data) == 4:  # Tuple format with pipe type
-                x, y, height, pipe_type = pipe_data
-                pipe = Pipe(x, y, height, pipe_type)
-            elif len(pipe_data) == 3:  # Tuple format without pipe type
-                x, y, height = pipe_data
-                pipe = Pipe(x, y, height)
-            elif len(pipe_data) == 2:  # Tuple format without height
-                x, y = pipe_data
-                pipe = Pipe(x, y)
-            else:
-                continue
-                
+        for x, y, height, pipe_type in level_data['pipes']:
+            pipe = Pipe(x, y, height, pipe_type)
             self.pipes.add(pipe)
             self.all_sprites.add(pipe)
         
         # Load power-ups (tuple format: x, y, powerup_type)
-        for powerup_data in level_data.get('powerups', []):
-            if len(powerup_data) == 3:  # Tuple format
-                x, y, powerup_type = powerup_data
-                powerup = PowerUp(x, y, powerup_type)
-                self.powerups.add(powerup)
-                self.all_sprites.add(powerup)
+        for powerup_data in level_data['powerups']:
+            self.spawn_level_entity("powerups", powerup_data)
         
         # Load flag (tuple format: x, y)
-        if 'flag_position' in level_data:
-            flag_data = level_data['flag_position']
-            if len(flag_data) == 2:  # Tuple format
-                x, y = flag_data
-                flag = Flag(x, y)
-                self.flags.add(flag)
-                self.all_sprites.add(flag)
+        if level_data['flag_position']:
+            self.spawn_level_entity("flag_position", level_data['flag_position'])
+        
+        # Index static geometry for broadphase collision queries
+        self.collision_system.build_static_index(self.platforms, self.jumping_blocks, self.pipes)
+        
+        # Bake static geometry into chunks so drawing doesn't scale with platform count
+        self.static_layer.build(list(self.platforms) + list(self.pipes))
+        
+        # Index moving sprites so only those near the view are updated and drawn
+        for group, index in self.entity_indexes.items():
+            for sprite in group:
+                self.index_entity(index, sprite)
+            self.level_sprites[group] = list(group)
+        self.level_serial += 1
         
         # Reset player to beginning of level
         self.player.reset(100, 300)
             
+    def spawn_level_entity(self, kind, entry):
+        """Create an enemy, coin, jumping block, power-up or flag from its level entry"""
+        if kind == "enemies":
+            x, y, direction, enemy_type = entry
+            sprite = Enemy(x, y, direction, enemy_type, self.enemy_manager)
+            group = self.enemies
+        elif kind == "coins":
+            x, y = entry
+            sprite = Coin(x, y)
+            group = self.coins
+        elif kind == "jumping_blocks":
+            x, y, block_type, content_type = entry
+            sprite = JumpingBlock(x, y, block_type, content_type)
+            sprite.reset_points()  # Reset points for new level
+            group = self.jumping_blocks
+        elif kind == "powerups":
+            x, y, powerup_type = entry
+            sprite = self.acquire_powerup(x, y, powerup_type)
+            self.level_sprites[self.powerups].append(sprite)
+            group = self.powerups
+        else:
+            x, y = entry
+            sprite = Flag(x, y)
+            group = self.flags
+        
+        if kind != "coins":
+            sprite.particle_system = self.particle_system
+        group.add(sprite)
+        self.all_sprites.add(sprite)
+        return sprite
+            
     def clear_level(self):
-        # Remove all sprites except player and ground
+        # Stop streaming before the sprites it spawned go away
+        if self.streamer:
+            self.streamer.close()
+            self.streamer = None
+        
+        # Remove all sprites except the player
         for sprite in list(self.all_sprites):
-            if sprite != self.player and sprite != self.ground:
+            if sprite != self.player:
                 sprite.kill()
+        self.collision_system.clear_static_index()
+        self.static_layer.clear()
+        self.particle_system.clear()
+        self.enemy_manager.clear()
+        for index in self.entity_indexes.values():
+            index.clear()
+        for powerup in self.level_sprites[self.powerups]:
+            self.release_powerup(powerup)
+        for sprites in self.level_sprites.values():
+            sprites.clear()
+    
+    def index_entity(self, index, sprite):
+        """Add a sprite to a culling grid, allowing for its bobbing animation"""
+        index.insert(sprite, sprite.rect.inflate(0, BLOCK_BOB_MARGIN * 2))
+    
+    def entities_in(self, group, rect):
+        """Get the live sprites of a group near rect, dropping dead ones from its grid"""
+        index = self.entity_indexes[group]
+        sprites = []
+        for sprite in index.query(rect):
+            if sprite.alive():
+                sprites.append(sprite)
+            else:
+                index.remove(sprite)
+        return sprites
                 
     def next_level(self):
         self.current_level += 1
@@ -284,90 +406,247 @@ class MarioGame:
             self.game_state = GAME_WIN
             self.stop_music()
             
+    def acquire_powerup(self, x, y, powerup_type):
+        """Get a power-up of a type from its pool"""
+        return self.powerup_pools[powerup_type].acquire(x, y, powerup_type)
+    
+    def release_powerup(self, powerup):
+        """Hand a power-up that has left play back to the pool for its type"""
+        self.powerup_pools[powerup.powerup_type].release(powerup)
+    
+    def spawn_powerup(self, x, y, powerup_type):
+        """Create a power-up during play and register it for updates, culling and snapshots"""
+        powerup = self.acquire_powerup(x, y, powerup_type)
+        powerup.particle_system = self.particle_system
+        self.powerups.add(powerup)
+        self.all_sprites.add(powerup)
+        self.index_entity(self.entity_indexes[self.powerups], powerup)
+        self.level_sprites[self.powerups].append(powerup)
+        return powerup
+    
+    def add_floating_score(self, text, x, y, timer=60):
+        """Show score text rising from a point"""
+        self.floating_scores.append(self.score_pool.acquire(text, x, y, timer))
+    
+    def clear_floating_scores(self):
+        """Remove every floating score"""
+        for score in self.floating_scores:
+            self.score_pool.release(score)
+        self.floating_scores.clear()
+    
+    def snapshot(self):
+        """Capture the simulation state as a float64 vector, without any Surfaces or sounds"""
+        if self.streamer:
+            raise RuntimeError("Snapshots of streamed levels are not supported")
+        values = [SNAPSHOT_VERSION, self.level_serial, self.current_level, GAME_STATES.index(self.game_state),
+                  self.score, self.lives, self.level_complete_timer]
+        for state in (self.player.get_state(), self.camera.get_state()):
+            values.append(len(state))
+            values += state
+        parts = [np.array(values, dtype=np.float64)]
+        
+        # Each group is stored as its sprite count, values per sprite, then (alive, state...) per sprite
+        for group in self.draw_groups:
+            sprites = self.level_sprites[group]
+            if not sprites:
+                parts.append(np.zeros(2))
+                continue
+            if group is self.enemies:
+                states = self.enemy_manager.get_states(sprites)  # Read straight from the shared arrays
+            else:
+                states = np.array([sprite.get_state() for sprite in sprites], dtype=np.float64)
+            alive = np.array([sprite.alive() for sprite in sprites], dtype=np.float64)
+            parts.append(np.array((len(sprites), states.shape[1]), dtype=np.float64))
+            parts.append(np.column_stack((alive, states)).ravel())
+        
+        parts.append(RNG.get_state(SNAPSHOT_STREAMS))
+        return np.concatenate(parts)
+    
+    def restore(self, snapshot):
+        """Restore a state captured by snapshot()
+        
+        Objects of the current level are reused. A snapshot from another level load
+        reloads that level first, which is much slower. Particles and floating
+        scores are purely visual and are cleared.
+        """
+        values = snapshot[:7].tolist()
+        if int(values[0]) != SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot version {int(values[0])} does not match {SNAPSHOT_VERSION}")
+        
+        level_serial = int(values[1])
+        level = int(values[2])
+        if level_serial != self.level_serial or level != self.current_level:
+            self.load_level(level)
+            self.level_serial = level_serial
+        self.current_level = level
+        self.game_state = GAME_STATES[int(values[3])]
+        self.score = int(values[4])
+        self.lives = int(values[5])
+        self.level_complete_timer = int(values[6])
+        
+        i = 7
+        for target in (self.player, self.camera):
+            size = int(snapshot[i])
+            target.set_state(snapshot[i + 1:i + 1 + size].tolist())
+            i += 1 + size
+        
+        for group in self.draw_groups:
+            count = int(snapshot[i])
+            stride = int(snapshot[i + 1])
+            i += 2
+            rows = snapshot[i:i + count * (stride + 1)].reshape(count, stride + 1)
+            i += count * (stride + 1)
+            sprites = self.level_sprites[group]
+            
+            # Drop power-ups spawned after the snapshot and recreate ones spawned before a reload
+            while len(sprites) > count:
+                powerup = sprites.pop()
+                powerup.kill()
+                self.release_powerup(powerup)
+            while len(sprites) < count:
+                state = rows[len(sprites), 1:].tolist()
+                self.spawn_powerup(state[1], state[2], list(POWERUP_TYPES)[int(state[0])])
+            
+            alive = (rows[:, 0] != 0).tolist()
+            if group is self.enemies:
+                if count:
+                    self.enemy_manager.set_states(sprites, rows[:, 1:])  # Written straight into the shared arrays
+            else:
+                for sprite, state in zip(sprites, rows[:, 1:].tolist()):
+                    sprite.set_state(state)
+            
+            index = self.entity_indexes[group]
+            if [sprite.alive() for sprite in sprites] != alive:
+                # Rebuild membership in level order so sprites update in the same order as before
+                group.empty()
+                index.clear()
+                for sprite, is_alive in zip(sprites, alive):
+                    if is_alive:
+                        group.add(sprite)
+                        self.all_sprites.add(sprite)
+                        self.index_entity(index, sprite)
+                    else:
+                        sprite.kill()
+            elif group is self.enemies or group is self.powerups:
+                # Only these can leave their grid cells; the rest just bob in place
+                for sprite in group:
+                    index.move(sprite, sprite.rect.inflate(0, BLOCK_BOB_MARGIN * 2))
+        
+        RNG.set_state(snapshot[i:], SNAPSHOT_STREAMS)
+        self.particle_system.clear()
+        self.clear_floating_scores()
+    
     def update(self):
+        # Snapshot positions so draw() can interpolate towards this step
+        self.camera.store_previous()
+        self.player.store_previous()
+        
         if self.game_state == PLAYING:
             # Update camera
             self.camera.update(self.player)
             
+            # Spawn and despawn sectors of a streamed level around the view
+            if self.streamer:
+                area = self.camera.get_visible_area()
+                self.streamer.update(area['left'], area['right'])
+            
+            # Only simulate sprites near the view; everything further out sleeps
+            active_rect = self.camera.get_active_rect(CULL_UPDATE_MARGIN)
+            enemies = self.entities_in(self.enemies, active_rect)
+            coins = self.entities_in(self.coins, active_rect)
+            powerups = self.entities_in(self.powerups, active_rect)
+            
             # Update all sprites with new collision system
-            self.player.update(self.platforms, self.jumping_blocks, self.pipes, self.enemies)
-            self.enemies.update(self.platforms)
-            self.coins.update()
-            self.jumping_blocks.update()
-            self.flags.update()  # Update flags for animation
-            self.powerups.update()  # Update power-ups
+            self.player.update(self.platforms, self.jumping_blocks, self.pipes, enemies)
+            self.enemy_manager.update(enemies, self.platforms)
+            enemy_index = self.entity_indexes[self.enemies]
+            for enemy in enemies:
+                enemy_index.move(enemy, enemy.rect.inflate(0, BLOCK_BOB_MARGIN * 2))
+            for coin in coins:
+                coin.update()
+            for block in self.entities_in(self.jumping_blocks, active_rect):
+                block.update()
+            flags = self.entities_in(self.flags, active_rect)
+            for flag in flags:
+                flag.update()  # Update flags for animation
+            for powerup in powerups:
+                powerup.update()  # Update power-ups
+            self.particle_system.update()
             
-            # Check coin collection using new collision system
-            collected_coins = self.collision_system.check_coin_collisions(self.player, self.coins)
-            for coin in collected_coins:
-                coin.kill()
-                self.score += 10
-                if self.coin_sound:
-                    self.coin_sound.play()
-                
-            # Check jumping block collision using new collision detection system
-            for block in self.jumping_blocks:
-                if block.check_collision_from_below(self.player):
-                    block.hit()
-                    # Get points from block (200 points, only once per block)
-                    points_earned = block.get_points()
-                    self.score += points_earned
-                    
-                    # Get content from block
-                    content = block.get_content()
-                    if content:
-                        if content == "coin":
-                            self.score += 10
-                            if self.coin_sound:
-                                self.coin_sound.play()
-                        elif content in ["mushroom", "star"]:
-                            # Create power-up at block position
-                            powerup = PowerUp(block.rect.centerx, block.rect.top, content)
-                            self.powerups.add(powerup)
-                            self.all_sprites.add(powerup)
-                    
-                    # Add floating score text if points were earned
-                    if points_earned > 0:
-                        score_text = f"+{points_earned}"
-                        self.floating_scores.append((score_text, block.rect.centerx, block.rect.top, 60))
-                    
-                    # Add camera shake when hitting blocks
-                    self.camera.shake_camera(3, 8)
-                    if self.block_hit_sound:
-                        self.block_hit_sound.play()
+            # Resolve pickups, hits and level progress
+            self.check_coin_collection(coins)
+            self.check_block_hits()
+            self.check_powerup_collection(powerups)
+            self.check_enemy_hits(enemies)
+            self.check_fall()
+            self.check_level_complete(flags)
                 
-            # Check power-up collection
-            for powerup in self.powerups:
-                if self.player.rect.colliderect(powerup.rect):
-                    powerup.collect()
-                    self.player.apply_powerup(powerup.powerup_type)
-                    self.score += powerup.points
-                    powerup.kill()
+            # Update floating scores in place, recycling expired ones
+            self.update_floating_scores()
+        
+        elif self.game_state == LEVEL_COMPLETE:
+            self.level_complete_timer -= 1
+            if self.level_complete_timer <= 0:
+                self.next_level()
                 
-            # Check enemy collision using new collision system
-            enemy_collision_result = self.collision_system.check_enemy_collisions(self.player, self.enemies)
-            if enemy_collision_result == "player_hit":
-                if self.player.take_damage():
-                    self.lives -= 1
-                    # Add camera shake when player takes damage
-                    self.camera.shake_camera(5, 10)
-                    if self.lives <= 0:
-                        self.game_state = GAME_OVER
-                        self.stop_music()
-                        if self.game_over_sound:
-                            self.game_over_sound.play()
-                    else:
-                        self.player.reset(100, 300)
-            elif enemy_collision_result == "enemy_killed":
-                self.score += 20
-                # Add small camera shake when enemy is killed
-                self.camera.shake_camera(2, 5)
-                    
-            # Check if player fell off screen
-            if self.player.rect.top > SCREEN_HEIGHT:
+    def check_coin_collection(self, coins):
+        """Collect coins the player touches"""
+        # Check coin collection using new collision system
+        collected_coins = self.collision_system.check_coin_collisions(self.player, coins)
+        for coin in collected_coins:
+            coin.kill()
+            self.score += 10
+            if self.coin_sound:
+                self.coin_sound.play()
+    
+    def check_block_hits(self):
+        """Handle jumping blocks hit from below"""
+        # Blocks the player's upward sweep stopped against this step
+        for block in self.player.ceiling_hits:
+            block.hit()
+            # Get points from block (200 points, only once per block)
+            points_earned = block.get_points()
+            self.score += points_earned
+            
+            # Get content from block
+            content = block.get_content()
+            if content:
+                if content == "coin":
+                    self.score += 10
+                    if self.coin_sound:
+                        self.coin_sound.play()
+                elif content in ["mushroom", "star"]:
+                    # Create power-up at block position
+                    self.spawn_powerup(block.rect.centerx, block.rect.top, content)
+            
+            # Add floating score text if points were earned
+            if points_earned > 0:
+                self.add_floating_score(f"+{points_earned}", block.rect.centerx, block.rect.top)
+            
+            # Add camera shake when hitting blocks
+            self.camera.shake_camera(3, 8)
+            if self.block_hit_sound:
+                self.block_hit_sound.play()
+    
+    def check_powerup_collection(self, powerups):
+        """Collect power-ups the player touches"""
+        # Check power-up collection
+        for powerup in powerups:
+            if self.player.rect.colliderect(powerup.rect):
+                powerup.collect()
+                self.player.apply_powerup(powerup.powerup_type)
+                self.score += powerup.points
+                powerup.kill()
+    
+    def check_enemy_hits(self, enemies):
+        """Handle stomps and damage from enemies"""
+        # Check enemy collision using new collision system
+        enemy_collision_result = self.collision_system.check_enemy_collisions(self.player, enemies)
+        if enemy_collision_result == "player_hit":
+            if self.player.take_damage():
                 self.lives -= 1
-                # Add camera shake when player falls
-                self.camera.shake_camera(8, 15)
+                # Add camera shake when player takes damage
+                self.camera.shake_camera(5, 10)
                 if self.lives <= 0:
                     self.game_state = GAME_OVER
                     self.stop_music()
@@ -375,106 +654,187 @@ class MarioGame:
                         self.game_over_sound.play()
                 else:
                     self.player.reset(100, 300)
-                    
-            # Check if level is complete using new collision system
-            flag_collision = False
-            
-            # Check flag collision using new flag method
-            for flag in self.flags:
-                if flag.check_collision(self.player):
-                    flag.reach_flag()
-                    flag_collision = True
-                    break
+        elif enemy_collision_result == "enemy_killed":
+            self.score += 20
+            # Add small camera shake when enemy is killed
+            self.camera.shake_camera(2, 5)
+    
+    def check_fall(self):
+        """Take a life if the player fell off the screen"""
+        # Check if player fell off screen
+        if self.player.rect.top > SCREEN_HEIGHT:
+            self.lives -= 1
+            # Add camera shake when player falls
+            self.camera.shake_camera(8, 15)
+            if self.lives <= 0:
+                self.game_state = GAME_OVER
+                self.stop_music()
+                if self.game_over_sound:
+                    self.game_over_sound.play()
+            else:
+                self.player.reset(100, 300)
+    
+    def check_level_complete(self, flags):
+        """Finish the level when the player reaches the flag"""
+        # Check if level is complete using new collision system
+        flag_collision = False
+        
+        # Check flag collision using new flag method
+        for flag in flags:
+            if flag.check_collision(self.player):
+                flag.reach_flag()
+                flag_collision = True
+                break
+        
+        if flag_collision:
+            # Add camera shake when completing level
+            self.camera.shake_camera(10, 20)
+            if self.level_complete_sound:
+                self.level_complete_sound.play()
+            self.game_state = LEVEL_COMPLETE
+            self.level_complete_timer = self.level_complete_duration
+    
+    def draw(self, alpha=1.0):
+        """Draw the game, interpolating moving objects by alpha between simulation steps"""
+        # Menus, pause and end screens don't move, so they are reused rather than redrawn
+        if self.game_state in STATIC_SCREENS:
+            self.draw_static_screen(alpha)
+            return
+        self.frame_key = None
+        
+        self.compose_frame(alpha)
+        
+        # Draw the performance overlay over everything
+        self.perf_overlay.draw(self.screen)
             
-            if flag_collision:
-                # Add camera shake when completing level
-                self.camera.shake_camera(10, 20)
-                if self.level_complete_sound:
-                    self.level_complete_sound.play()
-                self.game_state = LEVEL_COMPLETE
-                self.level_complete_timer = self.level_complete_duration
-                
-            # Update floating scores
-            self.floating_scores = [(text, x, y - 1, timer - 1) for text, x, y, timer in self.floating_scores if timer > 0]
+        # Update display
+        if not self.headless:
+            pygame.display.flip()
+    
+    def draw_static_screen(self, alpha):
+        """Draw a static screen from its cached frame, pushing only changed areas to the display"""
+        key = self.static_frame_key()
+        if key != self.frame_key:
+            self.compose_frame(alpha)
+            self.frame_cache.blit(self.screen, (0, 0))
+            self.frame_key = key
+            dirty = [self.screen.get_rect()]
+        elif self.overlay_rect:
+            # Wipe last frame's performance panel back to the cached screen
+            self.screen.blit(self.frame_cache, self.overlay_rect, self.overlay_rect)
+            dirty = [self.overlay_rect]
+        else:
+            dirty = []
+        
+        self.overlay_rect = self.perf_overlay.draw(self.screen)
+        if self.overlay_rect:
+            dirty.append(self.overlay_rect)
+        if dirty and not self.headless:
+            pygame.display.update(dirty)
+    
+    def static_frame_key(self):
+        """Everything a static screen's image depends on"""
+        camera = self.camera
+        return (self.game_state, self.score, self.lives, self.current_level, self.level_serial,
+                self.collision_system.debug_mode, camera.debug_mode, camera.current_mode,
+                camera.x, camera.y, camera.zoom_level, camera.shake_intensity)
+    
+    def is_idle(self):
+        """Check if a static screen is shown, so the main loop can render less often"""
+        return self.game_state in STATIC_SCREENS
+    
+    def compose_frame(self, alpha):
+        """Draw the current state's background, world and screens onto the screen surface"""
+        self.camera.begin_interpolation(alpha)
         
-        elif self.game_state == LEVEL_COMPLETE:
-            self.level_complete_timer -= 1
-            if self.level_complete_timer <= 0:
-                self.next_level()
-                
-    def draw(self):
         # Get current level background color
-        if self.game_state == PLAYING and self.current_level < len(LEVELS):
-            background_color = LEVELS[self.current_level].get('background_color', BLUE)
+        if self.game_state == PLAYING:
+            background_color = self.background_color
         else:
             background_color = BLUE
         
+        # States showing the world draw it through the camera's render target, which is
+        # an off-screen 1x surface scaled to the screen in one pass while zoomed
+        shows_world = self.game_state in (PLAYING, PAUSED, LEVEL_COMPLETE)
+        surface = self.camera.render_target(self.screen) if shows_world else self.screen
+        
         # Clear screen with level background color
-        self.screen.fill(background_color)
+        surface.fill(background_color)
         
         # Draw background pattern for scrolling levels
         if self.game_state == PLAYING:
-            self.draw_background_pattern()
+            self.draw_background_pattern(surface)
         
         # Draw background if available
         if self.background:
             bg_rect = self.background.get_rect()
-            bg_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-            self.screen.blit(self.background, bg_rect)
+            bg_rect.center = surface.get_rect().center
+            surface.blit(self.background, bg_rect)
             
         if self.game_state == MENU:
             self.draw_menu()
         elif self.game_state == PLAYING:
-            self.draw_game()
+            self.draw_game(surface)
         elif self.game_state == PAUSED:
-            self.draw_game()
+            self.draw_game(surface)
             self.draw_pause_screen()
         elif self.game_state == GAME_OVER:
             self.draw_game_over()
         elif self.game_state == LEVEL_COMPLETE:
-            self.draw_game()
+            self.draw_game(surface)
             self.draw_level_complete()
         elif self.game_state == GAME_WIN:
             self.draw_game_win()
-            
-        # Update display
-        pygame.display.flip()
+        
+        self.camera.end_interpolation()
             
     def draw_menu(self):
         # Draw a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(UI_BACKGROUND_ALPHA)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dim_overlay, (0, 0))
         
-        title = self.font.render("SUPER MARIO ENHANCED", True, UI_COLOR)
+        title = TEXT_CACHE.render("SUPER MARIO ENHANCED", UI_FONT_SIZE, UI_COLOR)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
         self.screen.blit(title, title_rect)
         
-        subtitle = self.small_font.render("5 Levels of Adventure!", True, UI_COLOR)
+        subtitle = TEXT_CACHE.render("5 Levels of Adventure!", UI_SMALL_FONT_SIZE, UI_COLOR)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
         self.screen.blit(subtitle, subtitle_rect)
         
-        instruction = self.small_font.render("Press SPACE to start", True, UI_COLOR)
+        instruction = TEXT_CACHE.render("Press SPACE to start", UI_SMALL_FONT_SIZE, UI_COLOR)
         instruction_rect = instruction.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
         self.screen.blit(instruction, instruction_rect)
         
-        controls = self.small_font.render("Controls: Arrow Keys/WASD to move, SPACE to jump", True, UI_COLOR)
+        controls = TEXT_CACHE.render("Controls: Arrow Keys/WASD to move, SPACE to jump", UI_SMALL_FONT_SIZE, UI_COLOR)
         controls_rect = controls.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         self.screen.blit(controls, controls_rect)
         
-        pause_info = self.small_font.render("P to pause, F1 for debug mode", True, UI_COLOR)
+        pause_info = TEXT_CACHE.render("P to pause, F1 for debug mode", UI_SMALL_FONT_SIZE, UI_COLOR)
         pause_rect = pause_info.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))
         self.screen.blit(pause_info, pause_rect)
         
-    def draw_game(self):
-        # Draw all sprites with camera offset
-        for sprite in self.all_sprites:
-            # Special handling for sprites with custom draw methods
-            if hasattr(sprite, 'draw') and callable(sprite.draw):
-                sprite.draw(self.screen, self.camera)
-            else:
-                self.screen.blit(sprite.image, self.camera.apply(sprite))
+    def draw_game(self, surface=None):
+        """Draw the world onto surface (the screen by default) at 1x, then the HUD onto the screen"""
+        if surface is None:
+            surface = self.screen
+        
+        # Draw pre-rendered static geometry chunks
+        self.draw_stats["static"] = self.static_layer.draw(surface, self.camera)
+        
+        # Draw every particle in one batch, under the sprites
+        self.draw_stats["particles"] = self.particle_system.draw(surface, self.camera)
+        
+        # Draw moving sprites near the view with camera offset, then the player on top
+        draw_rect = self.camera.get_active_rect(CULL_DRAW_MARGIN)
+        sprites = 1
+        for group in self.draw_groups:
+            for sprite in self.entities_in(group, draw_rect):
+                sprite.draw(surface, self.camera)
+                sprites += 1
+        self.player.draw(surface, self.camera)
+        self.draw_stats["sprites"] = sprites
+        
+        # Scale a zoomed world up to the screen
+        self.camera.present(surface, self.screen)
         
         # Draw debug collision boxes if enabled
         if self.collision_system.debug_mode:
@@ -489,116 +849,124 @@ class MarioGame:
         self.draw_ui()
         
         # Draw floating scores
-        for text, x, y, timer in self.floating_scores:
+        self.draw_floating_scores()
+    
+    def update_floating_scores(self):
+        """Move floating scores up, dropping expired ones without rebuilding the list"""
+        scores = self.floating_scores
+        live = 0
+        for score in scores:
+            if score.timer > 0:
+                score.y -= 1
+                score.timer -= 1
+                scores[live] = score
+                live += 1
+            else:
+                self.score_pool.release(score)
+        del scores[live:]
+    
+    def draw_floating_scores(self):
+        """Draw fading score text above hit blocks"""
+        for score in self.floating_scores:
             # Calculate alpha based on timer
-            alpha = min(255, timer * 4)
-            score_surface = self.small_font.render(text, True, (255, 255, 0))
+            alpha = min(255, score.timer * 4)
+            # The cached surface is shared, so its alpha is set right before each blit
+            score_surface = TEXT_CACHE.render(score.text, UI_SMALL_FONT_SIZE, (255, 255, 0))
             score_surface.set_alpha(alpha)
-            score_rect = score_surface.get_rect(center=(x, y))
+            score_rect = score_surface.get_rect(center=(score.x, score.y))
             self.screen.blit(score_surface, score_rect)
     
     def draw_ui(self):
         """Draw user interface elements"""
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, UI_COLOR)
+        score_text = TEXT_CACHE.render(f"Score: {self.score}", UI_FONT_SIZE, UI_COLOR)
         self.screen.blit(score_text, (10, 10))
         
         # Lives
-        lives_text = self.font.render(f"Lives: {self.lives}", True, UI_COLOR)
+        lives_text = TEXT_CACHE.render(f"Lives: {self.lives}", UI_FONT_SIZE, UI_COLOR)
         self.screen.blit(lives_text, (10, 50))
         
         # Level
-        level_text = self.font.render(f"Level: {self.current_level + 1}/5", True, UI_COLOR)
+        level_text = TEXT_CACHE.render(f"Level: {self.current_level + 1}/5", UI_FONT_SIZE, UI_COLOR)
         self.screen.blit(level_text, (10, 90))
         
         # Power-up status
         if self.player.powerup_state != "normal":
-            powerup_text = self.small_font.render(f"Power: {self.player.powerup_state.upper()}", True, (255, 255, 0))
+            powerup_text = TEXT_CACHE.render(f"Power: {self.player.powerup_state.upper()}", UI_SMALL_FONT_SIZE, (255, 255, 0))
             self.screen.blit(powerup_text, (10, 130))
         
         # Debug info
         if self.collision_system.debug_mode:
-            debug_text = self.small_font.render("DEBUG MODE: F1 to toggle", True, (255, 255, 0))
+            debug_text = TEXT_CACHE.render("DEBUG MODE: F1 to toggle", UI_SMALL_FONT_SIZE, (255, 255, 0))
             self.screen.blit(debug_text, (10, SCREEN_HEIGHT - 30))
     
     def draw_pause_screen(self):
         """Draw pause screen overlay"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(UI_BACKGROUND_ALPHA)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dim_overlay, (0, 0))
         
-        pause_text = self.font.render("PAUSED", True, UI_COLOR)
+        pause_text = TEXT_CACHE.render("PAUSED", UI_FONT_SIZE, UI_COLOR)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
         self.screen.blit(pause_text, pause_rect)
         
-        resume_text = self.small_font.render("Press P to resume", True, UI_COLOR)
+        resume_text = TEXT_CACHE.render("Press P to resume", UI_SMALL_FONT_SIZE, UI_COLOR)
         resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
         self.screen.blit(resume_text, resume_rect)
         
     def draw_game_over(self):
         # Draw a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(UI_BACKGROUND_ALPHA)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dim_overlay, (0, 0))
         
-        game_over_text = self.font.render("GAME OVER", True, RED)
+        game_over_text = TEXT_CACHE.render("GAME OVER", UI_FONT_SIZE, RED)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         self.screen.blit(game_over_text, game_over_rect)
         
-        score_text = self.font.render(f"Final Score: {self.score}", True, UI_COLOR)
+        score_text = TEXT_CACHE.render(f"Final Score: {self.score}", UI_FONT_SIZE, UI_COLOR)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(score_text, score_rect)
         
-        restart_text = self.small_font.render("Press R to restart", True, UI_COLOR)
+        restart_text = TEXT_CACHE.render("Press R to restart", UI_SMALL_FONT_SIZE, UI_COLOR)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(restart_text, restart_rect)
         
     def draw_level_complete(self):
         # Draw a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(UI_BACKGROUND_ALPHA)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dim_overlay, (0, 0))
         
-        complete_text = self.font.render("LEVEL COMPLETE!", True, GREEN)
+        complete_text = TEXT_CACHE.render("LEVEL COMPLETE!", UI_FONT_SIZE, GREEN)
         complete_rect = complete_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         self.screen.blit(complete_text, complete_rect)
         
-        score_text = self.font.render(f"Score: {self.score}", True, UI_COLOR)
+        score_text = TEXT_CACHE.render(f"Score: {self.score}", UI_FONT_SIZE, UI_COLOR)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(score_text, score_rect)
         
-        next_text = self.small_font.render("Loading next level...", True, UI_COLOR)
+        next_text = TEXT_CACHE.render("Loading next level...", UI_SMALL_FONT_SIZE, UI_COLOR)
         next_rect = next_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(next_text, next_rect)
     
     def draw_game_win(self):
         # Draw a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(UI_BACKGROUND_ALPHA)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dim_overlay, (0, 0))
         
-        win_text = self.font.render("CONGRATULATIONS!", True, GOLD)
+        win_text = TEXT_CACHE.render("CONGRATULATIONS!", UI_FONT_SIZE, GOLD)
         win_rect = win_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
         self.screen.blit(win_text, win_rect)
         
-        subtitle = self.font.render("You've completed all levels!", True, UI_COLOR)
+        subtitle = TEXT_CACHE.render("You've completed all levels!", UI_FONT_SIZE, UI_COLOR)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
         self.screen.blit(subtitle, subtitle_rect)
         
-        score_text = self.font.render(f"Final Score: {self.score}", True, UI_COLOR)
+        score_text = TEXT_CACHE.render(f"Final Score: {self.score}", UI_FONT_SIZE, UI_COLOR)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(score_text, score_rect)
         
-        restart_text = self.small_font.render("Press R to play again", True, UI_COLOR)
+        restart_text = TEXT_CACHE.render("Press R to play again", UI_SMALL_FONT_SIZE, UI_COLOR)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(restart_text, restart_rect)
         
-    def draw_background_pattern(self):
+    def draw_background_pattern(self, surface):
         # Draw a simple background pattern for scrolling levels
-        for x in range(0, SCREEN_WIDTH + 100, 100):
-            for y in range(0, SCREEN_HEIGHT + 100, 100):
-                pygame.draw.circle(self.screen, (200, 200, 255), (x, y), 2) 
\ No newline at end of file
+        width, height = surface.get_size()
+        for x in range(0, width + 100, 100):
+            for y in range(0, height + 100, 100):
+                pygame.draw.circle(surface, (200, 200, 255), (x, y), 2) 
\ No newline at end of file
@@ -1,21 +1,28 @@
 import pygame
 from settings import *
+from assets import ASSETS
 
 class Ground(pygame.sprite.Sprite):
-    def __init__(self):
+    def __init__(self, x=-SCREEN_WIDTH, width=GROUND_SEGMENT_WIDTH):
         super().__init__()
-        # Make ground wider to cover the entire level and extend left of Mario
-        self.image = pygame.Surface((SCREEN_WIDTH * 4, 100))
-        self.image.fill(GREEN)
-        
-        # Add some texture to the ground
-        for i in range(0, self.image.get_width(), 50):
-            pygame.draw.line(self.image, (0, 100, 0), (i, 0), (i, 100), 2)
+        # Long levels are covered by several segments; texture lines stay on a world-aligned grid
+        offset = -x % 50
+        self.image = ASSETS.surface(("ground", width, offset), lambda: self.build_image(width, offset))
         
         self.rect = self.image.get_rect()
-        # Position ground to extend left of Mario's starting position (100, 300)
-        self.rect.x = -SCREEN_WIDTH  # Start ground to the left of screen
+        self.rect.x = x
         self.rect.y = SCREEN_HEIGHT - 100
+        
+    @staticmethod
+    def build_image(width, offset):
+        """Draw a ground strip of the given width, shared by every segment like it"""
+        image = pygame.Surface((width, 100))
+        image.fill(GREEN)
+        
+        # Add some texture to the ground
+        for i in range(offset, width, 50):
+            pygame.draw.line(image, (0, 100, 0), (i, 0), (i, 100), 2)
+        return image
 
 class Platform(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height):
@@ -2,6 +2,7 @@ import pygame
 import math
 import random
 from settings import *
+from assets import ASSETS, load_image, load_sounds
 
 class JumpingBlock(pygame.sprite.Sprite):
     def __init__(self, x, y, block_type="single", content_type="coin"):
@@ -38,13 +39,8 @@ class JumpingBlock(pygame.sprite.Sprite):
         self.jiggle_decay = JIGGLE_DECAY
         self.jiggle_phase = 0
         
-        # Particle effects
-        self.particles = []
-        self.hit_particles = []
-        
-        # Collision detection
-        self.last_collision_frame = -1
-        self.current_frame = 0
+        # Shared particle engine (set by the game)
+        self.particle_system = None
         
         # Sound effects
         self.sounds = {}
@@ -52,38 +48,36 @@ class JumpingBlock(pygame.sprite.Sprite):
         
     def load_sounds(self):
         """Load sound effects"""
-        try:
-            self.sounds["block_hit"] = pygame.mixer.Sound(SOUND_EFFECTS["block_hit"])
-            self.sounds["coin"] = pygame.mixer.Sound(SOUND_EFFECTS["coin"])
-            self.sounds["powerup"] = pygame.mixer.Sound(SOUND_EFFECTS["powerup"])
-        except:
-            self.sounds = {}
+        self.sounds = load_sounds({"block_hit": None, "coin": None, "powerup": None})
     
     def load_sprite(self):
         """Load question mark block sprite"""
         try:
             # Load question mark block sprite from assets
-            base_block = pygame.image.load("assets/images/mario/question mario.png").convert_alpha()
-            base_block = pygame.transform.scale(base_block, (50, 50))
+            base_block = load_image(SPRITE_IMAGES["question_block"], (50, 50))
             
-            # Create different block variations
+            # Create different block variations (shared by all blocks of a type)
             if self.block_type == "single":
                 self.question_block = base_block
             elif self.block_type == "double":
                 # Create a double-width block
-                self.question_block = pygame.Surface((100, 50), pygame.SRCALPHA)
-                self.question_block.blit(base_block, (0, 0))
-                self.question_block.blit(base_block, (50, 0))
+                self.question_block = ASSETS.surface(
+                    ("question_block", "double"), lambda: self.build_block_row(base_block, 2))
             elif self.block_type == "triple":
                 # Create a triple-width block
-                self.question_block = pygame.Surface((150, 50), pygame.SRCALPHA)
-                self.question_block.blit(base_block, (0, 0))
-                self.question_block.blit(base_block, (50, 0))
-                self.question_block.blit(base_block, (100, 0))
+                self.question_block = ASSETS.surface(
+                    ("question_block", "triple"), lambda: self.build_block_row(base_block, 3))
         except Exception as e:
             print(f"Error loading jumping block sprite: {e}")
             self.create_fallback_sprite()
     
+    def build_block_row(self, tile, count):
+        """Build a row of block tiles"""
+        row = pygame.Surface((50 * count, 50), pygame.SRCALPHA)
+        for i in range(count):
+            row.blit(tile, (50 * i, 0))
+        return row
+    
     def create_fallback_sprite(self):
         """Create fallback sprite if asset loading fails"""
         if self.block_type == "single":
@@ -108,74 +102,23 @@ class JumpingBlock(pygame.sprite.Sprite):
     
     def create_hit_particles(self):
         """Create particle effects when block is hit"""
-        for _ in range(12):
-            particle = {
-                'x': int(self.rect.centerx) + random.randint(-20, 20),
-                'y': int(self.rect.centery) + random.randint(-10, 10),
-                'vx': random.uniform(-4, 4),
-                'vy': random.uniform(-6, -2),
-                'life': random.randint(30, 60),
-                'color': (255, 255, 0)  # Yellow particles
-            }
-            self.hit_particles.append(particle)
+        if self.particle_system:
+            self.particle_system.emit(
+                12, self.rect.centerx, self.rect.centery, vx=(-4, 4), vy=(-6, -2),
+                life=(30, 60), color=(255, 255, 0), size=(3, 3), gravity=0.3,  # Yellow particles
+                spread_x=20, spread_y=10)
     
     def create_content_particles(self, content_type):
         """Create particles for block content"""
         color = (255, 215, 0) if content_type == "coin" else POWERUP_TYPES.get(content_type, {}).get("color", (255, 255, 255))
         
-        for _ in range(8):
-            particle = {
-                'x': int(self.rect.centerx),
-                'y': int(self.rect.top),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-4, -1),
-                'life': random.randint(40, 80),
-                'color': color
-            }
-            self.particles.append(particle)
+        if self.particle_system:
+            self.particle_system.emit(
+                8, self.rect.centerx, self.rect.top, vx=(-2, 2), vy=(-4, -1),
+                life=(40, 80), color=color, size=(4, 4), gravity=0.2)
     
-    def update_particles(self):
-        """Update particle effects"""
-        # Update hit particles
-        for particle in self.hit_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.3  # Gravity
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.hit_particles.remove(particle)
-        
-        # Update content particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.2  # Gravity
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-    
-    def draw_particles(self, screen, camera):
-        """Draw particle effects"""
-        # Draw hit particles
-        for particle in self.hit_particles:
-            alpha = int(255 * (particle['life'] / 60))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), 3)
-        
-        # Draw content particles
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / 80))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), 4)
-            
     def update(self):
         """Update block animation and state"""
-        self.current_frame += 1
-        
         if not self.is_hit:
             # Bobbing animation for question blocks
             self.animation_timer += self.animation_speed
@@ -201,30 +144,6 @@ class JumpingBlock(pygame.sprite.Sprite):
             self.jiggle_offset = 0
             self.jiggle_intensity = 0
             self.jiggle_phase = 0
-        
-        # Update particles
-        self.update_particles()
-            
-    def check_collision_from_below(self, player):
-        """Check if player is hitting this block from below"""
-        if self.current_frame == self.last_collision_frame:
-            return False  # Already processed this frame
-            
-        if not self.rect.colliderect(player.rect):
-            return False
-            
-        # Check if player is moving upward and hitting from below
-        if player.velocity_y < 0:  # Moving upward
-            # Check if player's top is hitting the block's bottom
-            player_top = player.rect.top
-            block_bottom = self.rect.bottom
-            
-            # Allow some tolerance for collision detection
-            if abs(player_top - block_bottom) < 15:
-                self.last_collision_frame = self.current_frame
-                return True
-                
-        return False
             
     def hit(self):
         """Handle block being hit from below"""
@@ -250,34 +169,23 @@ class JumpingBlock(pygame.sprite.Sprite):
     def change_hit_appearance(self):
         """Change block appearance when hit"""
         try:
-            if self.block_type == "single":
-                self.image = pygame.Surface((50, 50), pygame.SRCALPHA)
-                # Create a darker version
-                dark_block = pygame.image.load("assets/images/mario/question mario.png").convert_alpha()
-                dark_block = pygame.transform.scale(dark_block, (50, 50))
+            # Create a darker version (shared by all hit blocks)
+            def build_dark_block():
+                dark_block = load_image(SPRITE_IMAGES["question_block"], (50, 50)).copy()
                 dark_surface = pygame.Surface((50, 50), pygame.SRCALPHA)
                 dark_surface.fill((139, 69, 19, 128))  # Brown with transparency
                 dark_block.blit(dark_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                return dark_block
+            dark_block = ASSETS.surface(("hit_block", "single"), build_dark_block)
+            
+            if self.block_type == "single":
                 self.image = dark_block
             elif self.block_type == "double":
-                self.image = pygame.Surface((100, 50), pygame.SRCALPHA)
-                dark_block = pygame.image.load("assets/images/mario/question mario.png").convert_alpha()
-                dark_block = pygame.transform.scale(dark_block, (50, 50))
-                dark_surface = pygame.Surface((50, 50), pygame.SRCALPHA)
-                dark_surface.fill((139, 69, 19, 128))
-                dark_block.blit(dark_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                self.image.blit(dark_block, (0, 0))
-                self.image.blit(dark_block, (50, 0))
+                self.image = ASSETS.surface(
+                    ("hit_block", "double"), lambda: self.build_block_row(dark_block, 2))
             elif self.block_type == "triple":
-                self.image = pygame.Surface((150, 50), pygame.SRCALPHA)
-                dark_block = pygame.image.load("assets/images/mario/question mario.png").convert_alpha()
-                dark_block = pygame.transform.scale(dark_block, (50, 50))
-                dark_surface = pygame.Surface((50, 50), pygame.SRCALPHA)
-                dark_surface.fill((139, 69, 19, 128))
-                dark_block.blit(dark_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                self.image.blit(dark_block, (0, 0))
-                self.image.blit(dark_block, (50, 0))
-                self.image.blit(dark_block, (100, 0))
+                self.image = ASSETS.surface(
+                    ("hit_block", "triple"), lambda: self.build_block_row(dark_block, 3))
         except Exception as e:
             # Fallback: create a brown block
             if self.block_type == "single":
@@ -311,13 +219,32 @@ class JumpingBlock(pygame.sprite.Sprite):
         """Reset the points flag (for new levels)"""
         self.has_given_points = False
         self.has_given_content = False
-        self.last_collision_frame = -1
+    
+    def get_state(self):
+        """Get hit, reward and animation state as a list of numbers"""
+        return [self.rect.y, self.animation_timer, self.bob_offset, self.is_hit, self.hit_timer,
+                self.has_given_points, self.has_given_content, self.jiggle_offset,
+                self.jiggle_intensity, self.jiggle_phase]
+    
+    def set_state(self, values):
+        """Restore state from get_state(), swapping between the cached normal and hit images"""
+        (y, self.animation_timer, bob_offset, is_hit, hit_timer, has_given_points, has_given_content,
+         jiggle_offset, self.jiggle_intensity, self.jiggle_phase) = values
+        if bool(has_given_points) != self.has_given_points:
+            if has_given_points:
+                self.change_hit_appearance()
+            else:
+                self.image = self.question_block
+        self.rect.y = y
+        self.bob_offset = int(bob_offset)
+        self.is_hit = bool(is_hit)
+        self.hit_timer = int(hit_timer)
+        self.has_given_points = bool(has_given_points)
+        self.has_given_content = bool(has_given_content)
+        self.jiggle_offset = int(jiggle_offset)
     
     def draw(self, screen, camera):
-        """Draw the block with jiggle effect and particles"""
-        # Draw particles first
-        self.draw_particles(screen, camera)
-        
+        """Draw the block with jiggle effect"""
         # Apply jiggle effect to the image
         if self.jiggle_offset != 0:
             # Create a copy of the image with jiggle offset
@@ -0,0 +1,264 @@
+import argparse
+import functools
+import random
+import sys
+import pygame
+from settings import *
+from level_loader import validate_level, write_level_file
+
+GROUND_TOP = SCREEN_HEIGHT - 100  # Top of the ground segments load_level lays under every level
+PIPE_WIDTH = 60
+BLOCK_WIDTHS = {"single": 50, "double": 100, "triple": 150}
+BLOCK_HEIGHT = 50
+PLATFORM_HEIGHT = 30
+
+def jump_arc():
+    """Height of the player's feet above the take-off point on each frame of a jump
+
+    Steps the same gravity and whole-pixel Rect movement as Player.update, so
+    the numbers match the game exactly.
+    """
+    rect = pygame.Rect(0, 0, PLAYER_WIDTH, PLAYER_HEIGHT)
+    velocity = PLAYER_JUMP_SPEED
+    heights = []
+    while rect.y <= SCREEN_HEIGHT:
+        velocity = min(velocity + GRAVITY, MAX_FALL_SPEED)
+        rect.y += velocity
+        heights.append(-rect.y)
+    return heights
+
+JUMP_ARC = jump_arc()
+MAX_JUMP_HEIGHT = max(JUMP_ARC)
+
+@functools.lru_cache(maxsize=None)
+def jump_reach(rise):
+    """Furthest a running jump carries the player sideways while ending rise px higher (negative drops)
+
+    Returns None if the height can't be reached at all.
+    """
+    if rise > MAX_JUMP_HEIGHT:
+        return None
+    last = max(frame for frame, height in enumerate(JUMP_ARC, 1) if height >= rise)
+    return last * PLAYER_SPEED
+
+def surfaces(level):
+    """Get every (left, right, top) surface the player can stand on
+
+    The ground is split wherever something too low to walk under sits on it.
+    """
+    tops = []
+    obstacles = []
+    for x, y, width, height in level['platforms']:
+        tops.append((x, x + width, y))
+        obstacles.append((x, x + width, y, y + height))
+    for x, y, height, _ in level['pipes']:
+        tops.append((x, x + PIPE_WIDTH, y - height))
+        obstacles.append((x, x + PIPE_WIDTH, y - height, y))
+    for x, y, block_type, _ in level['jumping_blocks']:
+        width = BLOCK_WIDTHS[block_type]
+        tops.append((x, x + width, y))
+        obstacles.append((x, x + width, y, y + BLOCK_HEIGHT))
+
+    # Walk the ground from a screen left of the start to a screen past the end
+    ground = []
+    left = -SCREEN_WIDTH
+    blocking = sorted((l, r) for l, r, top, bottom in obstacles
+                      if bottom > GROUND_TOP - PLAYER_HEIGHT and top < GROUND_TOP)
+    for l, r in blocking:
+        if l > left:
+            ground.append((left, l, GROUND_TOP))
+        left = max(left, r)
+    ground.append((left, level['level_width'] + SCREEN_WIDTH, GROUND_TOP))
+    return ground + tops
+
+def is_reachable(level, start_x=100):
+    """Check the flag can be reached from the start with running jumps
+
+    A breadth-first search over standing surfaces, linking two surfaces when the
+    jump arc covers the gap at that height difference. Ceilings that could cut
+    a jump short are not modelled.
+    """
+    if not level['flag_position']:
+        return True
+    flag_x = level['flag_position'][0]
+    standing = surfaces(level)
+
+    def containing(x):
+        return next(i for i, (left, right, top) in enumerate(standing) if left <= x < right and top == GROUND_TOP)
+
+    start = containing(start_x)
+    goal = containing(flag_x)
+    seen = {start}
+    frontier = [start]
+    while frontier:
+        current = frontier.pop()
+        if current == goal:
+            return True
+        left, right, top = standing[current]
+        for i, (other_left, other_right, other_top) in enumerate(standing):
+            if i in seen:
+                continue
+            reach = jump_reach(top - other_top)
+            gap = max(other_left - right, left - other_right, 0)
+            if reach is not None and gap - PLAYER_WIDTH <= reach:
+                seen.add(i)
+                frontier.append(i)
+    return False
+
+class LevelGenerator:
+    """Seeded random levels in the load_level schema, every one reachable from start to flag
+
+    Levels are built left to right from ground runs, pipes and platform
+    staircases, sized from the simulated jump arc with GENERATOR_JUMP_MARGIN of
+    slack for imperfect timing. density scales enemies, coins, blocks and
+    power-ups: 0 is bare, 1 is packed and higher values overfill for stress tests.
+    """
+
+    def __init__(self, seed=None, level_width=GENERATOR_LEVEL_WIDTH, density=GENERATOR_DENSITY):
+        self.seed = seed
+        self.level_width = level_width
+        self.density = density
+        self.rng = random.Random(seed)
+
+        # Comfortable jumps, leaving room for imperfect timing
+        self.max_rise = int(MAX_JUMP_HEIGHT * GENERATOR_JUMP_MARGIN)
+
+    def generate(self, name=None):
+        """Build one level, validated, reachable and ready for load_level
+
+        Layouts that fail is_reachable are dropped and redrawn from the same
+        seeded RNG, so a seed still always gives the same levels.
+        """
+        for _ in range(GENERATOR_MAX_ATTEMPTS):
+            level = self.layout(name)
+            if is_reachable(level):
+                return level
+        raise RuntimeError(f"No reachable layout for seed {self.seed} in {GENERATOR_MAX_ATTEMPTS} attempts")
+
+    def layout(self, name=None):
+        """Draw one validated level layout, which may not be reachable"""
+        rng = self.rng
+        self.level = {key: [] for key in ("platforms", "enemies", "coins", "jumping_blocks", "pipes", "powerups")}
+
+        # A quiet start so the player lands safely, then features up to the flag
+        x = GENERATOR_START_CLEARANCE
+        end = self.level_width - GENERATOR_END_CLEARANCE
+        while x < end:
+            feature = rng.choices((self.ground_run, self.pipe, self.staircase), GENERATOR_FEATURE_WEIGHTS)[0]
+            x = feature(x, end)
+
+        level = dict(self.level, name=name or f"Generated {self.seed}", level_width=self.level_width,
+                     background_color=rng.choice(GENERATOR_BACKGROUNDS),
+                     flag_position=(self.level_width - 200, GROUND_TOP - 150))
+        return validate_level(level, "generated level")
+
+    def chance(self, probability):
+        """Roll for an optional object, scaled by density"""
+        return self.rng.random() < probability * self.density
+
+    def decorate(self, left, right, top):
+        """Maybe add coins, an enemy, blocks and a power-up over a surface"""
+        rng = self.rng
+        level = self.level
+        width = right - left
+
+        # A row of coins just above the surface
+        if self.chance(0.8):
+            count = max(1, int(width // 60 * self.density))
+            spacing = width / (count + 1)
+            for i in range(count):
+                level['coins'].append((int(left + spacing * (i + 1)) - 10, top - 60))
+
+        # Enemies dropped onto the surface, up to one per 150 px and away from its edges
+        for _ in range(max(1, width // 150)):
+            if width >= 120 and self.chance(0.6):
+                level['enemies'].append((rng.randint(left + 20, right - 20 - ENEMY_WIDTH), top - ENEMY_HEIGHT - 10,
+                                         rng.choice(("left", "right")), rng.choice(("goomba", "koopa"))))
+
+        # Blocks low enough to hit from below, kept off the edges where jumps start and land
+        block_type = rng.choice(list(BLOCK_WIDTHS))
+        block_width = BLOCK_WIDTHS[block_type]
+        if width >= block_width + PLAYER_WIDTH * 4 and self.chance(0.8):
+            clearance = rng.randint(PLAYER_HEIGHT + 40, PLAYER_HEIGHT + self.max_rise - 20)
+            center = (left + right) // 2
+            content = rng.choice(("coin", "coin", "powerup", "mushroom", "star"))
+            level['jumping_blocks'].append((center - block_width // 2, top - clearance - BLOCK_HEIGHT,
+                                            block_type, content))
+
+        # The odd power-up sitting on the surface
+        if width >= 60 and self.chance(0.08):
+            level['powerups'].append((rng.randint(left, right - 30), top - 40, rng.choice(("mushroom", "star"))))
+
+    def ground_run(self, x, end):
+        """A stretch of open ground"""
+        length = min(self.rng.randint(200, 600), end - x)
+        self.decorate(x, x + length, GROUND_TOP)
+        return x + length
+
+    def pipe(self, x, end):
+        """A pipe standing on the ground, low enough to jump onto"""
+        rng = self.rng
+        left = x + rng.randint(60, 120)
+        height = rng.randint(40, self.max_rise)
+        self.level['pipes'].append((left, GROUND_TOP, height, rng.choice(("normal", "normal", "warp", "fire"))))
+        if self.chance(0.6):
+            self.level['coins'].append((left + PIPE_WIDTH // 2 - 10, GROUND_TOP - height - 60))
+        return left + PIPE_WIDTH + rng.randint(60, 120)
+
+    def staircase(self, x, end):
+        """Floating platforms, each a comfortable jump from the one before, starting from the ground"""
+        rng = self.rng
+        top = GROUND_TOP
+        right = x
+        for _ in range(rng.randint(2, 5)):
+            width = rng.randint(GENERATOR_PLATFORM_WIDTH[0], GENERATOR_PLATFORM_WIDTH[1])
+
+            # Rise or drop within a comfortable jump, staying on screen and clear of the ground
+            lowest = min(GROUND_TOP - PLAYER_HEIGHT - PLATFORM_HEIGHT - 20, top + self.max_rise // 2)
+            highest = max(GENERATOR_HIGHEST_PLATFORM, top - self.max_rise)
+            new_top = rng.randint(highest, lowest)
+            reach = jump_reach(top - new_top)
+            gap = rng.randint(20, max(20, int(reach * GENERATOR_JUMP_MARGIN)))
+
+            left = right + gap
+            if left + width > end:
+                break
+            self.level['platforms'].append((left, new_top, width, PLATFORM_HEIGHT))
+            self.decorate(left, left + width, new_top)
+            top = new_top
+            right = left + width
+        return right + rng.randint(80, 200)
+
+def endless_levels(seed=None, level_width=GENERATOR_LEVEL_WIDTH, density=GENERATOR_DENSITY,
+                   width_growth=1.2, density_growth=0.05):
+    """Yield an endless series of generated levels, each longer and denser than the last"""
+    generator = LevelGenerator(seed, level_width, density)
+    number = 1
+    while True:
+        yield generator.generate(f"Endless {number}")
+        generator.level_width = int(generator.level_width * width_growth)
+        generator.density = min(1.0, generator.density + density_growth)
+        number += 1
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a random level file")
+    parser.add_argument("output", help="JSON file to write, e.g. levels/level_06.json")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--width", type=int, default=GENERATOR_LEVEL_WIDTH, help="level width in pixels")
+    parser.add_argument("--density", type=float, default=GENERATOR_DENSITY, help="0 (bare) to 1 (packed), higher for stress tests")
+    parser.add_argument("--name")
+    args = parser.parse_args(argv)
+
+    try:
+        level = LevelGenerator(args.seed, args.width, args.density).generate(args.name)
+    except RuntimeError as e:
+        print(e)
+        return 1
+    write_level_file(level, args.output)
+    counts = ", ".join(f"{len(level[key])} {key}" for key in
+                       ("platforms", "enemies", "coins", "jumping_blocks", "pipes", "powerups"))
+    print(f"Wrote {args.output}: {level['name']}, {level['level_width']} px ({counts})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
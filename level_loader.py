@@ -0,0 +1,281 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import numpy as np
+from settings import *
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+class LevelFormatError(ValueError):
+    """Raised for level files that can't be read or don't match the level schema"""
+
+# Allowed values of the string fields; compiled levels store indexes into these
+DIRECTIONS = ("left", "right")
+ENEMY_TYPES = ("goomba", "koopa")
+BLOCK_TYPES = ("single", "double", "triple")
+CONTENT_TYPES = ("coin", "powerup", "empty") + tuple(POWERUP_TYPES)
+PIPE_TYPES = ("normal", "warp", "fire")
+POWERUP_NAMES = tuple(POWERUP_TYPES)
+
+# Entity lists as (field name, int or allowed values, default or None if required).
+# Entries are arrays and may leave out trailing fields that have defaults
+LEVEL_SCHEMA = {
+    "platforms": (("x", int, None), ("y", int, None), ("width", int, None), ("height", int, None)),
+    "enemies": (("x", int, None), ("y", int, None), ("direction", DIRECTIONS, "left"),
+                ("enemy_type", ENEMY_TYPES, "goomba")),
+    "coins": (("x", int, None), ("y", int, None)),
+    "jumping_blocks": (("x", int, None), ("y", int, None), ("block_type", BLOCK_TYPES, "single"),
+                       ("content_type", CONTENT_TYPES, "coin")),
+    "pipes": (("x", int, None), ("y", int, None), ("height", int, 100), ("pipe_type", PIPE_TYPES, "normal")),
+    "powerups": (("x", int, None), ("y", int, None), ("powerup_type", POWERUP_NAMES, None)),
+}
+LEVEL_FIELDS = ("name", "background_color", "level_width", "flag_position") + tuple(LEVEL_SCHEMA)
+LEVEL_EXTENSIONS = (".json", ".toml")
+
+# Compiled level layout: a header, the UTF-8 name padded to 4 bytes, then one
+# little-endian int32 array per entity list in LEVEL_SCHEMA order, with string
+# fields stored as indexes into their allowed values
+COMPILED_MAGIC = b"MLVL"
+COMPILED_VERSION = 1
+COMPILED_HEADER = struct.Struct("<4sHHIi4Bii" + "I" * len(LEVEL_SCHEMA))
+
+# Part of the cache key, so changing the schema or layout invalidates compiled levels
+SCHEMA_SIGNATURE = repr((COMPILED_VERSION, [(key, [(name, kind if kind is not int else "int", default)
+                                                   for name, kind, default in fields])
+                                            for key, fields in LEVEL_SCHEMA.items()])).encode()
+
+def is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def validate_level(data, source="level"):
+    """Check a parsed level against the schema and fill in defaults
+
+    Returns a level with every field present and entities as full tuples, so
+    load_level can unpack them directly. Raises LevelFormatError listing every
+    problem found.
+    """
+    if not isinstance(data, dict):
+        raise LevelFormatError(f"{source}: a level must be an object, not {type(data).__name__}")
+
+    errors = [f"unknown field '{key}'" for key in data if key not in LEVEL_FIELDS]
+    level = {}
+
+    name = data.get("name", os.path.splitext(os.path.basename(source))[0])
+    if not isinstance(name, str):
+        errors.append("name: must be a string")
+    level["name"] = name
+
+    color = data.get("background_color", BLUE)
+    if not isinstance(color, (list, tuple)) or len(color) != 3 or \
+            not all(is_int(channel) and 0 <= channel <= 255 for channel in color):
+        errors.append("background_color: must be three integers from 0 to 255")
+    else:
+        level["background_color"] = tuple(color)
+
+    width = data.get("level_width", 2000)
+    if not is_int(width) or width <= 0:
+        errors.append("level_width: must be a positive integer")
+    level["level_width"] = width
+
+    flag = data.get("flag_position")
+    if flag is not None and (not isinstance(flag, (list, tuple)) or len(flag) != 2 or not all(map(is_int, flag))):
+        errors.append("flag_position: must be two integers")
+    level["flag_position"] = tuple(flag) if flag is not None else None
+
+    for key, fields in LEVEL_SCHEMA.items():
+        entries = data.get(key, [])
+        if not isinstance(entries, (list, tuple)):
+            errors.append(f"{key}: must be an array")
+            continue
+        required = sum(1 for _, _, default in fields if default is None)
+
+        items = []
+        for i, entry in enumerate(entries):
+            if not isinstance(entry, (list, tuple)) or not required <= len(entry) <= len(fields):
+                count = len(fields) if required == len(fields) else f"{required} to {len(fields)}"
+                errors.append(f"{key}[{i}]: must be an array of {count} values "
+                              f"({', '.join(name for name, _, _ in fields)})")
+                continue
+            item = tuple(entry) + tuple(default for _, _, default in fields[len(entry):])
+            for (name, kind, _), value in zip(fields, item):
+                if kind is int and not is_int(value):
+                    errors.append(f"{key}[{i}].{name}: must be an integer, not {value!r}")
+                elif kind is not int and value not in kind:
+                    errors.append(f"{key}[{i}].{name}: {value!r} is not one of {', '.join(kind)}")
+            items.append(item)
+        level[key] = items
+
+    if errors:
+        raise LevelFormatError(f"{source}: " + "; ".join(errors))
+    return level
+
+def parse_level(source_bytes, path):
+    """Parse the bytes of a JSON or TOML level file"""
+    try:
+        if path.endswith(".toml"):
+            if tomllib is None:
+                raise LevelFormatError(f"{path}: TOML levels need Python 3.11+ or the tomli package")
+            return tomllib.loads(source_bytes.decode("utf-8"))
+        return json.loads(source_bytes)
+    except LevelFormatError:
+        raise
+    except ValueError as e:  # JSON, TOML and Unicode errors all derive from ValueError
+        raise LevelFormatError(f"{path}: {e}") from e
+
+def read_level_file(path):
+    """Read and validate a JSON or TOML level file"""
+    with open(path, "rb") as f:
+        return validate_level(parse_level(f.read(), path), path)
+
+def write_level_file(level, path):
+    """Write a level as JSON in the layout of the bundled levels, one entry per line"""
+    lines = []
+    for key in LEVEL_FIELDS:
+        value = level.get(key)
+        if value is None:
+            continue
+        if key in LEVEL_SCHEMA:
+            entries = ",\n".join("    " + json.dumps(list(entry)) for entry in value)
+            lines.append(f'  "{key}": [\n{entries}\n  ]' if value else f'  "{key}": []')
+        else:
+            lines.append(f'  "{key}": {json.dumps(list(value) if isinstance(value, tuple) else value)}')
+    with open(path, "w") as f:
+        f.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+def compile_level(level):
+    """Pack a validated level into the compiled binary form"""
+    name = level["name"].encode("utf-8")
+    flag = level["flag_position"]
+    arrays = []
+    for key, fields in LEVEL_SCHEMA.items():
+        rows = [[value if kind is int else kind.index(value) for (_, kind, _), value in zip(fields, item)]
+                for item in level[key]]
+        arrays.append(np.array(rows, dtype="<i4").reshape(len(rows), len(fields)))
+
+    header = COMPILED_HEADER.pack(
+        COMPILED_MAGIC, COMPILED_VERSION, flag is not None, len(name), level["level_width"],
+        *level["background_color"], 0, *(flag or (0, 0)), *(len(array) for array in arrays))
+    padding = b"\0" * (-len(name) % 4)
+    return b"".join([header, name, padding] + [array.tobytes() for array in arrays])
+
+def decode_level(buffer):
+    """Rebuild a level from its compiled form (bytes or a memory map)"""
+    values = COMPILED_HEADER.unpack_from(buffer, 0)
+    magic, version, has_flag, name_length, width, red, green, blue, _, flag_x, flag_y = values[:11]
+    if magic != COMPILED_MAGIC or version != COMPILED_VERSION:
+        raise LevelFormatError("Not a compiled level of this version")
+
+    offset = COMPILED_HEADER.size
+    level = {
+        "name": bytes(buffer[offset:offset + name_length]).decode("utf-8"),
+        "background_color": (red, green, blue),
+        "level_width": width,
+        "flag_position": (flag_x, flag_y) if has_flag else None
+    }
+    offset += name_length + (-name_length % 4)
+
+    for (key, fields), count in zip(LEVEL_SCHEMA.items(), values[11:]):
+        size = count * len(fields)
+        rows = np.frombuffer(buffer, dtype="<i4", count=size, offset=offset).reshape(count, len(fields)).tolist()
+        kinds = [kind for _, kind, _ in fields]
+        level[key] = [tuple(value if kind is int else kind[value] for kind, value in zip(kinds, row))
+                      for row in rows]
+        offset += size * 4
+    return level
+
+def load_compiled(path):
+    """Decode a compiled level file through a read-only memory map"""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_level(mapped)
+
+def load_level_file(path, cache_directory=None):
+    """Load a level file, going through its compiled form cached by content hash"""
+    with open(path, "rb") as f:
+        source_bytes = f.read()
+    if cache_directory is None:
+        return validate_level(parse_level(source_bytes, path), path)
+
+    digest = hashlib.blake2b(SCHEMA_SIGNATURE + source_bytes, digest_size=16).hexdigest()
+    cache_path = os.path.join(cache_directory, digest + ".mlvl")
+    if os.path.exists(cache_path):
+        try:
+            return load_compiled(cache_path)
+        except (OSError, ValueError, struct.error):
+            pass  # Damaged cache file; rebuild it below
+
+    level = validate_level(parse_level(source_bytes, path), path)
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(compile_level(level))
+        os.replace(temp_path, cache_path)  # Atomic, so readers never see a partial file
+    except OSError:
+        pass  # Read-only install: levels still load, just without the cache
+    return level
+
+class LevelPack:
+    """An ordered set of level files, each loaded on first access
+
+    Files are ordered by name; len() only lists the directory, so large packs
+    cost nothing until a level is played.
+    """
+
+    def __init__(self, directory, cache_directory=None):
+        self.directory = directory
+        self.cache_directory = cache_directory or os.path.join(directory, LEVEL_CACHE_DIRNAME)
+        try:
+            names = sorted(name for name in os.listdir(directory) if name.endswith(LEVEL_EXTENSIONS))
+        except FileNotFoundError:
+            names = []
+        self.paths = [os.path.join(directory, name) for name in names]
+        self.levels = {}  # index -> loaded level
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.paths)
+        if not 0 <= index < len(self.paths):
+            raise IndexError("level index out of range")
+        level = self.levels.get(index)
+        if level is None:
+            level = load_level_file(self.paths[index], self.cache_directory)
+            self.levels[index] = level
+        return level
+
+    def __iter__(self):
+        for index in range(len(self.paths)):
+            yield self[index]
+
+def main(paths):
+    """Validate and compile level files, or the whole default pack"""
+    paths = paths or LEVELS.paths
+    failed = 0
+    for path in paths:
+        try:
+            level = load_level_file(path, LEVELS.cache_directory)
+        except (OSError, LevelFormatError) as e:
+            print(f"FAIL {e}")
+            failed += 1
+            continue
+        counts = ", ".join(f"{len(level[key])} {key}" for key in LEVEL_SCHEMA)
+        print(f"ok   {path}: {level['name']} ({counts})")
+    return 1 if failed else 0
+
+# The game's levels, from the levels directory next to this file
+LEVELS = LevelPack(os.path.join(os.path.dirname(os.path.abspath(__file__)), LEVELS_DIRNAME))
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
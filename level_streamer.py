@@ -0,0 +1,219 @@
+from concurrent.futures import ThreadPoolExecutor
+from settings import *
+from game_platform import Ground, Platform
+from pipe import Pipe
+
+# Level entries spawned as sprites with state, in the order load_level creates them
+ENTITY_KINDS = ("enemies", "coins", "jumping_blocks", "powerups", "flag_position")
+
+# Kinds whose state (e.g. a block already hit) survives being despawned and respawned
+PERSISTENT_KINDS = ("jumping_blocks",)
+
+def create_static(kind, entry):
+    """Create a static geometry sprite from its level entry; safe on a worker thread"""
+    if kind == "platforms":
+        return Platform(*entry)
+    if kind == "pipes":
+        return Pipe(*entry)
+    return Ground(*entry)  # ("ground", (x, width))
+
+def static_span(kind, entry):
+    """Get the (left, right) world x extent of a static level entry"""
+    if kind == "platforms":
+        return entry[0], entry[0] + entry[2]
+    if kind == "pipes":
+        return entry[0], entry[0] + 60  # Pipes are a fixed 60 px wide
+    return entry[0], entry[0] + entry[1]
+
+def is_spent(sprite):
+    """Check if a sprite was killed, stomped or collected, so it must not respawn"""
+    return not sprite.alive() or not getattr(sprite, "is_alive", True) or getattr(sprite, "is_collected", False)
+
+class Sector:
+    """The level entries of one horizontal slice of a streamed level"""
+
+    def __init__(self, index, width):
+        self.index = index
+        self.left = index * width
+        self.right = self.left + width
+        self.statics = []  # (key, kind, entry) of static geometry overlapping the slice
+        self.entities = []  # (key, kind, entry) of objects whose spawn point is in the slice, in level order
+        self.prefetch = None  # Future of (static sprites, baked chunks) from the worker thread
+        self.active = False
+
+class LevelStreamer:
+    """Spawns a long level's sectors as the view approaches and despawns them as it leaves
+
+    Static geometry for upcoming sectors is built and baked on a background
+    thread. Everything with behaviour or random state is created on the main
+    thread in level order, so streamed levels stay deterministic.
+    """
+
+    def __init__(self, game, level_data, sector_width=STREAM_SECTOR_WIDTH):
+        self.game = game
+        self.sector_width = sector_width
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prefetch")
+
+        # Slice the level, padded by a screen on each side like the ground
+        first = -SCREEN_WIDTH // sector_width
+        last = (level_data['level_width'] + SCREEN_WIDTH) // sector_width
+        self.first = first
+        self.sectors = [Sector(index, sector_width) for index in range(first, last + 1)]
+
+        for sector in self.sectors:
+            key = ("ground", sector.index)
+            sector.statics.append((key, "ground", (sector.left, sector_width)))
+        for kind in ("platforms", "pipes"):
+            for i, entry in enumerate(level_data[kind]):
+                left, right = static_span(kind, entry)
+                for sector in self.sectors_between(left, right - 1):
+                    sector.statics.append(((kind, i), kind, entry))
+
+        entries = {kind: level_data[kind] for kind in ENTITY_KINDS[:-1]}
+        entries["flag_position"] = [level_data['flag_position']] if level_data['flag_position'] else []
+        for kind in ENTITY_KINDS:
+            for i, entry in enumerate(entries[kind]):
+                for sector in self.sectors_between(entry[0], entry[0]):
+                    sector.entities.append(((kind, i), kind, entry))
+
+        self.static_sprites = {}  # key -> [sprite, number of active sectors using it]
+        self.live = {}  # key -> spawned sprite
+        self.spent = set()  # Keys of objects killed or collected
+        self.saved = {}  # key -> state of a despawned persistent object
+
+    def sectors_between(self, left, right):
+        """Get the sectors overlapping world x range left to right"""
+        first = max(int(left) // self.sector_width - self.first, 0)
+        last = min(int(right) // self.sector_width - self.first, len(self.sectors) - 1)
+        return self.sectors[first:last + 1]
+
+    def update(self, left, right):
+        """Stream sectors in and out for a view spanning world x left to right"""
+        # Spawn nearby sectors, left to right so the creation order is repeatable
+        for sector in self.sectors_between(left - STREAM_ACTIVE_MARGIN, right + STREAM_ACTIVE_MARGIN):
+            if not sector.active:
+                self.activate(sector)
+
+        keep_left = left - STREAM_KEEP_MARGIN
+        keep_right = right + STREAM_KEEP_MARGIN
+        prefetch_left = left - STREAM_PREFETCH_MARGIN
+        prefetch_right = right + STREAM_PREFETCH_MARGIN
+        for sector in self.sectors:
+            if sector.active:
+                if sector.right <= keep_left or sector.left >= keep_right:
+                    self.deactivate(sector)
+            elif sector.right > prefetch_left and sector.left < prefetch_right:
+                if sector.prefetch is None:
+                    sector.prefetch = self.executor.submit(self.prepare, sector)
+            elif sector.prefetch is not None:
+                # Passed by without spawning; don't hold on to its surfaces
+                sector.prefetch.cancel()
+                sector.prefetch = None
+
+        self.despawn_outside(keep_left, keep_right)
+
+    def prepare(self, sector):
+        """Build a sector's static sprites and bake its chunks (runs on the worker thread)"""
+        sprites = [(key, kind, create_static(kind, entry)) for key, kind, entry in sector.statics]
+        chunk_width = self.game.static_layer.chunk_width
+        chunks = self.game.static_layer.bake(
+            [sprite for _, _, sprite in sprites], sector.left // chunk_width, (sector.right - 1) // chunk_width)
+        return sprites, chunks
+
+    def activate(self, sector):
+        """Put a sector's geometry and objects into the game"""
+        game = self.game
+        if sector.prefetch is None:
+            sector.prefetch = self.executor.submit(self.prepare, sector)
+        sprites, chunks = sector.prefetch.result()  # Only waits if the worker fell behind
+        sector.prefetch = None
+        sector.active = True
+
+        game.static_layer.add_chunks(chunks)
+        for key, kind, sprite in sprites:
+            record = self.static_sprites.get(key)
+            if record:
+                record[1] += 1  # Shared with a neighbouring sector that is already in
+                continue
+            self.static_sprites[key] = [sprite, 1]
+            group = game.pipes if kind == "pipes" else game.platforms
+            group.add(sprite)
+            game.all_sprites.add(sprite)
+            if kind == "pipes":
+                game.collision_system.add_static(pipes=[sprite])
+            else:
+                game.collision_system.add_static(platforms=[sprite])
+
+        for key, kind, entry in sector.entities:
+            if key in self.spent or key in self.live:
+                continue
+            sprite = game.spawn_level_entity(kind, entry)
+            state = self.saved.pop(key, None)
+            if state is not None:
+                sprite.set_state(state)
+            if kind == "jumping_blocks":
+                game.collision_system.add_static(jumping_blocks=[sprite])
+            for group in sprite.groups():
+                index = game.entity_indexes.get(group)
+                if index is not None:
+                    game.index_entity(index, sprite)
+            self.live[key] = sprite
+
+    def deactivate(self, sector):
+        """Take a sector's geometry out of the game; its objects despawn by position"""
+        game = self.game
+        chunk_width = game.static_layer.chunk_width
+        game.static_layer.remove_columns(sector.left // chunk_width, (sector.right - 1) // chunk_width)
+        for key, _, _ in sector.statics:
+            record = self.static_sprites[key]
+            record[1] -= 1
+            if record[1] == 0:
+                del self.static_sprites[key]
+                game.collision_system.remove_static(record[0])
+                record[0].kill()
+        sector.active = False
+
+    def despawn(self, sprite):
+        """Remove a sprite from the game and its grids"""
+        for group in sprite.groups():
+            index = self.game.entity_indexes.get(group)
+            if index is not None:
+                index.remove(sprite)
+        self.game.collision_system.remove_static(sprite)
+        sprite.kill()
+
+    def despawn_outside(self, left, right):
+        """Despawn objects that are gone or have moved beyond world x left to right"""
+        for key, sprite in list(self.live.items()):
+            if is_spent(sprite):
+                self.spent.add(key)
+            elif sprite.rect.right > left and sprite.rect.left < right:
+                continue
+            elif key[0] in PERSISTENT_KINDS:
+                self.saved[key] = sprite.get_state()
+            del self.live[key]
+            if sprite.alive() and (sprite.rect.right <= left or sprite.rect.left >= right):
+                self.despawn(sprite)
+            if key[0] == "enemies" and not sprite.alive():
+                self.game.enemy_manager.release(sprite)  # A respawn gets a fresh slot
+
+        # Power-ups released from blocks aren't level entries; they just vanish when left behind
+        for powerup in list(self.game.powerups):
+            if powerup.rect.right <= left or powerup.rect.left >= right:
+                self.despawn(powerup)
+
+        # Streamed levels can't be snapshotted, so power-ups that have left play go straight back to the pool
+        powerups = self.game.level_sprites[self.game.powerups]
+        if not all(powerup.alive() for powerup in powerups):
+            for powerup in powerups:
+                if not powerup.alive():
+                    self.game.release_powerup(powerup)
+            powerups[:] = [powerup for powerup in powerups if powerup.alive()]
+
+    def close(self):
+        """Stop prefetching and wait for the worker to finish"""
+        for sector in self.sectors:
+            if sector.prefetch is not None:
+                sector.prefetch.cancel()
+                sector.prefetch = None
+        self.executor.shutdown(wait=True)
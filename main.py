@@ -1,41 +1,93 @@
 import pygame
 import sys
 import os
+from settings import *
 from game import MarioGame
+from replay import ReplayRecorder
+from profiling import SpanTracer, open_sink, hot_path_spans
 
-def main():
+def run_fixed_steps(target, accumulator):
+    """Run the simulation steps owed by the accumulated real time, returning the time left over"""
+    steps = 0
+    while accumulator >= FIXED_TIMESTEP and steps < MAX_UPDATES_PER_FRAME:
+        target.update()
+        accumulator -= FIXED_TIMESTEP
+        steps += 1
+
+    # Drop the backlog if we hit the catch-up cap
+    if steps >= MAX_UPDATES_PER_FRAME:
+        accumulator = min(accumulator, FIXED_TIMESTEP)
+    return accumulator
+
+def main(record_path=None, trace_path=None):
     # Change to the directory containing this script so asset paths work correctly
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
+
     # Initialize Pygame
     pygame.init()
     pygame.mixer.init()
-    
+
     # Create game instance
     game = MarioGame()
-    
+
+    # When recording, start straight away and route input through the recorder
+    recorder = None
+    if record_path:
+        recorder = ReplayRecorder(game)
+        recorder.start()
+    target = recorder or game
+
+    # When tracing, time the hot paths of every frame into the trace file
+    tracer = None
+    if trace_path:
+        tracer = SpanTracer(open_sink(trace_path))
+        tracer.attach_all(hot_path_spans(game))
+
     # Game loop
     running = True
     clock = pygame.time.Clock()
-    
+    accumulator = 0.0
+
     while running:
+        # Measure real time since the last rendered frame (RENDER_FPS of 0 runs uncapped);
+        # static screens only redraw what changed, so they render at a lower rate
+        frame_time = clock.tick(IDLE_FPS if game.is_idle() else RENDER_FPS) / 1000.0
+
+        # Clamp long frames so a stall doesn't trigger a burst of catch-up steps
+        accumulator += min(frame_time, MAX_FRAME_TIME)
+
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
-            game.handle_event(event)
-        
-        # Update game
-        game.update()
-        
-        # Draw everything
-        game.draw()
-        
-        # Cap the frame rate
-        clock.tick(60)
-    
+            target.handle_event(event)
+
+        # Advance the simulation in fixed steps
+        accumulator = run_fixed_steps(target, accumulator)
+
+        # Draw everything, blending between the last two simulation steps
+        game.draw(accumulator / FIXED_TIMESTEP)
+        if tracer:
+            tracer.next_frame()
+
+    if tracer:
+        tracer.close()
+        print(f"Saved trace of {tracer.frame} frames to {trace_path}")
+
+    if recorder:
+        recorder.save(record_path)
+        print(f"Saved replay of {len(recorder.replay)} frames to {record_path}")
+
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # python main.py --record run.mrp records a replay that replay.py can play back
+    # python main.py --trace trace.json writes hot-path timings (.json Chrome trace, .jsonl or .csv)
+    record_path = None
+    trace_path = None
+    if "--record" in sys.argv[1:-1]:
+        record_path = os.path.abspath(sys.argv[sys.argv.index("--record") + 1])
+    if "--trace" in sys.argv[1:-1]:
+        trace_path = os.path.abspath(sys.argv[sys.argv.index("--trace") + 1])
+    main(record_path, trace_path)
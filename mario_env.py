@@ -0,0 +1,306 @@
+import multiprocessing
+import random
+from multiprocessing import shared_memory
+import numpy as np
+import pygame
+from settings import *
+from rng import RNG
+from game import MarioGame
+
+# Discrete actions as (left, right, jump) controls
+ACTIONS = [
+    (False, False, False),  # No-op
+    (True, False, False),  # Left
+    (False, True, False),  # Right
+    (False, False, True),  # Jump
+    (True, False, True),  # Left + jump
+    (False, True, True),  # Right + jump
+]
+
+# Entity observation layout
+PLAYER_FEATURES = 7  # x, y, velocity x, velocity y, on ground, big, invincible
+SLOT_FEATURES = 4  # present, dx, dy, kind-specific value
+FLAG_FEATURES = 3  # present, dx, dy
+
+class MarioEnv:
+    """Gym-style reset()/step(action) wrapper around a headless MarioGame
+
+    Observations are either a downsampled RGB frame ("frame", height x width x 3
+    uint8) or a fixed-size vector of the player and its nearest sprites
+    ("entities", float32). The random streams are process-wide, so seeded
+    episodes are only reproducible with one environment per process.
+    """
+
+    def __init__(self, level=0, frame_skip=ENV_FRAME_SKIP, observation="entities",
+                 frame_size=ENV_FRAME_SIZE, single_level=True, max_steps=ENV_MAX_STEPS):
+        if observation not in ("entities", "frame"):
+            raise ValueError(f"Unknown observation type: {observation}")
+
+        self.level = level
+        self.frame_skip = frame_skip
+        self.observation = observation
+        self.frame_size = frame_size
+        self.single_level = single_level  # End the episode when the level is complete
+        self.max_steps = max_steps
+
+        self.game = MarioGame(headless=True)
+        self.action_count = len(ACTIONS)
+        self.observation_shape, self.observation_dtype = self.observation_spec(observation, frame_size)
+        if observation == "frame":
+            self.frame_surface = pygame.Surface(frame_size)
+
+        # Episode tracking
+        self.steps = 0
+        self.best_x = 0
+
+    @staticmethod
+    def observation_spec(observation="entities", frame_size=ENV_FRAME_SIZE):
+        """Get the (shape, dtype) of an observation type"""
+        if observation == "frame":
+            return (frame_size[1], frame_size[0], 3), np.uint8
+        return (PLAYER_FEATURES + 4 * ENV_ENTITY_SLOTS * SLOT_FEATURES + FLAG_FEATURES,), np.float32
+
+    def reset(self, seed=None):
+        """Start a new episode, returning (observation, info)"""
+        if seed is not None:
+            RNG.seed(seed)
+        self.game.start_game(self.level)
+        self.steps = 0
+        self.best_x = self.game.player.rect.x
+        return self.observe(), self.info()
+
+    def step(self, action):
+        """Apply an action for frame_skip simulation steps
+
+        Returns (observation, reward, terminated, truncated, info).
+        """
+        game = self.game
+        controls = ACTIONS[action]
+        reward = 0.0
+        terminated = False
+
+        for _ in range(self.frame_skip):
+            score = game.score
+            lives = game.lives
+            level = game.current_level
+            state = game.game_state
+
+            game.player.controls = controls
+            game.update()
+            reward += self.step_reward(score, lives, level, state)
+
+            terminated = game.game_state in (GAME_OVER, GAME_WIN) or \
+                (self.single_level and game.game_state == LEVEL_COMPLETE)
+            if terminated:
+                break
+
+        self.steps += 1
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.observe(), reward, terminated, truncated, self.info()
+
+    def step_reward(self, score, lives, level, state):
+        """Reward for one simulation step given the state before it"""
+        game = self.game
+        reward = (game.score - score) * ENV_REWARD_PER_POINT
+        if game.lives < lives:
+            reward -= ENV_DEATH_PENALTY
+        if game.game_state == LEVEL_COMPLETE and state != LEVEL_COMPLETE:
+            reward += ENV_LEVEL_REWARD
+
+        # Only new rightward progress counts, so pacing back and forth earns nothing
+        if game.lives < lives or game.current_level != level:
+            self.best_x = game.player.rect.x  # Back at the start of a level
+        elif game.player.rect.x > self.best_x:
+            reward += (game.player.rect.x - self.best_x) * ENV_REWARD_PER_PIXEL
+            self.best_x = game.player.rect.x
+        return reward
+
+    def info(self):
+        """Get episode details that are not part of the observation"""
+        game = self.game
+        return {
+            "score": game.score,
+            "lives": game.lives,
+            "level": game.current_level,
+            "x": game.player.rect.x,
+            "state": game.game_state,
+            "steps": self.steps
+        }
+
+    def observe(self):
+        """Build the current observation"""
+        if self.observation == "frame":
+            return self.observe_frame()
+        return self.observe_entities()
+
+    def observe_frame(self):
+        """Render the game and downsample it to an RGB array"""
+        self.game.draw()
+        pygame.transform.scale(self.game.screen, self.frame_size, self.frame_surface)
+        return pygame.surfarray.array3d(self.frame_surface).transpose(1, 0, 2).copy()
+
+    def observe_entities(self):
+        """Describe the player and the nearest sprites of each kind as a float vector"""
+        game = self.game
+        player = game.player
+        obs = np.zeros(self.observation_shape, dtype=np.float32)
+
+        obs[:PLAYER_FEATURES] = (
+            player.rect.x / SCREEN_WIDTH, player.rect.y / SCREEN_HEIGHT,
+            player.velocity_x / PLAYER_SPEED, player.velocity_y / MAX_FALL_SPEED,
+            player.on_ground, player.powerup_state == "big", player.invincible_timer > 0)
+
+        # Nearest sprites in the simulated area, with a value per kind
+        active_rect = game.camera.get_active_rect(CULL_UPDATE_MARGIN)
+        kinds = (
+            (game.enemies, lambda enemy: enemy.velocity_x / ENEMY_SPEED),
+            (game.coins, lambda coin: 1.0),
+            (game.jumping_blocks, lambda block: not block.has_given_content),
+            (game.powerups, lambda powerup: powerup.powerup_type == "star"),
+        )
+        offset = PLAYER_FEATURES
+        for group, value in kinds:
+            sprites = game.entities_in(group, active_rect)
+            if sprites:
+                centers = np.array([sprite.rect.center for sprite in sprites], dtype=np.float32)
+                deltas = (centers - player.rect.center) / (SCREEN_WIDTH, SCREEN_HEIGHT)
+                nearest = np.argsort((deltas ** 2).sum(axis=1))[:ENV_ENTITY_SLOTS]
+                slots = obs[offset:offset + ENV_ENTITY_SLOTS * SLOT_FEATURES].reshape(ENV_ENTITY_SLOTS, SLOT_FEATURES)
+                slots[:len(nearest), 0] = 1.0
+                slots[:len(nearest), 1:3] = deltas[nearest]
+                slots[:len(nearest), 3] = [value(sprites[i]) for i in nearest]
+            offset += ENV_ENTITY_SLOTS * SLOT_FEATURES
+
+        for flag in game.flags:
+            obs[offset] = 1.0
+            obs[offset + 1] = (flag.rect.centerx - player.rect.centerx) / SCREEN_WIDTH
+            obs[offset + 2] = (flag.rect.centery - player.rect.centery) / SCREEN_HEIGHT
+            break
+        return obs
+
+def _worker(index, pipe, memory_name, shape, dtype, env_kwargs, seed):
+    """Run one MarioEnv in a child process, writing observations into shared memory
+
+    Forked workers start with a copy of the parent's random streams, so each
+    draws its episode seeds from its own stream instead: seeded from seed and
+    its index, or from fresh entropy when seed is None.
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    observations = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+    episode_seeds = random.Random(None if seed is None else f"{seed}:{index}")
+    RNG.seed(episode_seeds.randrange(1 << 32))
+    env = MarioEnv(**env_kwargs)
+    try:
+        while True:
+            command, data = pipe.recv()
+            if command == "step":
+                obs, reward, terminated, truncated, info = env.step(data)
+                if terminated or truncated:
+                    # Start the next episode straight away; the last observation travels in info
+                    info["final_observation"] = obs
+                    obs, _ = env.reset(episode_seeds.randrange(1 << 32))
+                observations[index] = obs
+                pipe.send((reward, terminated, truncated, info))
+            elif command == "reset":
+                if data is not None:
+                    episode_seeds.seed(data)  # Later automatic resets follow from the given seed too
+                obs, info = env.reset(episode_seeds.randrange(1 << 32))
+                observations[index] = obs
+                pipe.send(info)
+            elif command == "close":
+                break
+    finally:
+        memory.close()
+        pipe.close()
+
+class VectorMarioEnv:
+    """Runs several MarioEnvs in worker processes, sharing one observation buffer
+
+    Finished episodes reset automatically. reset() and step() return a view of
+    the shared buffer, which the next step overwrites; copy it to keep it.
+    Each environment plays different episodes; pass seed (here or to reset())
+    to make the whole set reproducible.
+    """
+
+    def __init__(self, num_envs, start_method=None, seed=None, **env_kwargs):
+        self.num_envs = num_envs
+
+        self.action_count = len(ACTIONS)
+        self.observation_shape, self.observation_dtype = MarioEnv.observation_spec(
+            env_kwargs.get("observation", "entities"), env_kwargs.get("frame_size", ENV_FRAME_SIZE))
+
+        shape = (num_envs,) + self.observation_shape
+        size = int(np.prod(shape)) * np.dtype(self.observation_dtype).itemsize
+        self.memory = shared_memory.SharedMemory(create=True, size=size)
+        self.observations = np.ndarray(shape, dtype=self.observation_dtype, buffer=self.memory.buf)
+
+        context = multiprocessing.get_context(start_method)
+        self.pipes = []
+        self.processes = []
+        for index in range(num_envs):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker, args=(index, child, self.memory.name, shape, self.observation_dtype, env_kwargs, seed),
+                daemon=True)
+            process.start()
+            child.close()
+            self.pipes.append(parent)
+            self.processes.append(process)
+        self.closed = False
+
+    def reset(self, seed=None):
+        """Reset every environment, returning (observations, infos)"""
+        for index, pipe in enumerate(self.pipes):
+            pipe.send(("reset", None if seed is None else seed + index))
+        infos = [pipe.recv() for pipe in self.pipes]
+        return self.observations, infos
+
+    def step_async(self, actions):
+        """Send one action to each environment without waiting"""
+        for pipe, action in zip(self.pipes, actions):
+            pipe.send(("step", int(action)))
+
+    def step_wait(self):
+        """Wait for the actions sent by step_async
+
+        Returns (observations, rewards, terminated, truncated, infos).
+        """
+        results = [pipe.recv() for pipe in self.pipes]
+        rewards = np.array([result[0] for result in results], dtype=np.float32)
+        terminated = np.array([result[1] for result in results], dtype=bool)
+        truncated = np.array([result[2] for result in results], dtype=bool)
+        infos = [result[3] for result in results]
+        return self.observations, rewards, terminated, truncated, infos
+
+    def step(self, actions):
+        """Step every environment with its action"""
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self):
+        """Stop the workers and free the shared buffer"""
+        if self.closed:
+            return
+        for pipe in self.pipes:
+            try:
+                pipe.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+        for pipe in self.pipes:
+            pipe.close()
+        del self.observations
+        self.memory.close()
+        self.memory.unlink()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        if not getattr(self, "closed", True):
+            self.close()
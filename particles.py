@@ -0,0 +1,132 @@
+import numpy as np
+import pygame
+from settings import *
+from rng import RNG
+
+class ParticleSystem:
+    """Shared particle engine keeping every particle in parallel NumPy arrays"""
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.allocate(capacity)
+
+        # Colours are stored as indices into a palette so sprites can be cached per colour
+        self.palette = []
+        self.palette_index = {}
+        self.dot_cache = {}  # (palette index, size) -> pre-rendered circle Surface
+
+        self.rng = RNG.numpy("particles")
+
+    def allocate(self, capacity):
+        """Create (or grow) the particle arrays, keeping live particles"""
+        old = getattr(self, "x", None)
+        arrays = {
+            "x": np.float32, "y": np.float32, "vx": np.float32, "vy": np.float32,
+            "gravity": np.float32, "life": np.int32, "size": np.int16, "color": np.int16, "alive": np.bool_
+        }
+        for name, dtype in arrays.items():
+            new = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                new[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def color_id(self, color):
+        """Get the palette index of an RGB colour"""
+        color = tuple(color[:3])
+        index = self.palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self.palette_index[color] = index
+        return index
+
+    def emit(self, count, x, y, vx, vy, life, color, size, gravity=0.0, spread_x=0, spread_y=0):
+        """Spawn a burst of particles
+
+        vx, vy, life and size are (low, high) ranges; life and size are inclusive
+        integer ranges. color is one RGB tuple or a list to pick from at random.
+        spread_x and spread_y jitter the spawn position by up to that many pixels.
+        """
+        if count <= 0:
+            return
+        if self.count + count > self.capacity:
+            self.allocate(max(self.capacity * 2, self.count + count))
+
+        rng = self.rng
+        start = self.count
+        end = start + count
+        self.x[start:end] = x + rng.integers(-spread_x, spread_x + 1, count)
+        self.y[start:end] = y + rng.integers(-spread_y, spread_y + 1, count)
+        self.vx[start:end] = rng.uniform(vx[0], vx[1], count)
+        self.vy[start:end] = rng.uniform(vy[0], vy[1], count)
+        self.life[start:end] = rng.integers(life[0], life[1] + 1, count)
+        self.size[start:end] = rng.integers(size[0], size[1] + 1, count)
+        self.gravity[start:end] = gravity
+
+        if isinstance(color[0], (tuple, list)):
+            choices = np.array([self.color_id(c) for c in color], dtype=np.int16)
+            self.color[start:end] = choices[rng.integers(0, len(choices), count)]
+        else:
+            self.color[start:end] = self.color_id(color)
+
+        self.count = end
+
+    def update(self):
+        """Integrate every particle one step and compact out the dead ones"""
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += self.gravity[:n]
+        self.life[:n] -= 1
+
+        # The mask is written into a preallocated slot array rather than a fresh one each step
+        alive = self.alive[:n]
+        np.greater(self.life[:n], 0, out=alive)
+        live_count = int(np.count_nonzero(alive))
+        if live_count < n:
+            for array in (self.x, self.y, self.vx, self.vy, self.gravity, self.life, self.size, self.color):
+                array[:live_count] = array[:n][alive]
+            self.count = live_count
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+
+    def dot(self, color_id, size):
+        """Get the pre-rendered circle for a colour and radius"""
+        key = (color_id, size)
+        dot = self.dot_cache.get(key)
+        if dot is None:
+            dot = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(dot, self.palette[color_id], (size, size), size)
+            self.dot_cache[key] = dot
+        return dot
+
+    def draw(self, screen, camera):
+        """Draw every on-screen particle in a single batched blit"""
+        n = self.count
+        if n == 0:
+            return 0
+
+        # Snap to whole world pixels, then shift by the same offset sprites and static chunks use
+        offset_x, offset_y = camera.view_offset()
+        sx = np.floor(self.x[:n] + 0.5) + offset_x
+        sy = np.floor(self.y[:n] + 0.5) + offset_y
+        size = self.size[:n]
+        width, height = screen.get_size()
+        visible = (sx + size >= 0) & (sx - size < width) & (sy + size >= 0) & (sy - size < height)
+        indices = np.flatnonzero(visible)
+        if len(indices) == 0:
+            return 0
+
+        left = (sx[indices] - size[indices]).astype(np.int32).tolist()
+        top = (sy[indices] - size[indices]).astype(np.int32).tolist()
+        colors = self.color[indices].tolist()
+        sizes = size[indices].tolist()
+        dot = self.dot
+        screen.blits([(dot(c, s), (px, py)) for c, s, px, py in zip(colors, sizes, left, top)], False)
+        return len(indices)
@@ -0,0 +1,166 @@
+import time
+from collections import deque
+import pygame
+from settings import *
+from text_cache import TEXT_CACHE
+from profiling import SectionProfiler, game_sections
+
+# Timed sections in display order, with their overlay labels
+OVERLAY_SECTIONS = (
+    ("input", "input"),
+    ("player", "player"),
+    ("enemies", "enemies"),
+    ("collision", "collision"),
+    ("particles", "particles"),
+    ("update", "update (rest)"),
+    ("draw_game", "draw_game"),
+    ("hud", "draw_ui"),
+    ("draw", "draw (rest)"),
+)
+
+class PerfOverlay:
+    """In-game panel with a rolling frame-time graph, section timings and draw counters
+
+    The section timers are only attached while the overlay is shown, so the
+    game runs unprofiled the rest of the time.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.enabled = False
+        self.profiler = SectionProfiler()
+
+        # Rolling history in milliseconds, one entry per drawn frame
+        self.frame_times = deque(maxlen=PERF_GRAPH_FRAMES)
+        self.section_times = {section: deque(maxlen=PERF_GRAPH_FRAMES) for section, _ in OVERLAY_SECTIONS}
+        self.last_frame = None
+
+        # Surfaces reused every frame
+        self.graph = pygame.Surface(PERF_GRAPH_SIZE)
+        self.panel = None
+        self.text_lines = []  # Rendered lines, refreshed every PERF_TEXT_INTERVAL frames
+        self.frames_until_text = 0
+
+    def toggle(self):
+        """Show or hide the overlay"""
+        self.set_enabled(not self.enabled)
+
+    def set_enabled(self, enabled):
+        """Show the overlay and attach the section timers, or hide it and detach them"""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self.profiler.attach_all(game_sections(self.game) + [(self.game, "draw_game", "draw_game")])
+        else:
+            self.profiler.detach()
+
+        # Start from an empty history so stale frames don't skew the averages
+        self.frame_times.clear()
+        for times in self.section_times.values():
+            times.clear()
+        self.last_frame = None
+        self.frames_until_text = 0
+
+    def record_frame(self):
+        """Close the current frame's measurements"""
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.frame_times.append((now - self.last_frame) * 1000.0)
+        self.last_frame = now
+
+        # Draw is still running, so its own time lands in the next frame's totals
+        totals = self.profiler.end_frame()
+        for section, times in self.section_times.items():
+            times.append(totals.get(section, 0.0) * 1000.0)
+
+    def draw(self, screen):
+        """Record the frame and draw the panel in the top-right corner, returning the area it covered"""
+        if not self.enabled:
+            return None
+        self.record_frame()
+
+        # The numbers change every frame, so they are rendered here rather than through
+        # the shared text cache, and only a few times a second so they stay readable
+        self.frames_until_text -= 1
+        if self.frames_until_text <= 0:
+            font = TEXT_CACHE.font(PERF_FONT_SIZE)
+            self.text_lines = [(font.render(label, True, color), font.render(value, True, color))
+                               for label, value, color in self.build_lines()]
+            self.frames_until_text = PERF_TEXT_INTERVAL
+
+        line_height = PERF_FONT_SIZE
+        width = PERF_GRAPH_SIZE[0] + 20
+        height = PERF_GRAPH_SIZE[1] + len(self.text_lines) * line_height + 30
+        x = SCREEN_WIDTH - width - 10
+        y = 10
+
+        # Translucent backing, rebuilt only when the panel grows or shrinks
+        if self.panel is None or self.panel.get_size() != (width, height):
+            self.panel = pygame.Surface((width, height))
+            self.panel.set_alpha(PERF_PANEL_ALPHA)
+            self.panel.fill(BLACK)
+        screen.blit(self.panel, (x, y))
+
+        self.draw_graph()
+        screen.blit(self.graph, (x + 10, y + 10))
+
+        text_y = y + PERF_GRAPH_SIZE[1] + 20
+        for label, value in self.text_lines:
+            screen.blit(label, (x + 10, text_y))
+            screen.blit(value, value.get_rect(topright=(x + width - 10, text_y)))
+            text_y += line_height
+        return pygame.Rect(x, y, width, height)
+
+    def build_lines(self):
+        """Get the overlay's (label, value, color) lines"""
+        game = self.game
+        lines = []
+
+        # Frame time summary over the rolling window
+        if self.frame_times:
+            average = sum(self.frame_times) / len(self.frame_times)
+            worst = max(self.frame_times)
+            fps = 1000.0 / average if average > 0 else 0.0
+            color = PERF_SLOW_COLOR if worst > PERF_HITCH_MS else PERF_TEXT_COLOR
+            lines.append((f"{fps:.1f} fps", f"frame {average:.2f} ms  max {worst:.2f} ms", color))
+        else:
+            lines.append(("Measuring...", "", PERF_TEXT_COLOR))
+
+        # Average exclusive time per section
+        for section, label in OVERLAY_SECTIONS:
+            times = self.section_times[section]
+            average = sum(times) / len(times) if times else 0.0
+            lines.append((label, f"{average:.2f} ms", PERF_TEXT_COLOR))
+
+        # Sprite counts per group
+        lines.append(("Sprites", f"enemies {len(game.enemies)}  coins {len(game.coins)}  blocks {len(game.jumping_blocks)}",
+                      PERF_TEXT_COLOR))
+        lines.append(("", f"power-ups {len(game.powerups)}  platforms {len(game.platforms)}", PERF_TEXT_COLOR))
+
+        # Blits issued by the last draw_game and live particles
+        stats = game.draw_stats
+        lines.append(("Blits", f"static {stats['static']}  sprites {stats['sprites']}  particles {stats['particles']}",
+                      PERF_TEXT_COLOR))
+        lines.append(("Particles", f"{game.particle_system.count} live", PERF_TEXT_COLOR))
+        lines.append(("Text cache", f"{len(TEXT_CACHE.surfaces)} / {TEXT_CACHE.max_entries}", PERF_TEXT_COLOR))
+        return lines
+
+    def draw_graph(self):
+        """Plot the frame-time history with a line at the simulation step"""
+        graph = self.graph
+        width, height = PERF_GRAPH_SIZE
+        graph.fill((20, 20, 20))
+
+        scale = height / PERF_GRAPH_MAX_MS
+        target_y = height - int(FIXED_TIMESTEP_MS * scale)
+        pygame.draw.line(graph, PERF_TARGET_COLOR, (0, target_y), (width, target_y))
+
+        # One bar per frame, newest on the right
+        bar_width = width / PERF_GRAPH_FRAMES
+        offset = PERF_GRAPH_FRAMES - len(self.frame_times)
+        for i, frame_time in enumerate(self.frame_times):
+            bar_height = min(height, int(frame_time * scale))
+            color = PERF_SLOW_COLOR if frame_time > PERF_HITCH_MS else PERF_GOOD_COLOR
+            left = int((offset + i) * bar_width)
+            graph.fill(color, (left, height - bar_height, max(1, int(bar_width)), bar_height))
@@ -1,5 +1,6 @@
 import pygame
 from settings import *
+from art import ART
 
 class Pipe(pygame.sprite.Sprite):
     def __init__(self, x, y, height=100, pipe_type="normal"):
@@ -17,59 +18,68 @@ class Pipe(pygame.sprite.Sprite):
         self.rect.bottom = y
         
     def create_pipe_sprite(self):
-        """Create pipe sprite based on type"""
-        self.image = pygame.Surface((60, self.height), pygame.SRCALPHA)
+        """Get the shared pipe sprite for this type and height"""
+        self.image = ART.get("pipe", self.pipe_type, (60, self.height))
+
+def draw_pipe(pipe_type, size):
+    """Draw a pipe of a type at (width, height)"""
+    width, height = size
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    
+    if pipe_type == "normal":
+        # Standard green pipe with Mario-style design
+        # Top cap (darker green)
+        pygame.draw.rect(image, (0, 120, 0), (0, 0, width, 25))
+        pygame.draw.rect(image, (0, 100, 0), (5, 5, 50, 15))
+        # Pipe body (main green)
+        pygame.draw.rect(image, (0, 150, 0), (5, 25, 50, height-25))
+        # Inner pipe (darker green)
+        pygame.draw.rect(image, (0, 100, 0), (10, 30, 40, height-35))
+        # Highlight lines
+        pygame.draw.line(image, (0, 200, 0), (10, 30), (10, height-5), 2)
+        pygame.draw.line(image, (0, 200, 0), (50, 30), (50, height-5), 2)
         
-        if self.pipe_type == "normal":
-            # Standard green pipe with Mario-style design
-            # Top cap (darker green)
-            pygame.draw.rect(self.image, (0, 120, 0), (0, 0, 60, 25))
-            pygame.draw.rect(self.image, (0, 100, 0), (5, 5, 50, 15))
-            # Pipe body (main green)
-            pygame.draw.rect(self.image, (0, 150, 0), (5, 25, 50, self.height-25))
-            # Inner pipe (darker green)
-            pygame.draw.rect(self.image, (0, 100, 0), (10, 30, 40, self.height-35))
-            # Highlight lines
-            pygame.draw.line(self.image, (0, 200, 0), (10, 30), (10, self.height-5), 2)
-            pygame.draw.line(self.image, (0, 200, 0), (50, 30), (50, self.height-5), 2)
+    elif pipe_type == "warp":
+        # Warp pipe (purple) with special design
+        # Top cap (darker purple)
+        pygame.draw.rect(image, (80, 0, 120), (0, 0, width, 25))
+        pygame.draw.rect(image, (60, 0, 100), (5, 5, 50, 15))
+        # Pipe body (main purple)
+        pygame.draw.rect(image, (100, 0, 150), (5, 25, 50, height-25))
+        # Inner pipe (darker purple)
+        pygame.draw.rect(image, (60, 0, 100), (10, 30, 40, height-35))
+        # Warp effect lines
+        pygame.draw.line(image, (150, 0, 200), (10, 30), (10, height-5), 2)
+        pygame.draw.line(image, (150, 0, 200), (50, 30), (50, height-5), 2)
+        # Add some sparkle effect
+        for i in range(0, height, 30):
+            pygame.draw.circle(image, (200, 100, 255), (30, i + 40), 2)
+            
+    elif pipe_type == "fire":
+        # Fire pipe (red/orange) with fire effect
+        # Top cap (dark red)
+        pygame.draw.rect(image, (120, 30, 0), (0, 0, width, 25))
+        pygame.draw.rect(image, (100, 20, 0), (5, 5, 50, 15))
+        # Pipe body (main red)
+        pygame.draw.rect(image, (150, 50, 0), (5, 25, 50, height-25))
+        # Inner pipe (darker red)
+        pygame.draw.rect(image, (100, 30, 0), (10, 30, 40, height-35))
+        # Fire effect lines
+        pygame.draw.line(image, (255, 100, 0), (10, 30), (10, height-5), 2)
+        pygame.draw.line(image, (255, 100, 0), (50, 30), (50, height-5), 2)
+        # Add fire effect dots
+        for i in range(0, height, 25):
+            pygame.draw.circle(image, (255, 150, 0), (30, i + 45), 3)
             
-        elif self.pipe_type == "warp":
-            # Warp pipe (purple) with special design
-            # Top cap (darker purple)
-            pygame.draw.rect(self.image, (80, 0, 120), (0, 0, 60, 25))
-            pygame.draw.rect(self.image, (60, 0, 100), (5, 5, 50, 15))
-            # Pipe body (main purple)
-            pygame.draw.rect(self.image, (100, 0, 150), (5, 25, 50, self.height-25))
-            # Inner pipe (darker purple)
-            pygame.draw.rect(self.image, (60, 0, 100), (10, 30, 40, self.height-35))
-            # Warp effect lines
-            pygame.draw.line(self.image, (150, 0, 200), (10, 30), (10, self.height-5), 2)
-            pygame.draw.line(self.image, (150, 0, 200), (50, 30), (50, self.height-5), 2)
-            # Add some sparkle effect
-            for i in range(0, self.height, 30):
-                pygame.draw.circle(self.image, (200, 100, 255), (30, i + 40), 2)
-                
-        elif self.pipe_type == "fire":
-            # Fire pipe (red/orange) with fire effect
-            # Top cap (dark red)
-            pygame.draw.rect(self.image, (120, 30, 0), (0, 0, 60, 25))
-            pygame.draw.rect(self.image, (100, 20, 0), (5, 5, 50, 15))
-            # Pipe body (main red)
-            pygame.draw.rect(self.image, (150, 50, 0), (5, 25, 50, self.height-25))
-            # Inner pipe (darker red)
-            pygame.draw.rect(self.image, (100, 30, 0), (10, 30, 40, self.height-35))
-            # Fire effect lines
-            pygame.draw.line(self.image, (255, 100, 0), (10, 30), (10, self.height-5), 2)
-            pygame.draw.line(self.image, (255, 100, 0), (50, 30), (50, self.height-5), 2)
-            # Add fire effect dots
-            for i in range(0, self.height, 25):
-                pygame.draw.circle(self.image, (255, 150, 0), (30, i + 45), 3)
-                
-        else:
-            # Default to normal pipe
-            pygame.draw.rect(self.image, (0, 120, 0), (0, 0, 60, 25))
-            pygame.draw.rect(self.image, (0, 100, 0), (5, 5, 50, 15))
-            pygame.draw.rect(self.image, (0, 150, 0), (5, 25, 50, self.height-25))
-            pygame.draw.rect(self.image, (0, 100, 0), (10, 30, 40, self.height-35))
-            pygame.draw.line(self.image, (0, 200, 0), (10, 30), (10, self.height-5), 2)
-            pygame.draw.line(self.image, (0, 200, 0), (50, 30), (50, self.height-5), 2) 
\ No newline at end of file
+    else:
+        # Default to normal pipe
+        pygame.draw.rect(image, (0, 120, 0), (0, 0, width, 25))
+        pygame.draw.rect(image, (0, 100, 0), (5, 5, 50, 15))
+        pygame.draw.rect(image, (0, 150, 0), (5, 25, 50, height-25))
+        pygame.draw.rect(image, (0, 100, 0), (10, 30, 40, height-35))
+        pygame.draw.line(image, (0, 200, 0), (10, 30), (10, height-5), 2)
+        pygame.draw.line(image, (0, 200, 0), (50, 30), (50, height-5), 2)
+    return image
+
+# Pipes of the same type and height share one drawing; they are baked into the static layer, not the atlas
+ART.register("pipe", draw_pipe, atlas=False)
@@ -1,7 +1,7 @@
 import pygame
-import math
-import random
 from settings import *
+from assets import ASSETS, load_image, load_sounds
+from text_cache import TEXT_CACHE
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
@@ -18,6 +18,7 @@ class Player(pygame.sprite.Sprite):
         self.is_jumping = False
         self.facing_right = True
         self.max_fall_speed = MAX_FALL_SPEED
+        self.ceiling_hits = []  # Jumping blocks bumped from below this step (set by the collision system)
         
         # Animation
         self.animation_timer = 0
@@ -31,9 +32,11 @@ class Player(pygame.sprite.Sprite):
         self.invincible_timer = 0
         self.invincible_duration = 2000  # 2 seconds
         
-        # Particle effects
-        self.particles = []
-        self.jump_particles = []
+        # Scripted controls as a (left, right, jump) tuple; None reads the keyboard
+        self.controls = None
+        
+        # Shared particle engine (set by the game)
+        self.particle_system = None
         
         # Sound effects
         self.sounds = {}
@@ -42,11 +45,15 @@ class Player(pygame.sprite.Sprite):
         # Load sprites
         self.load_sprites()
         self.base_image = self.idle_sprites[0]
-        self.image = self.base_image.copy()
+        self.image = self.base_image
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
         
+        # Position at the previous simulation step (for render interpolation)
+        self.prev_x = x
+        self.prev_y = y
+        
         # Collision system reference
         self.collision_system = None
         
@@ -55,34 +62,21 @@ class Player(pygame.sprite.Sprite):
         
     def load_sounds(self):
         """Load sound effects"""
-        try:
-            self.sounds["jump"] = pygame.mixer.Sound(SOUND_EFFECTS["jump"])
-            self.sounds["jump"].set_volume(0.7)  # Set jump sound volume
-            self.sounds["powerup"] = pygame.mixer.Sound(SOUND_EFFECTS["powerup"])
-            self.sounds["powerup"].set_volume(0.6)  # Set powerup sound volume
-            self.sounds["enemy_hit"] = pygame.mixer.Sound(SOUND_EFFECTS["enemy_hit"])
-            self.sounds["enemy_hit"].set_volume(0.5)  # Set enemy hit sound volume
-        except:
-            self.sounds = {}
+        self.sounds = load_sounds({
+            "jump": 0.7,  # Jump sound volume
+            "powerup": 0.6,  # Powerup sound volume
+            "enemy_hit": 0.5,  # Enemy hit sound volume
+        })
     
     def load_sprites(self):
         """Load Mario sprites from assets"""
         try:
             # Load base sprites
-            idle_sprite = pygame.image.load("assets/images/mario/idle.png").convert_alpha()
-            idle_sprite = pygame.transform.scale(idle_sprite, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            
-            jump_sprite = pygame.image.load("assets/images/mario/jump.png").convert_alpha()
-            jump_sprite = pygame.transform.scale(jump_sprite, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            
-            run1_sprite = pygame.image.load("assets/images/mario/run1.png").convert_alpha()
-            run1_sprite = pygame.transform.scale(run1_sprite, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            
-            run2_sprite = pygame.image.load("assets/images/mario/run2.png").convert_alpha()
-            run2_sprite = pygame.transform.scale(run2_sprite, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            
-            run3_sprite = pygame.image.load("assets/images/mario/run3.png").convert_alpha()
-            run3_sprite = pygame.transform.scale(run3_sprite, (PLAYER_WIDTH, PLAYER_HEIGHT))
+            idle_sprite = load_image(SPRITE_IMAGES["idle"], (PLAYER_WIDTH, PLAYER_HEIGHT))
+            jump_sprite = load_image(SPRITE_IMAGES["jump"], (PLAYER_WIDTH, PLAYER_HEIGHT))
+            run1_sprite = load_image(SPRITE_IMAGES["run1"], (PLAYER_WIDTH, PLAYER_HEIGHT))
+            run2_sprite = load_image(SPRITE_IMAGES["run2"], (PLAYER_WIDTH, PLAYER_HEIGHT))
+            run3_sprite = load_image(SPRITE_IMAGES["run3"], (PLAYER_WIDTH, PLAYER_HEIGHT))
             
             # Create sprite lists
             self.idle_sprites = [idle_sprite]
@@ -92,6 +86,15 @@ class Player(pygame.sprite.Sprite):
         except Exception as e:
             print(f"Error loading sprites: {e}")
             self.create_fallback_sprites()
+        
+        # Prebuild facing and invincibility-blink variants of every frame
+        self.jump_index = len(self.idle_sprites)
+        self.run_index = self.jump_index + 1
+        self.frames = ASSETS.frames(
+            "mario",
+            lambda: self.idle_sprites + [self.jump_sprite] + self.run_sprites,
+            {"invincible": (255, 255, 255, 32)}  # Very subtle blink
+        )
     
     def create_fallback_sprites(self):
         """Create simple colored rectangles as fallback sprites"""
@@ -113,22 +116,32 @@ class Player(pygame.sprite.Sprite):
         run3.fill((100, 0, 0))
         self.run_sprites = [run1, run2, run3]
     
+    def read_controls(self):
+        """Return (left, right, jump) from the scripted controls or the keyboard"""
+        if self.controls is not None:
+            return self.controls
+        
+        keys = pygame.key.get_pressed()
+        return (keys[pygame.K_LEFT] or keys[pygame.K_a],
+                keys[pygame.K_RIGHT] or keys[pygame.K_d],
+                keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w])
+    
     def handle_input(self):
         """Handle keyboard input for player movement"""
-        keys = pygame.key.get_pressed()
+        left, right, jump = self.read_controls()
         
         # Horizontal movement
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if left:
             self.velocity_x = -PLAYER_SPEED
             self.facing_right = False
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        elif right:
             self.velocity_x = PLAYER_SPEED
             self.facing_right = True
         else:
             self.velocity_x = 0
             
         # Jumping
-        if (keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]) and self.on_ground:
+        if jump and self.on_ground:
             self.velocity_y = PLAYER_JUMP_SPEED
             self.on_ground = False
             self.is_jumping = True
@@ -138,66 +151,23 @@ class Player(pygame.sprite.Sprite):
     
     def create_jump_particles(self):
         """Create particle effects when jumping"""
-        for _ in range(8):
-            particle = {
-                'x': int(self.rect.centerx) + random.randint(-10, 10),
-                'y': int(self.rect.bottom),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-3, -1),
-                'life': random.randint(20, 40),
-                'color': (255, 255, 255)
-            }
-            self.jump_particles.append(particle)
+        if self.particle_system:
+            self.particle_system.emit(
+                8, self.rect.centerx, self.rect.bottom, vx=(-2, 2), vy=(-3, -1),
+                life=(20, 40), color=(255, 255, 255), size=(2, 2), gravity=0.2, spread_x=10)
     
     def create_powerup_particles(self, color):
         """Create particle effects for power-ups"""
-        for _ in range(PARTICLE_COUNT):
-            particle = {
-                'x': int(self.rect.centerx),
-                'y': int(self.rect.centery),
-                'vx': random.uniform(-PARTICLE_SPEED, PARTICLE_SPEED),
-                'vy': random.uniform(-PARTICLE_SPEED, PARTICLE_SPEED),
-                'life': PARTICLE_LIFETIME,
-                'color': color
-            }
-            self.particles.append(particle)
+        if self.particle_system:
+            self.particle_system.emit(
+                PARTICLE_COUNT, self.rect.centerx, self.rect.centery,
+                vx=(-PARTICLE_SPEED, PARTICLE_SPEED), vy=(-PARTICLE_SPEED, PARTICLE_SPEED),
+                life=(PARTICLE_LIFETIME, PARTICLE_LIFETIME), color=color, size=(3, 3))
     
-    def update_particles(self):
-        """Update particle effects"""
-        # Update jump particles
-        for particle in self.jump_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.2  # Gravity
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.jump_particles.remove(particle)
-        
-        # Update power-up particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-    
-    def draw_particles(self, screen, camera):
-        """Draw particle effects"""
-        # Draw jump particles
-        for particle in self.jump_particles:
-            alpha = int(255 * (particle['life'] / 40))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), 2)
-        
-        # Draw power-up particles
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / PARTICLE_LIFETIME))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), 3)
+    def store_previous(self):
+        """Remember the current position as the previous simulation step"""
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
     
     def update(self, platforms, jumping_blocks=None, pipes=None, enemies=None):
         """Update player physics and collision"""
@@ -213,7 +183,7 @@ class Player(pygame.sprite.Sprite):
         
         # Update power-up timers
         if self.powerup_timer > 0:
-            self.powerup_timer -= 16  # Assuming 60 FPS
+            self.powerup_timer -= FIXED_TIMESTEP_MS
             if self.powerup_timer <= 0:
                 self.powerup_state = "normal"
                 # Reset invincibility when star power-up expires
@@ -221,12 +191,11 @@ class Player(pygame.sprite.Sprite):
                     self.invincible_timer = 0
         
         if self.invincible_timer > 0:
-            self.invincible_timer -= 16
+            self.invincible_timer -= FIXED_TIMESTEP_MS
             if self.invincible_timer <= 0:
                 self.invincible_timer = 0
                 # Ensure the image is restored to normal when invincibility expires
-                if hasattr(self, 'base_image'):
-                    self.image = self.base_image.copy()
+                self.image = self.base_image
         
         # Update position using collision system if available
         if self.collision_system:
@@ -252,9 +221,6 @@ class Player(pygame.sprite.Sprite):
         # Update animation
         self.update_animation()
         
-        # Update particles
-        self.update_particles()
-        
         # Update frame count
         self.frame_count += 1
     
@@ -312,39 +278,31 @@ class Player(pygame.sprite.Sprite):
         """Update player animation based on state"""
         self.animation_timer += self.animation_speed
         
-        # Store the base image without any effects
+        # Pick the frame without any effects
         if self.is_jumping:
-            self.base_image = self.jump_sprite
+            frame = self.jump_index
         elif abs(self.velocity_x) > 0:
             if self.animation_timer >= 1:
                 self.animation_index = (self.animation_index + 1) % len(self.run_sprites)
                 self.animation_timer = 0
             self.animation_index = min(self.animation_index, len(self.run_sprites) - 1)
-            self.base_image = self.run_sprites[self.animation_index]
+            frame = self.run_index + self.animation_index
         else:
             if self.animation_timer >= 1:
                 self.animation_index = (self.animation_index + 1) % len(self.idle_sprites)
                 self.animation_timer = 0
             self.animation_index = min(self.animation_index, len(self.idle_sprites) - 1)
-            self.base_image = self.idle_sprites[self.animation_index]
-            
-        # Flip sprite based on direction
-        if not self.facing_right:
-            self.base_image = pygame.transform.flip(self.base_image, True, False)
+            frame = self.animation_index
         
-        # Create display image (copy of base image)
-        if hasattr(self, 'base_image') and self.base_image is not None:
-            self.image = self.base_image.copy()
-        else:
-            # Fallback if base_image is not available
-            self.image = self.idle_sprites[0].copy()
+        # Look up the prebuilt variant for the facing direction
+        flipped = not self.facing_right
+        self.base_image = self.frames.get(frame, flipped)
         
         # Apply invincibility effect - very subtle blinking
         if self.invincible_timer > 0 and self.frame_count % 12 < 6:
-            # Create a very subtle transparent overlay for blinking effect
-            overlay = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 32))  # Very subtle (32 instead of 64)
-            self.image.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            self.image = self.frames.get(frame, flipped, "invincible")
+        else:
+            self.image = self.base_image
             
     def apply_powerup(self, powerup_type):
         """Apply a power-up effect"""
@@ -384,34 +342,51 @@ class Player(pygame.sprite.Sprite):
         """Reset player to starting position"""
         self.rect.x = x
         self.rect.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.velocity_x = 0
         self.velocity_y = 0
         self.on_ground = False
         self.is_jumping = False
+        self.ceiling_hits = []
         self.powerup_state = "normal"
         self.powerup_timer = 0
         self.invincible_timer = 0
-        self.particles.clear()
-        self.jump_particles.clear()
         
         # Ensure the image is restored to normal
-        if hasattr(self, 'base_image') and self.base_image is not None:
-            self.image = self.base_image.copy()
-        else:
-            self.image = self.idle_sprites[0].copy()
+        self.image = self.base_image
+    
+    def get_state(self):
+        """Get physics, animation and power-up state as a list of numbers"""
+        return [self.rect.x, self.rect.y, self.prev_x, self.prev_y, self.velocity_x, self.velocity_y,
+                self.on_ground, self.is_jumping, self.facing_right, self.animation_timer,
+                self.animation_index, self.frame_count, POWERUP_STATES.index(self.powerup_state),
+                self.powerup_timer, self.invincible_timer]
+    
+    def set_state(self, values):
+        """Restore state from get_state(); images catch up on the next update"""
+        (x, y, self.prev_x, self.prev_y, self.velocity_x, self.velocity_y, on_ground, is_jumping,
+         facing_right, self.animation_timer, animation_index, frame_count, powerup_state,
+         self.powerup_timer, self.invincible_timer) = values
+        self.rect.x = x
+        self.rect.y = y
+        self.on_ground = bool(on_ground)
+        self.is_jumping = bool(is_jumping)
+        self.facing_right = bool(facing_right)
+        self.animation_index = int(animation_index)
+        self.frame_count = int(frame_count)
+        self.powerup_state = POWERUP_STATES[int(powerup_state)]
     
     def draw(self, screen, camera):
-        """Draw the player with particles"""
-        # Draw particles first
-        self.draw_particles(screen, camera)
-        
-        # Draw the player
+        """Draw the player"""
+        # Draw the player at its interpolated position
         player_rect = camera.apply(self)
+        player_rect.topleft = camera.apply_pos(*camera.interpolate_pos(
+            self.rect.x, self.rect.y, self.prev_x, self.prev_y))
         screen.blit(self.image, player_rect)
         
         # Debug: Show power-up state
         if hasattr(camera, 'debug_mode') and camera.debug_mode:
-            font = pygame.font.Font(None, 24)
-            powerup_text = font.render(f"Power: {self.powerup_state}", True, (255, 255, 0))
+            powerup_text = TEXT_CACHE.render(f"Power: {self.powerup_state}", DEBUG_FONT_SIZE, (255, 255, 0))
             text_rect = powerup_text.get_rect(center=(player_rect.centerx, player_rect.top - 20))
             screen.blit(powerup_text, text_rect) 
\ No newline at end of file
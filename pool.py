@@ -0,0 +1,36 @@
+class Pool:
+    """Recycles objects that are costly to build, so gameplay doesn't allocate them
+
+    Objects are built by factory(*args) and must have a reset(*args) method
+    taking the same arguments, which returns them to a freshly built state.
+    Released objects beyond capacity are simply dropped.
+    """
+
+    def __init__(self, factory, capacity):
+        self.factory = factory
+        self.capacity = capacity
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        """Get a recycled object reset with args, or build a new one if none are free"""
+        if self.free:
+            item = self.free.pop()
+            item.reset(*args)
+            self.reused += 1
+        else:
+            item = self.factory(*args)
+            self.created += 1
+        return item
+
+    def release(self, item):
+        """Hand an object that has left play back for reuse"""
+        if len(self.free) < self.capacity:
+            self.free.append(item)
+
+    def prewarm(self, count, *args):
+        """Build objects ahead of time until count are free"""
+        for _ in range(min(count, self.capacity) - len(self.free)):
+            self.free.append(self.factory(*args))
+            self.created += 1
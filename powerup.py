@@ -1,20 +1,42 @@
 import pygame
 import math
-import random
 from settings import *
+from rng import RNG
+from assets import load_sounds
+from art import ART
+
+# Seeded stream for power-up sparkles, reproducible with RNG.seed()
+rng = RNG.stream("powerup")
 
 class PowerUp(pygame.sprite.Sprite):
     def __init__(self, x, y, powerup_type):
         super().__init__()
-        self.powerup_type = powerup_type
+        self.powerup_type = None
+        
+        # Shared particle engine (set by the game)
+        self.particle_system = None
+        
+        # Sound effects
+        self.sounds = {}
+        self.load_sounds()
+        
+        self.reset(x, y, powerup_type)
+        
+    def reset(self, x, y, powerup_type):
+        """Return to a freshly spawned state, so the game's pool can reuse this power-up"""
         self.x = x
         self.y = y
         
         # Get power-up properties
-        self.properties = POWERUP_TYPES.get(powerup_type, {})
-        self.color = self.properties.get("color", WHITE)
-        self.effect = self.properties.get("effect", "none")
-        self.points = self.properties.get("points", 100)
+        if powerup_type != self.powerup_type:
+            self.powerup_type = powerup_type
+            self.properties = POWERUP_TYPES.get(powerup_type, {})
+            self.color = self.properties.get("color", WHITE)
+            self.effect = self.properties.get("effect", "none")
+            self.points = self.properties.get("points", 100)
+            
+            # Create sprite (shared by every power-up of this type)
+            self.image = ART.get("powerup", powerup_type, (POWERUP_SIZE, POWERUP_SIZE))
         
         # Animation properties
         self.animation_timer = 0
@@ -23,171 +45,31 @@ class PowerUp(pygame.sprite.Sprite):
         self.original_y = y
         self.rotation_angle = 0
         
-        # Particle effects
-        self.particles = []
-        self.collect_particles = []
-        
         # State
         self.is_collected = False
         self.collect_timer = 0
         
-        # Create sprite
-        self.create_sprite()
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
         
-        # Sound effects
-        self.sounds = {}
-        self.load_sounds()
-        
     def load_sounds(self):
         """Load sound effects"""
-        try:
-            self.sounds["powerup"] = pygame.mixer.Sound(SOUND_EFFECTS["powerup"])
-        except:
-            self.sounds = {}
-    
-    def create_sprite(self):
-        """Create the power-up sprite"""
-        size = POWERUP_SIZE
-        
-        if self.powerup_type == "mushroom":
-            self.create_mushroom_sprite(size)
-        elif self.powerup_type == "star":
-            self.create_star_sprite(size)
-        else:
-            self.create_generic_sprite(size)
-    
-    def create_mushroom_sprite(self, size):
-        """Create mushroom sprite"""
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        
-        # Mushroom cap (red)
-        cap_radius = size // 3
-        cap_center = (size // 2, size // 3)
-        pygame.draw.circle(self.image, RED, cap_center, cap_radius)
-        
-        # Mushroom stem (brown)
-        stem_rect = pygame.Rect(size // 2 - 4, size // 3, 8, size // 2)
-        pygame.draw.rect(self.image, BROWN, stem_rect)
-        
-        # White spots on cap
-        spot_positions = [
-            (cap_center[0] - 5, cap_center[1] - 3),
-            (cap_center[0] + 5, cap_center[1] - 3),
-            (cap_center[0], cap_center[1] + 2)
-        ]
-        for pos in spot_positions:
-            pygame.draw.circle(self.image, WHITE, pos, 3)
-        
-        # Add border
-        pygame.draw.circle(self.image, BLACK, cap_center, cap_radius, 2)
-    
-    def create_star_sprite(self, size):
-        """Create star sprite"""
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        
-        center = (size // 2, size // 2)
-        star_radius = size // 3
-        
-        # Draw star
-        points = []
-        for i in range(10):
-            angle = i * math.pi / 5
-            radius = star_radius if i % 2 == 0 else star_radius // 2
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            points.append((x, y))
-        
-        if len(points) >= 3:
-            pygame.draw.polygon(self.image, self.color, points)
-            pygame.draw.polygon(self.image, BLACK, points, 2)
-    
-    def create_generic_sprite(self, size):
-        """Create generic power-up sprite"""
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        
-        # Draw a simple circle
-        center = (size // 2, size // 2)
-        radius = size // 3
-        pygame.draw.circle(self.image, self.color, center, radius)
-        pygame.draw.circle(self.image, BLACK, center, radius, 2)
-        
-        # Add a question mark
-        font = pygame.font.Font(None, size // 2)
-        text = font.render("?", True, BLACK)
-        text_rect = text.get_rect(center=center)
-        self.image.blit(text, text_rect)
+        self.sounds = load_sounds({"powerup": None})
     
     def create_sparkle_particles(self):
         """Create sparkle particles around the power-up"""
-        for _ in range(4):
-            particle = {
-                'x': int(self.rect.centerx) + random.randint(-15, 15),
-                'y': int(self.rect.centery) + random.randint(-15, 15),
-                'vx': random.uniform(-0.5, 0.5),
-                'vy': random.uniform(-0.5, 0.5),
-                'life': random.randint(40, 80),
-                'max_life': random.randint(40, 80),
-                'color': self.color,
-                'size': random.randint(2, 4)
-            }
-            self.particles.append(particle)
+        if self.particle_system:
+            self.particle_system.emit(
+                4, self.rect.centerx, self.rect.centery, vx=(-0.5, 0.5), vy=(-0.5, 0.5),
+                life=(40, 80), color=self.color, size=(2, 4), spread_x=15, spread_y=15)
     
     def create_collect_particles(self):
         """Create particles when power-up is collected"""
-        for _ in range(15):
-            particle = {
-                'x': int(self.rect.centerx),
-                'y': int(self.rect.centery),
-                'vx': random.uniform(-4, 4),
-                'vy': random.uniform(-6, -2),
-                'life': random.randint(30, 60),
-                'color': self.color,
-                'size': random.randint(3, 6)
-            }
-            self.collect_particles.append(particle)
-    
-    def update_particles(self):
-        """Update particle effects"""
-        # Update sparkle particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                # Reset particle
-                particle['life'] = particle['max_life']
-                particle['x'] = int(self.rect.centerx) + random.randint(-15, 15)
-                particle['y'] = int(self.rect.centery) + random.randint(-15, 15)
-        
-        # Update collect particles
-        for particle in self.collect_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.3  # Gravity
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.collect_particles.remove(particle)
-    
-    def draw_particles(self, screen, camera):
-        """Draw particle effects"""
-        # Draw sparkle particles
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), particle['size'])
-        
-        # Draw collect particles
-        for particle in self.collect_particles:
-            alpha = int(255 * (particle['life'] / 60))
-            # Convert to RGB color (pygame.draw.circle doesn't support alpha)
-            color = particle['color'][:3]  # Take only RGB components
-            pos = camera.apply_pos(particle['x'], particle['y'])
-            pygame.draw.circle(screen, color, (int(pos[0]), int(pos[1])), particle['size'])
+        if self.particle_system:
+            self.particle_system.emit(
+                15, self.rect.centerx, self.rect.centery, vx=(-4, 4), vy=(-6, -2),
+                life=(30, 60), color=self.color, size=(3, 6), gravity=0.3)
     
     def update(self):
         """Update power-up animation and state"""
@@ -204,16 +86,13 @@ class PowerUp(pygame.sprite.Sprite):
                     self.rotation_angle = 0
             
             # Create sparkle particles occasionally
-            if random.random() < 0.02:  # 2% chance per frame
+            if rng.random() < 0.02:  # 2% chance per frame
                 self.create_sparkle_particles()
         else:
             # Collection animation
             self.collect_timer += 1
             if self.collect_timer > 30:  # Remove after 30 frames
                 self.kill()
-        
-        # Update particles
-        self.update_particles()
     
     def collect(self):
         """Handle power-up collection"""
@@ -225,11 +104,31 @@ class PowerUp(pygame.sprite.Sprite):
             if "powerup" in self.sounds:
                 self.sounds["powerup"].play()
     
+    def get_state(self):
+        """Get type, position and animation state as a list of numbers"""
+        return [list(POWERUP_TYPES).index(self.powerup_type), self.x, self.original_y, self.rect.x,
+                self.rect.y, self.animation_timer, self.bob_offset, self.rotation_angle,
+                self.is_collected, self.collect_timer]
+    
+    def set_state(self, values):
+        """Restore state from get_state()"""
+        (powerup_type, x, original_y, rect_x, rect_y, animation_timer, bob_offset,
+         rotation_angle, is_collected, collect_timer) = values
+        powerup_type = list(POWERUP_TYPES)[int(powerup_type)]
+        if powerup_type != self.powerup_type:
+            self.reset(int(x), int(original_y), powerup_type)
+        self.animation_timer = animation_timer
+        self.x = int(x)
+        self.original_y = int(original_y)
+        self.rect.x = rect_x
+        self.rect.y = rect_y
+        self.bob_offset = int(bob_offset)
+        self.rotation_angle = int(rotation_angle)
+        self.is_collected = bool(is_collected)
+        self.collect_timer = int(collect_timer)
+    
     def draw(self, screen, camera):
-        """Draw the power-up with particles"""
-        # Draw particles first
-        self.draw_particles(screen, camera)
-        
+        """Draw the power-up"""
         if not self.is_collected:
             # Apply rotation for star
             if self.powerup_type == "star":
@@ -240,4 +139,79 @@ class PowerUp(pygame.sprite.Sprite):
             else:
                 # Draw normally
                 powerup_rect = camera.apply(self)
-                screen.blit(self.image, powerup_rect) 
\ No newline at end of file
+                screen.blit(self.image, powerup_rect)
+
+def draw_mushroom(size):
+    """Draw a mushroom"""
+    image = pygame.Surface((size, size), pygame.SRCALPHA)
+    
+    # Mushroom cap (red)
+    cap_radius = size // 3
+    cap_center = (size // 2, size // 3)
+    pygame.draw.circle(image, RED, cap_center, cap_radius)
+    
+    # Mushroom stem (brown)
+    stem_rect = pygame.Rect(size // 2 - 4, size // 3, 8, size // 2)
+    pygame.draw.rect(image, BROWN, stem_rect)
+    
+    # White spots on cap
+    spot_positions = [
+        (cap_center[0] - 5, cap_center[1] - 3),
+        (cap_center[0] + 5, cap_center[1] - 3),
+        (cap_center[0], cap_center[1] + 2)
+    ]
+    for pos in spot_positions:
+        pygame.draw.circle(image, WHITE, pos, 3)
+    
+    # Add border
+    pygame.draw.circle(image, BLACK, cap_center, cap_radius, 2)
+    return image
+
+def draw_star(size, color):
+    """Draw a star"""
+    image = pygame.Surface((size, size), pygame.SRCALPHA)
+    
+    center = (size // 2, size // 2)
+    star_radius = size // 3
+    
+    # Draw star
+    points = []
+    for i in range(10):
+        angle = i * math.pi / 5
+        radius = star_radius if i % 2 == 0 else star_radius // 2
+        x = center[0] + radius * math.cos(angle)
+        y = center[1] + radius * math.sin(angle)
+        points.append((x, y))
+    
+    if len(points) >= 3:
+        pygame.draw.polygon(image, color, points)
+        pygame.draw.polygon(image, BLACK, points, 2)
+    return image
+
+def draw_generic(size, color):
+    """Draw a generic power-up"""
+    image = pygame.Surface((size, size), pygame.SRCALPHA)
+    
+    # Draw a simple circle
+    center = (size // 2, size // 2)
+    radius = size // 3
+    pygame.draw.circle(image, color, center, radius)
+    pygame.draw.circle(image, BLACK, center, radius, 2)
+    
+    # Add a question mark
+    font = pygame.font.Font(None, size // 2)
+    text = font.render("?", True, BLACK)
+    text_rect = text.get_rect(center=center)
+    image.blit(text, text_rect)
+    return image
+
+def draw_powerup(powerup_type, size):
+    """Draw a power-up of a type at (width, height)"""
+    color = POWERUP_TYPES.get(powerup_type, {}).get("color", WHITE)
+    if powerup_type == "mushroom":
+        return draw_mushroom(size[0])
+    if powerup_type == "star":
+        return draw_star(size[0], color)
+    return draw_generic(size[0], color)
+
+ART.register("powerup", draw_powerup)
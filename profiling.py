@@ -0,0 +1,247 @@
+import csv
+import functools
+import json
+import time
+from collections import deque
+from settings import *
+from player import Player
+
+# Marks a method that was inherited rather than set on the owner when it was wrapped
+INHERITED = object()
+
+class MethodHooks:
+    """Base for tools that time methods by wrapping them with calls to their enter()/exit()
+
+    Methods are only wrapped between attach() calls and detach(), so nothing is
+    measured (or slowed down) while a tool is not attached.
+    """
+
+    def __init__(self):
+        self.patches = []  # (owner, name, wrapper) of every method this tool wrapped
+        self.stack = []  # Open sections, innermost last
+
+    def attach(self, owner, name, section):
+        """Wrap owner.name (a class or an instance method) so its calls count towards section"""
+        method = getattr(owner, name)
+        hooks = self
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            if not timed.hooked:
+                return method(*args, **kwargs)  # Detached, but still called by a later tool's wrapper
+            hooks.enter(section)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                hooks.exit()
+
+        timed.hooked = True
+        timed.previous = vars(owner).get(name, INHERITED)  # Exactly what was on owner before
+        setattr(owner, name, timed)
+        self.patches.append((owner, name, timed))
+
+    def attach_all(self, sections):
+        """Wrap every (owner, method name, section) triple"""
+        for owner, name, section in sections:
+            self.attach(owner, name, section)
+
+    def detach(self):
+        """Restore every wrapped method, leaving other tools' wrappers in place
+
+        Tools may detach in any order. A wrapper another tool has wrapped again
+        can't be taken out of that chain, so it just stops timing; it is
+        dropped once the wrapper above it is removed.
+        """
+        for owner, name, timed in reversed(self.patches):
+            timed.hooked = False
+            if vars(owner).get(name) is not timed:
+                continue
+            previous = timed.previous
+            while previous is not INHERITED and getattr(previous, "hooked", True) is False:
+                previous = previous.previous  # Skip wrappers whose tools already detached
+            if previous is INHERITED:
+                delattr(owner, name)  # Fall back to the inherited method
+            else:
+                setattr(owner, name, previous)
+        self.patches.clear()
+        self.stack.clear()
+
+class SectionProfiler(MethodHooks):
+    """Times named sections by wrapping methods, charging nested calls to the innermost section"""
+
+    def __init__(self):
+        super().__init__()
+        self.totals = {}  # section -> exclusive seconds since the last end_frame()
+        self.counts = {}  # section -> calls since the last end_frame()
+
+    def enter(self, section):
+        """Start timing a section"""
+        self.stack.append([section, time.perf_counter(), 0.0])
+
+    def exit(self):
+        """Stop timing the innermost section"""
+        section, start, nested = self.stack.pop()
+        elapsed = time.perf_counter() - start
+        self.totals[section] = self.totals.get(section, 0.0) + elapsed - nested
+        self.counts[section] = self.counts.get(section, 0) + 1
+        if self.stack:
+            self.stack[-1][2] += elapsed
+
+    def end_frame(self):
+        """Get {section: exclusive seconds} since the last call and start a new frame"""
+        totals = self.totals
+        self.totals = {}
+        self.counts = {}
+        return totals
+
+def game_sections(game):
+    """The standard (owner, method, section) hooks for a MarioGame and its classes"""
+    collision = game.collision_system
+    return [
+        (game, "update", "update"),
+        (Player, "handle_input", "input"),
+        (Player, "update", "player"),
+        (game.enemy_manager, "update", "enemies"),
+        (collision, "update_player_collisions", "collision"),
+        (collision, "check_coin_collisions", "collision"),
+        (collision, "check_enemy_collisions", "collision"),
+        (game, "check_block_hits", "collision"),
+        (game, "check_powerup_collection", "collision"),
+        (game, "check_level_complete", "collision"),
+        (game.particle_system, "update", "particles"),
+        (game, "draw", "draw"),
+        (game, "draw_ui", "hud"),
+        (game, "draw_floating_scores", "hud"),
+    ]
+
+class SpanTracer(MethodHooks):
+    """Records every call of the hooked methods as a timed span in a sink
+
+    Spans carry the frame number from next_frame(), their start time in seconds
+    since the tracer was created, their duration and their nesting depth.
+    """
+
+    def __init__(self, sink):
+        super().__init__()
+        self.sink = sink
+        self.frame = 0
+        self.origin = time.perf_counter()
+
+    def enter(self, section):
+        """Open a span"""
+        self.stack.append((section, time.perf_counter()))
+
+    def exit(self):
+        """Close the innermost span and hand it to the sink"""
+        section, start = self.stack.pop()
+        duration = time.perf_counter() - start
+        self.sink.record(section, self.frame, start - self.origin, duration, len(self.stack))
+
+    def next_frame(self):
+        """Count a frame; later spans are tagged with the new frame number"""
+        self.frame += 1
+
+    def close(self):
+        """Unhook every method and flush the sink"""
+        self.detach()
+        self.sink.close()
+
+class RingBufferSink:
+    """Keeps the most recent spans in memory as (name, frame, start, duration, depth) tuples"""
+
+    def __init__(self, capacity=TRACE_RING_CAPACITY):
+        self.spans = deque(maxlen=capacity)
+
+    def record(self, name, frame, start, duration, depth):
+        self.spans.append((name, frame, start, duration, depth))
+
+    def close(self):
+        pass
+
+class CsvSink:
+    """Writes one CSV row per span, with times in microseconds"""
+
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(("name", "frame", "start_us", "duration_us", "depth"))
+
+    def record(self, name, frame, start, duration, depth):
+        self.writer.writerow((name, frame, round(start * 1e6, 1), round(duration * 1e6, 1), depth))
+
+    def close(self):
+        self.file.close()
+
+class JsonLinesSink:
+    """Writes one JSON object per line per span, with times in microseconds"""
+
+    def __init__(self, path):
+        self.file = open(path, "w")
+
+    def record(self, name, frame, start, duration, depth):
+        self.file.write(json.dumps({
+            "name": name,
+            "frame": frame,
+            "start_us": round(start * 1e6, 1),
+            "duration_us": round(duration * 1e6, 1),
+            "depth": depth
+        }) + "\n")
+
+    def close(self):
+        self.file.close()
+
+class ChromeTraceSink:
+    """Writes spans as Chrome trace events, viewable in chrome://tracing or Perfetto"""
+
+    def __init__(self, path):
+        self.file = open(path, "w")
+        self.file.write('{"traceEvents": [\n')
+        self.first = True
+
+    def record(self, name, frame, start, duration, depth):
+        # Complete ("X") events; the viewer nests them by time on the single thread
+        event = json.dumps({
+            "name": name,
+            "cat": name.split(".")[0],
+            "ph": "X",
+            "ts": round(start * 1e6, 3),
+            "dur": round(duration * 1e6, 3),
+            "pid": 1,
+            "tid": 1,
+            "args": {"frame": frame}
+        })
+        self.file.write(event if self.first else ",\n" + event)
+        self.first = False
+
+    def close(self):
+        self.file.write('\n], "displayTimeUnit": "ms"}\n')
+        self.file.close()
+
+def open_sink(path):
+    """Open a file sink chosen by extension: .csv, .jsonl or .json (Chrome trace)"""
+    if path.endswith(".csv"):
+        return CsvSink(path)
+    if path.endswith(".jsonl"):
+        return JsonLinesSink(path)
+    if path.endswith(".json"):
+        return ChromeTraceSink(path)
+    raise ValueError(f"Unknown trace format for {path}: use .csv, .jsonl or .json")
+
+def hot_path_spans(game):
+    """The (owner, method, span name) hooks around the per-frame hot paths"""
+    collision = game.collision_system
+    return [
+        (game, "update", "update"),
+        (collision, "update_player_collisions", "collision.player"),
+        (game.enemy_manager, "update", "enemy.update"),
+        (game, "check_block_hits", "check.blocks"),
+        (game, "check_powerup_collection", "check.powerups"),
+        (game, "check_coin_collection", "check.coins"),
+        (game, "draw", "draw"),
+        (game, "draw_menu", "draw.menu"),
+        (game, "draw_game", "draw.game"),
+        (game, "draw_pause_screen", "draw.pause"),
+        (game, "draw_game_over", "draw.game_over"),
+        (game, "draw_level_complete", "draw.level_complete"),
+        (game, "draw_game_win", "draw.game_win"),
+    ]
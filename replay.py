@@ -0,0 +1,237 @@
+import sys
+import time
+import struct
+import zlib
+from array import array
+import pygame
+from settings import *
+from rng import RNG
+from game import MarioGame
+from profiling import SpanTracer, open_sink, hot_path_spans
+
+# Replay file layout: header, then a zlib-compressed body of inputs, key events and checksums
+REPLAY_MAGIC = b"MREP"
+REPLAY_VERSION = 2  # Bump when a change to the simulation makes old recordings play back differently
+HEADER_FORMAT = "<4sHQBIII"  # magic, version, seed, level, frames, events, checksums
+EVENT_FORMAT = "<II"  # frame, key
+CHECKSUM_FORMAT = "<II"  # frame, crc32
+
+# Input bits stored per frame
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+
+def pack_controls(left, right, jump):
+    """Pack (left, right, jump) into one byte"""
+    return (INPUT_LEFT if left else 0) | (INPUT_RIGHT if right else 0) | (INPUT_JUMP if jump else 0)
+
+def unpack_controls(bits):
+    """Unpack a byte into (left, right, jump)"""
+    return (bool(bits & INPUT_LEFT), bool(bits & INPUT_RIGHT), bool(bits & INPUT_JUMP))
+
+def state_checksum(game):
+    """Get a CRC32 of the simulation state that affects gameplay"""
+    player = game.player
+    values = [game.score, game.lives, game.current_level,
+              player.rect.x, player.rect.y, player.velocity_x, player.velocity_y,
+              player.on_ground, player.powerup_timer, player.invincible_timer,
+              game.camera.x, game.camera.y]
+    for enemy in game.enemies:
+        values += [enemy.rect.x, enemy.rect.y, enemy.velocity_x, enemy.velocity_y,
+                   enemy.is_alive, enemy.stun_timer, enemy.behavior_timer]
+    for coin in game.coins:
+        values += [coin.rect.x, coin.rect.y]
+    for block in game.jumping_blocks:
+        values += [block.rect.y, block.is_hit, block.has_given_points, block.has_given_content]
+    for powerup in game.powerups:
+        values += [powerup.rect.x, powerup.rect.y, powerup.is_collected]
+
+    crc = zlib.crc32(game.game_state.encode())
+    crc = zlib.crc32(player.powerup_state.encode(), crc)
+    return zlib.crc32(array("d", values).tobytes(), crc)
+
+class Replay:
+    """A recorded run: seed, start level, per-frame inputs, key presses and state checksums"""
+
+    def __init__(self, seed, level=0):
+        self.seed = seed
+        self.level = level
+        self.inputs = bytearray()  # One packed controls byte per simulation step
+        self.events = []  # (frame, key) for key presses handled before that frame's update
+        self.checksums = {}  # frame -> state checksum after that many updates
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def save(self, path):
+        """Write the replay to a file"""
+        body = bytearray(self.inputs)
+        for frame, key in self.events:
+            body += struct.pack(EVENT_FORMAT, frame, key)
+        for frame, checksum in sorted(self.checksums.items()):
+            body += struct.pack(CHECKSUM_FORMAT, frame, checksum)
+
+        header = struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.level,
+                             len(self.inputs), len(self.events), len(self.checksums))
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(zlib.compress(bytes(body)))
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay from a file"""
+        with open(path, "rb") as f:
+            data = f.read()
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        magic, version, seed, level, frames, events, checksums = struct.unpack(HEADER_FORMAT, data[:header_size])
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay")
+
+        body = zlib.decompress(data[header_size:])
+        replay = cls(seed, level)
+        replay.inputs = bytearray(body[:frames])
+        offset = frames
+        for _ in range(events):
+            replay.events.append(struct.unpack_from(EVENT_FORMAT, body, offset))
+            offset += struct.calcsize(EVENT_FORMAT)
+        for _ in range(checksums):
+            frame, checksum = struct.unpack_from(CHECKSUM_FORMAT, body, offset)
+            replay.checksums[frame] = checksum
+            offset += struct.calcsize(CHECKSUM_FORMAT)
+        return replay
+
+class ReplayRecorder:
+    """Wraps a game to record every simulation step's input"""
+
+    def __init__(self, game, seed=None, level=0, checksum_interval=REPLAY_CHECKSUM_INTERVAL):
+        self.game = game
+        self.seed = seed
+        self.level = level
+        self.checksum_interval = checksum_interval
+        self.replay = None
+
+    def start(self):
+        """Reseed the random streams and start a new game to record"""
+        RNG.seed(self.seed)
+        self.replay = Replay(RNG.base_seed, self.level)
+        self.game.start_game(self.level)
+
+    def handle_event(self, event):
+        """Record a key press, then pass the event to the game"""
+        if event.type == pygame.KEYDOWN:
+            self.replay.events.append((len(self.replay.inputs), event.key))
+        self.game.handle_event(event)
+
+    def update(self):
+        """Advance the game one step, recording the controls it used"""
+        player = self.game.player
+        controls = player.read_controls()
+
+        # Freeze this step's controls so the recording matches what the game saw
+        scripted = player.controls
+        player.controls = controls
+        self.game.update()
+        player.controls = scripted
+
+        self.replay.inputs.append(pack_controls(*controls))
+        frame = len(self.replay.inputs)
+        if frame % self.checksum_interval == 0:
+            self.replay.checksums[frame] = state_checksum(self.game)
+
+    def save(self, path):
+        """Write the recording to a file"""
+        self.replay.save(path)
+
+class ReplayPlayer:
+    """Feeds a recorded run back into a game and checks its state checksums"""
+
+    def __init__(self, game, replay):
+        self.game = game
+        self.replay = replay
+        self.frame = 0
+        self.mismatches = []  # (frame, expected, actual)
+        self.events = {}  # frame -> keys pressed before that frame
+        for frame, key in replay.events:
+            self.events.setdefault(frame, []).append(key)
+
+    def start(self):
+        """Reseed the random streams and restart the game from the recording's start"""
+        RNG.seed(self.replay.seed)
+        self.game.start_game(self.replay.level)
+        self.frame = 0
+        self.mismatches = []
+
+    def finished(self):
+        """Check if every recorded step has been played"""
+        return self.frame >= len(self.replay.inputs)
+
+    def step(self, verify=True):
+        """Play one recorded step, returning False once the recording has ended"""
+        if self.finished():
+            return False
+
+        for key in self.events.get(self.frame, ()):
+            self.game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+        self.game.player.controls = unpack_controls(self.replay.inputs[self.frame])
+        self.game.update()
+        self.frame += 1
+
+        expected = self.replay.checksums.get(self.frame)
+        if verify and expected is not None:
+            actual = state_checksum(self.game)
+            if actual != expected:
+                self.mismatches.append((self.frame, expected, actual))
+        return True
+
+    def run(self, verify=True, render=False, on_step=None):
+        """Play the whole recording, returning the number of steps played"""
+        self.start()
+        while self.step(verify):
+            if render:
+                self.game.draw()
+            if on_step:
+                on_step()
+        return self.frame
+
+def main(args):
+    """Play a replay headless at full speed and report any desyncs"""
+    if not args:
+        print("Usage: python replay.py <replay file> [--render] [--no-verify] [--trace <trace file>]")
+        return 2
+
+    replay = Replay.load(args[0])
+    game = MarioGame(headless=True)
+    player = ReplayPlayer(game, replay)
+
+    # Optionally time the hot paths of every step into a trace file
+    tracer = None
+    if "--trace" in args[1:-1]:
+        trace_path = args[args.index("--trace") + 1]
+        tracer = SpanTracer(open_sink(trace_path))
+        tracer.attach_all(hot_path_spans(game))
+
+    start = time.perf_counter()
+    try:
+        frames = player.run(verify="--no-verify" not in args, render="--render" in args,
+                            on_step=tracer.next_frame if tracer else None)
+    finally:
+        if tracer:
+            tracer.close()
+    elapsed = time.perf_counter() - start
+    if tracer:
+        print(f"Wrote trace to {trace_path}")
+
+    print(f"Played {frames} frames in {elapsed:.2f}s ({frames / max(elapsed, 1e-9):.0f} fps)")
+    print(f"Final state: {game.game_state}, level {game.current_level + 1}, score {game.score}")
+    if player.mismatches:
+        frame, expected, actual = player.mismatches[0]
+        print(f"Desync: {len(player.mismatches)} checksum mismatches, first at frame {frame} "
+              f"(expected {expected:08x}, got {actual:08x})")
+        return 1
+    print(f"Verified {len(replay.checksums)} checksums")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
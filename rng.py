@@ -0,0 +1,72 @@
+import math
+import random
+import zlib
+from array import array
+import numpy as np
+from settings import *
+
+class RandomStreams:
+    """Seeded random generators with an independent stream per subsystem"""
+
+    def __init__(self, seed=None):
+        self.streams = {}  # name -> random.Random
+        self.numpy_streams = {}  # name -> numpy Generator
+        self.seed(seed)
+
+    def stream_seed(self, name):
+        """Get the seed of one subsystem's stream, derived from the base seed and its name"""
+        return (self.base_seed << 32) | zlib.crc32(name.encode())
+
+    def seed(self, seed=None):
+        """Reseed every stream in place; None picks a fresh random base seed"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(1 << 32)
+        self.base_seed = seed
+
+        # Existing generators are reseeded rather than replaced, so modules can keep references
+        for name, stream in self.streams.items():
+            stream.seed(self.stream_seed(name))
+        for name, generator in self.numpy_streams.items():
+            generator.bit_generator.state = np.random.PCG64(self.stream_seed(name)).state
+
+    def stream(self, name):
+        """Get the random.Random stream for a subsystem"""
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = random.Random(self.stream_seed(name))
+            self.streams[name] = stream
+        return stream
+
+    def numpy(self, name):
+        """Get the NumPy Generator stream for a subsystem"""
+        generator = self.numpy_streams.get(name)
+        if generator is None:
+            generator = np.random.Generator(np.random.PCG64(self.stream_seed(name)))
+            self.numpy_streams[name] = generator
+        return generator
+
+    def get_state(self, names):
+        """Get the state of the named random.Random streams as a flat float64 array"""
+        values = np.empty(len(names) * STREAM_STATE_SIZE, dtype=np.float64)
+        offset = 0
+        for name in names:
+            version, internal, gauss_next = self.stream(name).getstate()
+            values[offset:offset + STREAM_STATE_SIZE - 1] = np.frombuffer(array("I", internal), dtype=np.uint32)
+            values[offset + STREAM_STATE_SIZE - 1] = math.nan if gauss_next is None else gauss_next
+            offset += STREAM_STATE_SIZE
+        return values
+
+    def set_state(self, values, names):
+        """Restore streams from a get_state() array with the same names"""
+        offset = 0
+        for name in names:
+            internal = tuple(values[offset:offset + STREAM_STATE_SIZE - 1].astype(np.int64).tolist())
+            gauss_next = float(values[offset + STREAM_STATE_SIZE - 1])
+            self.stream(name).setstate((3, internal, None if math.isnan(gauss_next) else gauss_next))
+            offset += STREAM_STATE_SIZE
+
+# Numbers per stream in get_state(): the Mersenne Twister words plus the cached gauss value
+STREAM_STATE_SIZE = len(random.Random().getstate()[1]) + 1
+
+# Shared streams; reseed with RNG.seed(n) to make a run reproducible
+RNG = RandomStreams()
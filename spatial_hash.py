@@ -0,0 +1,102 @@
+from settings import *
+
+class SpatialHash:
+    """Uniform grid that maps world cells to the objects overlapping them"""
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE, cell_height=None):
+        self.cell_size = cell_size
+        self.cell_height = cell_height or cell_size
+        self.cells = {}  # (column, row) -> list of objects
+        self.object_cells = {}  # object -> cells it was inserted into
+        self.order = {}  # object -> insertion index, keeps query results deterministic
+        self.next_order = 0
+
+    def __len__(self):
+        return len(self.object_cells)
+
+    def __contains__(self, obj):
+        return obj in self.object_cells
+
+    def cells_for(self, rect):
+        """Get the grid cells a rect overlaps"""
+        width = self.cell_size
+        height = self.cell_height
+        left = int(rect.left) // width
+        right = int(rect.right - 1) // width
+        top = int(rect.top) // height
+        bottom = int(rect.bottom - 1) // height
+        return [(column, row)
+                for column in range(left, right + 1)
+                for row in range(top, bottom + 1)]
+
+    def insert(self, obj, rect=None):
+        """Add an object, using its rect unless a larger bounding rect is given"""
+        if obj in self.object_cells:
+            self.remove(obj)
+        cells = self.cells_for(rect or obj.rect)
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(obj)
+        self.object_cells[obj] = cells
+        self.order[obj] = self.next_order
+        self.next_order += 1
+
+    def move(self, obj, rect=None):
+        """Update an object's cells after it moved, keeping its query order"""
+        old_cells = self.object_cells.get(obj)
+        if old_cells is None:
+            self.insert(obj, rect)
+            return
+        cells = self.cells_for(rect or obj.rect)
+        if cells == old_cells:
+            return
+        for cell in old_cells:
+            bucket = self.cells[cell]
+            bucket.remove(obj)
+            if not bucket:
+                del self.cells[cell]
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(obj)
+        self.object_cells[obj] = cells
+
+    def remove(self, obj):
+        """Remove an object from the grid"""
+        cells = self.object_cells.pop(obj, None)
+        if cells is None:
+            return
+        del self.order[obj]
+        for cell in cells:
+            bucket = self.cells[cell]
+            bucket.remove(obj)
+            if not bucket:
+                del self.cells[cell]
+
+    def query(self, rect):
+        """Get objects in the cells a rect overlaps, in insertion order"""
+        width = self.cell_size
+        height = self.cell_height
+        top = int(rect.top) // height
+        bottom = int(rect.bottom - 1) // height
+        cells = self.cells
+        buckets = []
+        for column in range(int(rect.left) // width, int(rect.right - 1) // width + 1):
+            for row in range(top, bottom + 1):
+                bucket = cells.get((column, row))
+                if bucket:
+                    buckets.append(bucket)
+
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            found = buckets[0]
+        else:
+            found = set()
+            for bucket in buckets:
+                found.update(bucket)
+        return sorted(found, key=self.order.__getitem__)
+
+    def clear(self):
+        """Remove every object"""
+        self.cells.clear()
+        self.object_cells.clear()
+        self.order.clear()
+        self.next_order = 0
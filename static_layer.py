@@ -0,0 +1,87 @@
+import pygame
+from settings import *
+from assets import is_headless
+
+class StaticChunk:
+    """One pre-rendered vertical strip of static level geometry"""
+
+    def __init__(self, x, y, image):
+        self.image = image
+        self.rect = image.get_rect(topleft=(x, y))
+
+class StaticLayer:
+    """Static level geometry baked at load time into fixed-width chunk surfaces"""
+
+    def __init__(self, chunk_width=STATIC_CHUNK_WIDTH):
+        self.chunk_width = chunk_width
+        self.chunks = {}  # column index -> StaticChunk
+
+    def clear(self):
+        """Drop all baked chunks"""
+        self.chunks.clear()
+
+    def build(self, sprites):
+        """Bake sprites that never move into chunk surfaces"""
+        self.clear()
+        self.add_chunks(self.bake(sprites))
+
+    def bake(self, sprites, first=None, last=None):
+        """Render the chunks covering sprites, or only columns first to last
+
+        Only touches new surfaces, so streamed levels run it on a worker thread;
+        add_chunks() then puts the chunks on screen from the main thread.
+        """
+        width = self.chunk_width
+
+        # Collect the sprites touching each column, keeping draw order
+        columns = {}
+        for sprite in sprites:
+            start = sprite.rect.left // width
+            end = (sprite.rect.right - 1) // width
+            if first is not None:
+                start = max(start, first)
+                end = min(end, last)
+            for column in range(start, end + 1):
+                columns.setdefault(column, []).append(sprite)
+
+        chunks = {}
+        for column, column_sprites in columns.items():
+            # Each chunk only covers the vertical extent of its own content
+            top = min(sprite.rect.top for sprite in column_sprites)
+            bottom = max(sprite.rect.bottom for sprite in column_sprites)
+            strip = pygame.Rect(column * width, top, width, bottom - top)
+
+            image = pygame.Surface(strip.size, pygame.SRCALPHA)
+            for sprite in column_sprites:
+                image.blit(sprite.image, (sprite.rect.x - strip.x, sprite.rect.y - strip.y))
+            chunks[column] = StaticChunk(strip.x, strip.y, image)
+        return chunks
+
+    def add_chunks(self, chunks):
+        """Show baked chunks, converting them for fast blitting"""
+        for column, chunk in chunks.items():
+            if not is_headless():
+                chunk.image = chunk.image.convert_alpha()
+            self.chunks[column] = chunk
+
+    def remove_columns(self, first, last):
+        """Drop the chunks of columns first to last"""
+        for column in range(first, last + 1):
+            self.chunks.pop(column, None)
+
+    def draw(self, screen, camera):
+        """Blit the chunks overlapping the camera view, returning the blit count"""
+        area = camera.get_visible_area()
+        first = int(area['left']) // self.chunk_width
+        last = int(area['right']) // self.chunk_width
+
+        blits = 0
+        for column in range(first, last + 1):
+            chunk = self.chunks.get(column)
+            if chunk is None:
+                continue
+            if chunk.rect.bottom < area['top'] or chunk.rect.top > area['bottom']:
+                continue
+            screen.blit(chunk.image, camera.apply_rect(chunk.rect))
+            blits += 1
+        return blits
@@ -0,0 +1,22 @@
+import os
+import sys
+
+# Run without a display or sound card
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# The game modules live flat in the repo root; append it so its platform.py can't shadow the stdlib one
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+import pytest
+
+@pytest.fixture
+def game():
+    """A headless game with a fixed seed, sitting on the first level"""
+    from game import MarioGame
+    game = MarioGame(headless=True, seed=1)
+    game.start_game(0)
+    yield game
+    game.clear_level()
@@ -0,0 +1,97 @@
+import threading
+import time
+import pygame
+from settings import *
+from assets import ASSETS, set_headless
+from art import ArtFactory
+from atlas import TextureAtlas
+
+def draw_box(box_type, size):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((10, 20, 30, 255))
+    return surface
+
+def draw_frames(frames_type, size):
+    return [draw_box(frames_type, size), draw_box(frames_type, size)]
+
+def make_factory(max_entries=8, max_packed=4):
+    set_headless(True)
+    factory = ArtFactory(max_entries, max_packed)
+    factory.register("sprite", draw_box)
+    factory.register("frames", draw_frames)
+    factory.register("baked", draw_box, atlas=False)
+    return factory
+
+def atlas_frames():
+    return ASSETS.atlas(ASSETS.GLOBAL_SCOPE).stats()["frames"]
+
+def test_same_key_is_shared():
+    factory = make_factory()
+    assert factory.get("sprite", "a", (10, 10)) is factory.get("sprite", "a", (10, 10))
+    assert isinstance(factory.get("frames", "a", (10, 10)), tuple)
+    assert factory.stats()["misses"] == 2
+
+def test_churn_does_not_evict_sprite_art_or_grow_atlas():
+    factory = make_factory()
+    sprite = factory.get("sprite", "a", (10, 10))
+    frames = factory.get("frames", "a", (12, 12))
+    packed = atlas_frames()
+
+    # Height-keyed art far beyond the LRU size, interleaved with sprite lookups
+    for height in range(100):
+        factory.get("baked", "pipe", (60, height + 1))
+        assert factory.get("sprite", "a", (10, 10)) is sprite
+        assert factory.get("frames", "a", (12, 12)) is frames
+
+    assert atlas_frames() == packed
+    assert factory.stats()["entries"] <= factory.max_entries
+
+def test_packed_keys_are_bounded():
+    factory = make_factory(max_packed=4)
+    before = atlas_frames()
+    for width in range(1, 50):
+        factory.get("sprite", "a", (width, 10))
+        factory.get("sprite", "a", (width, 10))
+    assert atlas_frames() - before == 4
+    assert factory.stats()["packed"] == 4
+    assert factory.stats()["entries"] <= factory.max_entries
+
+def test_atlas_packs_frames_into_shared_pages():
+    atlas = TextureAtlas(page_size=(64, 64), max_frame=32, convert=False)
+    frames = [atlas.pack(draw_box(None, (30, 30))) for _ in range(5)]
+    assert all(frame.get_parent() is not None for frame in frames)
+    assert atlas.stats()["pages"] == 2
+    assert atlas.stats()["frames"] == 5
+    assert pygame.image.tobytes(frames[0], "RGBA") == pygame.image.tobytes(draw_box(None, (30, 30)), "RGBA")
+
+def test_atlas_leaves_unpackable_frames_alone():
+    atlas = TextureAtlas(page_size=(64, 64), max_frame=32, convert=False)
+    opaque = pygame.Surface((8, 8))
+    large = draw_box(None, (40, 8))
+    assert atlas.pack(opaque) is opaque
+    assert atlas.pack(large) is large
+    frame = atlas.pack(draw_box(None, (8, 8)))
+    assert atlas.pack(frame) is frame
+    assert atlas.stats()["frames"] == 1
+
+def test_surface_built_on_two_threads_is_shared():
+    set_headless(True)
+    start = threading.Barrier(4)
+    built = []
+
+    def slow_box():
+        time.sleep(0.01)  # Long enough for every thread to miss, like the streamer's worker racing the main thread
+        return draw_box(None, (10, 10))
+
+    def build():
+        start.wait()
+        built.append(ASSETS.surface(("race-test",), slow_box))
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(surface is built[0] for surface in built)
+    assert ASSETS.surface(("race-test",), slow_box) is built[0]
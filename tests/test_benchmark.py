@@ -0,0 +1,12 @@
+from benchmark import run_scenario
+
+def test_scenario_report_with_traced_allocations():
+    result = run_scenario(0, None, 30, 1, trace_allocations=True)
+    assert result["frames"] == 30
+    assert set(result["net_block_growth_per_frame"]) == {"mean", "max"}
+    allocated = result["allocated_bytes_per_frame"]
+    assert 0 < allocated["mean"] <= allocated["max"]
+
+def test_untraced_report_has_no_allocation_bytes():
+    result = run_scenario(0, None, 10, 1)
+    assert "allocated_bytes_per_frame" not in result
@@ -0,0 +1,33 @@
+import pygame
+import pytest
+from settings import *
+from assets import set_headless
+from camera import Camera
+from static_layer import StaticLayer
+
+def make_sprite(x, y, width, height, color):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((width, height), pygame.SRCALPHA)
+    sprite.image.fill(color)
+    sprite.rect = sprite.image.get_rect(topleft=(x, y))
+    return sprite
+
+@pytest.mark.parametrize("camera_x, shake", [(10.6, 0), (10.4, 0), (10.5, 0), (37.2, 2.7), (0, -1.5)])
+def test_static_chunks_and_sprites_share_pixel_offset(camera_x, shake):
+    set_headless(True)
+    camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+    camera.x = camera_x
+    camera.y = 0
+    camera.shake_offset_x = shake
+
+    sprite = make_sprite(100, 300, 40, 20, (200, 50, 50, 255))
+    layer = StaticLayer()
+    layer.build([sprite])
+
+    baked = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    layer.draw(baked, camera)
+    blitted = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    blitted.blit(sprite.image, camera.apply(sprite))
+
+    assert baked.get_bounding_rect() == blitted.get_bounding_rect()
+    assert camera.apply_pos(*sprite.rect.topleft) == camera.apply(sprite).topleft
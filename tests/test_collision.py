@@ -0,0 +1,57 @@
+import pygame
+from settings import *
+from collision_system import CollisionSystem
+
+class Solid:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+def test_fast_fall_stops_on_thin_platform():
+    collisions = CollisionSystem()
+    floor = Solid(0, 300, 200, 4)
+    rect = pygame.Rect(50, 200, 30, 50)
+    contacts = collisions.sweep_vertical(rect, 200, [floor])
+    assert contacts == [floor]
+    assert rect.bottom == floor.rect.top
+
+def test_fast_run_stops_at_first_wall():
+    collisions = CollisionSystem()
+    near, far = Solid(100, 0, 5, 100), Solid(150, 0, 5, 100)
+    rect = pygame.Rect(0, 20, 30, 50)
+    assert collisions.sweep_horizontal(rect, 300, [far, near]) == [near]
+    assert rect.right == near.rect.left
+
+    rect = pygame.Rect(300, 20, 30, 50)
+    assert collisions.sweep_horizontal(rect, -300, [far, near]) == [far]
+    assert rect.left == far.rect.right
+
+def test_jump_stops_under_ceiling():
+    collisions = CollisionSystem()
+    ceiling = Solid(0, 100, 200, 20)
+    rect = pygame.Rect(50, 200, 30, 50)
+    assert collisions.sweep_vertical(rect, -150, [ceiling]) == [ceiling]
+    assert rect.top == ceiling.rect.bottom
+
+def test_overlap_within_skin_is_pushed_out():
+    collisions = CollisionSystem()
+    # A block that bobbed up into the player's feet by up to COLLISION_SKIN still catches a landing
+    block = Solid(0, 300 - COLLISION_SKIN, 100, 50)
+    rect = pygame.Rect(20, 250, 30, 50)
+    assert collisions.sweep_vertical(rect, 5, [block]) == [block]
+    assert rect.bottom == block.rect.top
+
+def test_deep_overlap_is_left_alone():
+    collisions = CollisionSystem()
+    # Something the rect is already well inside isn't used to teleport it out
+    wall = Solid(0, 0, 100, 300)
+    rect = pygame.Rect(50, 100, 30, 50)
+    assert collisions.sweep_horizontal(rect, 5, [wall]) == []
+    assert rect.x == 55
+    assert collisions.sweep_vertical(rect, 5, [wall]) == []
+    assert rect.y == 105
+
+def test_clear_move_rounds_like_a_rect():
+    collisions = CollisionSystem()
+    rect = pygame.Rect(0, 0, 10, 10)
+    assert collisions.sweep_horizontal(rect, 2.5, []) == []
+    assert rect.x == 3
@@ -0,0 +1,59 @@
+import numpy as np
+import pygame
+from settings import *
+from collision_system import CollisionSystem
+from enemy import Enemy
+from enemy_manager import EnemyManager, round_half_away
+
+class Solid:
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+def test_round_half_away_matches_rect_moves():
+    values = np.array([-2.5, -1.5, -0.5, -0.4, 0.4, 0.5, 1.5, 2.5, 3.49])
+    rect = pygame.Rect(0, 0, 1, 1)
+    expected = []
+    for value in values.tolist():
+        rect.x = value
+        expected.append(rect.x)
+    assert round_half_away(values).tolist() == expected
+
+def test_batch_sweep_matches_per_enemy_sweeps():
+    rng = np.random.default_rng(5)
+    collisions = CollisionSystem()
+    manager = EnemyManager()
+    for _ in range(20):
+        platforms = [Solid(int(x), int(y), int(w), int(h)) for x, y, w, h in
+                     zip(rng.integers(0, 800, 12), rng.integers(0, 600, 12), rng.integers(5, 200, 12), rng.integers(5, 60, 12))]
+        count = 40
+        x = rng.integers(0, 800, count)
+        y = rng.integers(0, 600, count)
+        velocity_x = rng.uniform(-30, 30, count)
+        velocity_y = rng.uniform(-30, 30, count)
+        new_x, new_y, turned, landed, bumped = manager.sweep(x, y, velocity_x, velocity_y, platforms)
+
+        for i in range(count):
+            rect = pygame.Rect(int(x[i]), int(y[i]), ENEMY_WIDTH, ENEMY_HEIGHT)
+            hit_x = collisions.sweep_horizontal(rect, float(velocity_x[i]), platforms)
+            hit_y = collisions.sweep_vertical(rect, float(velocity_y[i]), platforms)
+            assert (new_x[i], new_y[i]) == rect.topleft
+            assert turned[i] == bool(hit_x)
+            assert landed[i] == bool(hit_y and velocity_y[i] > 0)
+            assert bumped[i] == bool(hit_y and velocity_y[i] < 0)
+
+def test_enemies_fall_onto_a_platform_together():
+    manager = EnemyManager(2)
+    ground = Solid(0, 500, 2000, 50)
+    enemies = [Enemy(100 + i * 60, 300, "right" if i % 2 else "left", "goomba", manager) for i in range(6)]
+    assert manager.capacity >= 6
+    for _ in range(120):
+        manager.update(enemies, [ground])
+    assert all(enemy.rect.bottom == ground.rect.top and enemy.on_ground for enemy in enemies)
+
+def test_released_slots_are_reused():
+    manager = EnemyManager(4)
+    enemy = Enemy(0, 0, manager=manager)
+    slot = enemy.slot
+    manager.release(enemy)
+    assert enemy.slot is None
+    assert Enemy(0, 0, manager=manager).slot == slot
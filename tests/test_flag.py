@@ -0,0 +1,27 @@
+import pygame
+from settings import *
+from assets import set_headless
+from camera import Camera
+from flag import Flag, draw_flag
+
+def test_draw_flag_returns_a_new_surface():
+    first = draw_flag((80, 200), (139, 69, 19), (101, 67, 33), (255, 215, 0))
+    second = draw_flag((80, 200), (139, 69, 19), (101, 67, 33), (255, 215, 0))
+    assert first is not second
+    assert first.get_size() == (80, 200)
+    assert pygame.image.tobytes(first, "RGBA") == pygame.image.tobytes(second, "RGBA")
+
+def test_drawing_leaves_the_shared_image_alone():
+    set_headless(True)
+    flag = Flag(100, 200)
+    image = flag.image
+    before = pygame.image.tobytes(image, "RGBA")
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+    for celebration_mode in (False, True):
+        flag.celebration_mode = celebration_mode
+        for _ in range(10):
+            flag.update()
+            flag.draw(screen, camera)
+    assert flag.image is image
+    assert pygame.image.tobytes(image, "RGBA") == before
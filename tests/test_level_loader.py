@@ -0,0 +1,50 @@
+import os
+import pytest
+from settings import *
+from level_loader import (LEVELS, LevelFormatError, LevelPack, compile_level, decode_level, load_level_file,
+                          validate_level, write_level_file)
+from legacy_levels import LEVELS as LEGACY_LEVELS
+
+def test_level_files_match_the_original_levels():
+    assert len(LEVELS) == len(LEGACY_LEVELS)
+    for level, legacy in zip(LEVELS, LEGACY_LEVELS):
+        assert level == validate_level(legacy)
+
+def test_compiled_cache_round_trip(tmp_path):
+    pack = LevelPack(os.path.dirname(LEVELS.paths[0]), str(tmp_path))
+    built = list(pack)
+    assert len(os.listdir(tmp_path)) == len(built)
+
+    # A second pack reads the compiled files back instead of parsing
+    cached = list(LevelPack(os.path.dirname(LEVELS.paths[0]), str(tmp_path)))
+    assert cached == built == [validate_level(legacy) for legacy in LEGACY_LEVELS]
+
+def test_compile_decode_round_trip():
+    for level in LEVELS:
+        assert decode_level(compile_level(level)) == level
+
+def test_damaged_cache_is_rebuilt(tmp_path):
+    source = LEVELS.paths[0]
+    cache = tmp_path / "cache"
+    expected = load_level_file(source, str(cache))
+    (cache_file,) = cache.iterdir()
+    cache_file.write_bytes(b"garbage")
+    assert load_level_file(source, str(cache)) == expected
+    assert decode_level(cache_file.read_bytes()) == expected
+
+def test_write_and_read_back(tmp_path):
+    path = str(tmp_path / "level.json")
+    write_level_file(LEVELS[2], path)
+    assert load_level_file(path) == LEVELS[2]
+
+def test_every_problem_is_reported():
+    with pytest.raises(LevelFormatError) as error:
+        validate_level({"level_width": -5, "coins": [(1,)], "mystery": 1})
+    message = str(error.value)
+    assert "level_width" in message and "coins[0]" in message and "mystery" in message
+
+def test_loaded_level_sets_the_sky(game):
+    level = validate_level(dict(LEVELS[0], name="Dusk", background_color=(200, 90, 40)))
+    game.load_level(0, level)
+    game.compose_frame(1.0)
+    assert game.screen.get_at((SCREEN_WIDTH // 2, 20))[:3] == (200, 90, 40)
@@ -0,0 +1,53 @@
+from settings import *
+from level_loader import LEVELS, validate_level
+
+def tiled_level(copies, tile_width=2600):
+    """The first level repeated side by side, wide enough to stream"""
+    base = LEVELS[0]
+    level = {"name": "Tiled", "background_color": base["background_color"], "level_width": tile_width * copies,
+             "flag_position": (tile_width * copies - 200, 450)}
+    for key in ("platforms", "enemies", "coins", "jumping_blocks", "pipes", "powerups"):
+        level[key] = [(entry[0] + tile_width * copy,) + tuple(entry[1:])
+                      for copy in range(copies) for entry in base[key]]
+    return validate_level(level)
+
+def fly_right(game, frames, speed=34):
+    """Carry the player along the level untouched, so streaming sees a steadily moving view"""
+    for _ in range(frames):
+        game.player.rect.x += speed
+        game.player.rect.y = 300
+        game.player.velocity_y = 0
+        game.player.invincible_timer = 100
+        game.lives = 3
+        game.update()
+
+def test_only_sectors_near_the_view_are_loaded(game):
+    level = tiled_level(20)
+    game.load_level(0, level)
+    assert game.streamer
+    total = sum(len(level[key]) for key in ("platforms", "enemies", "coins", "jumping_blocks", "pipes", "powerups"))
+
+    peak = 0
+    for _ in range(30):
+        fly_right(game, 40)
+        assert game.game_state == PLAYING
+        peak = max(peak, len(game.all_sprites))
+    assert game.player.rect.x > level['level_width'] // 2
+    assert peak < total // 4
+
+    # Sectors far behind the view have been dropped again
+    active = [sector for sector in game.streamer.sectors if sector.active]
+    view_left = game.camera.get_visible_area()['left']
+    assert all(sector.right >= view_left - STREAM_KEEP_MARGIN for sector in active)
+
+def test_enemy_slots_are_recycled(game):
+    # More enemies than the shared arrays start with pass through the view
+    level = tiled_level(40)
+    assert len(level['enemies']) > ENEMY_CAPACITY
+    game.load_level(0, level)
+    fly_right(game, 1500, speed=60)
+    assert game.player.rect.x > level['enemies'][ENEMY_CAPACITY][0]
+    manager = game.enemy_manager
+    assert manager.capacity == ENEMY_CAPACITY
+    game.clear_level()
+    assert len(manager.free) == manager.capacity
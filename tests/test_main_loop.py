@@ -0,0 +1,37 @@
+import pytest
+from settings import *
+from main import run_fixed_steps
+
+class Counter:
+    def __init__(self):
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+def test_steps_owed_by_accumulated_time():
+    counter = Counter()
+    left = run_fixed_steps(counter, FIXED_TIMESTEP * 2.5)
+    assert counter.updates == 2
+    assert left == pytest.approx(FIXED_TIMESTEP * 0.5)
+
+def test_short_frames_carry_over():
+    counter = Counter()
+    accumulator = 0.0
+    for _ in range(4):
+        accumulator = run_fixed_steps(counter, accumulator + FIXED_TIMESTEP / 4)
+    assert counter.updates == 1
+
+def test_simulation_rate_is_independent_of_render_rate():
+    for render_fps in (30, 60, 144):
+        counter = Counter()
+        accumulator = 0.0
+        for _ in range(render_fps * 2):
+            accumulator = run_fixed_steps(counter, accumulator + 1.0 / render_fps)
+        assert abs(counter.updates - round(2 / FIXED_TIMESTEP)) <= 1
+
+def test_catch_up_is_capped():
+    counter = Counter()
+    left = run_fixed_steps(counter, FIXED_TIMESTEP * (MAX_UPDATES_PER_FRAME + 10))
+    assert counter.updates == MAX_UPDATES_PER_FRAME
+    assert left <= FIXED_TIMESTEP
@@ -0,0 +1,46 @@
+import numpy as np
+from settings import *
+from mario_env import ACTIONS, MarioEnv, VectorMarioEnv
+
+def run_noops(venv, steps):
+    for _ in range(steps):
+        observations, *_ = venv.step([0] * venv.num_envs)
+    return observations.copy()
+
+def test_reset_and_step_shapes():
+    env = MarioEnv()
+    obs, info = env.reset(seed=1)
+    assert obs.shape == env.observation_shape and obs.dtype == env.observation_dtype
+    assert info["state"] == PLAYING
+
+    obs, reward, terminated, truncated, info = env.step(ACTIONS.index((False, True, False)))
+    assert obs.shape == env.observation_shape
+    assert isinstance(reward, float) and reward > 0
+    assert not terminated and not truncated
+    assert info["steps"] == 1
+
+def test_seeded_env_is_reproducible():
+    env = MarioEnv()
+    runs = []
+    for _ in range(2):
+        env.reset(seed=3)
+        for _ in range(50):
+            obs, *_ = env.step(0)
+        runs.append(obs)
+    assert np.array_equal(runs[0], runs[1])
+
+def test_unseeded_vector_envs_diverge():
+    with VectorMarioEnv(2) as venv:
+        observations, _ = venv.reset()
+        assert observations.shape == (2,) + venv.observation_shape
+        observations = run_noops(venv, 150)
+    assert not np.array_equal(observations[0], observations[1])
+
+def test_seeded_vector_envs_are_reproducible():
+    runs = []
+    for _ in range(2):
+        with VectorMarioEnv(2) as venv:
+            venv.reset(seed=5)
+            runs.append(run_noops(venv, 100))
+    assert np.array_equal(runs[0], runs[1])
+    assert not np.array_equal(runs[0][0], runs[0][1])
@@ -0,0 +1,51 @@
+from settings import *
+from level_loader import LEVELS
+from pool import Pool
+
+class Item:
+    def __init__(self, value):
+        self.value = value
+
+    def reset(self, value):
+        self.value = value
+
+def test_acquire_reuses_released_items():
+    pool = Pool(Item, 2)
+    item = pool.acquire(1)
+    pool.release(item)
+    assert pool.acquire(2) is item
+    assert item.value == 2
+    assert (pool.created, pool.reused) == (1, 1)
+
+def test_release_beyond_capacity_is_dropped():
+    pool = Pool(Item, 1)
+    pool.release(Item(1))
+    pool.release(Item(2))
+    assert len(pool.free) == 1
+
+def test_prewarm_fills_up_to_count():
+    pool = Pool(Item, 4)
+    pool.prewarm(3, 0)
+    pool.prewarm(2, 0)
+    assert len(pool.free) == 3
+    pool.prewarm(10, 0)
+    assert len(pool.free) == 4
+
+def test_powerups_prewarmed_per_type(game):
+    for level_index, level_data in enumerate(LEVELS):
+        game.load_level(level_index)
+        for powerup_type, pool in game.powerup_pools.items():
+            needed = sum(1 for block in level_data['jumping_blocks'] if block[3] == powerup_type)
+            needed += sum(1 for powerup in level_data['powerups'] if powerup[2] == powerup_type)
+            placed = sum(1 for powerup in game.level_sprites[game.powerups] if powerup.powerup_type == powerup_type)
+            assert len(pool.free) + placed >= min(needed, POWERUP_POOL_SIZE)
+            assert all(powerup.powerup_type == powerup_type for powerup in pool.free)
+
+def test_spawned_powerup_comes_from_its_type_pool(game):
+    for powerup_type, pool in game.powerup_pools.items():
+        pool.prewarm(1, 0, 0, powerup_type)
+        spare = pool.free[-1]
+        image = spare.image
+        powerup = game.spawn_powerup(500, 400, powerup_type)
+        assert powerup is spare
+        assert powerup.image is image
@@ -0,0 +1,45 @@
+import pytest
+from profiling import SectionProfiler
+
+class Base:
+    def step(self):
+        return "step"
+
+class Child(Base):
+    def run(self):
+        return "run"
+
+def calls(profiler, section):
+    return profiler.counts.get(section, 0)
+
+@pytest.mark.parametrize("first_out", [0, 1])
+@pytest.mark.parametrize("name", ["step", "run"])
+def test_two_hook_sets_detach_in_either_order(name, first_out):
+    before = dict(vars(Child))
+    profilers = [SectionProfiler(), SectionProfiler()]
+    for profiler in profilers:
+        profiler.attach(Child, name, name)
+
+    child = Child()
+    getattr(child, name)()
+    assert [calls(profiler, name) for profiler in profilers] == [1, 1]
+
+    # The one still attached keeps timing, the detached one stops
+    profilers[first_out].detach()
+    getattr(child, name)()
+    assert calls(profilers[first_out], name) == 1
+    assert calls(profilers[1 - first_out], name) == 2
+
+    profilers[1 - first_out].detach()
+    assert getattr(child, name)() == name
+    assert dict(vars(Child)) == before
+
+def test_instance_hooks_restore_the_instance():
+    child = Child()
+    profiler = SectionProfiler()
+    profiler.attach(child, "run", "run")
+    assert "run" in vars(child)
+    child.run()
+    profiler.detach()
+    assert "run" not in vars(child)
+    assert profiler.end_frame().keys() == {"run"}
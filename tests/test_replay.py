@@ -0,0 +1,45 @@
+import pytest
+from settings import *
+from game import MarioGame
+from replay import Replay, ReplayRecorder, ReplayPlayer, pack_controls, unpack_controls, state_checksum
+
+def record(frames, seed=1234):
+    game = MarioGame(headless=True)
+    recorder = ReplayRecorder(game, seed=seed, checksum_interval=50)
+    recorder.start()
+    for frame in range(frames):
+        game.set_controls(left=frame % 200 >= 170, right=frame % 200 < 150, jump=frame % 40 < 20)
+        recorder.update()
+    return recorder.replay, state_checksum(game)
+
+def test_controls_pack_round_trip():
+    for bits in range(8):
+        assert pack_controls(*unpack_controls(bits)) == bits
+
+def test_playback_matches_recording(tmp_path):
+    replay, final = record(600)
+    path = tmp_path / "run.mrp"
+    replay.save(path)
+
+    loaded = Replay.load(path)
+    assert (loaded.seed, loaded.level, loaded.inputs, loaded.checksums) == (replay.seed, replay.level, replay.inputs, replay.checksums)
+
+    game = MarioGame(headless=True)
+    player = ReplayPlayer(game, loaded)
+    assert player.run() == 600
+    assert player.mismatches == []
+    assert state_checksum(game) == final
+
+def test_playback_reports_desyncs():
+    replay, _ = record(200)
+    frame = min(replay.checksums)
+    replay.checksums[frame] ^= 1
+    player = ReplayPlayer(MarioGame(headless=True), replay)
+    player.run()
+    assert [mismatch[0] for mismatch in player.mismatches] == [frame]
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.mrp"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        Replay.load(path)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from settings import *
+from level_generator import LevelGenerator
+
+def play(game, frames, start=0):
+    for frame in range(start, start + frames):
+        step = frame % 200
+        game.set_controls(step >= 170, step < 150, frame % 40 < 20)
+        game.update()
+
+def test_restore_round_trip(game):
+    play(game, 60)
+    state = game.snapshot()
+    play(game, 120, 60)
+    assert not np.array_equal(game.snapshot(), state, equal_nan=True)
+    game.restore(state)
+    assert np.array_equal(game.snapshot(), state, equal_nan=True)
+
+def test_restored_run_replays_identically(game):
+    play(game, 60)
+    state = game.snapshot()
+    play(game, 200, 60)
+    first = game.snapshot()
+    game.restore(state)
+    play(game, 200, 60)
+    assert np.array_equal(game.snapshot(), first, equal_nan=True)
+
+def test_restore_across_level_load(game):
+    play(game, 30)
+    state = game.snapshot()
+    game.load_level(1)
+    game.restore(state)
+    assert np.array_equal(game.snapshot(), state, equal_nan=True)
+
+def test_enemy_batch_state_matches_per_enemy_state(game):
+    play(game, 90)
+    enemies = game.level_sprites[game.enemies]
+    assert enemies
+    states = game.enemy_manager.get_states(enemies)
+    assert states.tolist() == [[float(value) for value in enemy.get_state()] for enemy in enemies]
+
+    # Writing the rows back through the batch path changes nothing
+    game.enemy_manager.set_states(enemies, states)
+    assert game.enemy_manager.get_states(enemies).tolist() == states.tolist()
+
+def test_streamed_levels_cannot_be_snapshotted(game):
+    level = LevelGenerator(1, STREAM_MIN_LEVEL_WIDTH, 0.2).generate()
+    game.load_level(0, level)
+    assert game.streamer
+    with pytest.raises(RuntimeError):
+        game.snapshot()
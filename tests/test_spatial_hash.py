@@ -0,0 +1,49 @@
+import pygame
+from spatial_hash import SpatialHash
+
+class Box:
+    def __init__(self, x, y, width=10, height=10):
+        self.rect = pygame.Rect(x, y, width, height)
+
+def test_query_finds_overlapping_cells_in_insertion_order():
+    grid = SpatialHash(100)
+    boxes = [Box(250, 0), Box(10, 10), Box(150, 50, 200, 10), Box(900, 900)]
+    for box in boxes:
+        grid.insert(box)
+    assert grid.query(pygame.Rect(0, 0, 300, 100)) == boxes[:3]
+    assert grid.query(pygame.Rect(500, 500, 10, 10)) == []
+    assert len(grid) == 4
+
+def test_objects_spanning_cells_are_returned_once():
+    grid = SpatialHash(50)
+    wide = Box(0, 0, 400, 400)
+    grid.insert(wide)
+    assert grid.query(pygame.Rect(0, 0, 400, 400)) == [wide]
+
+def test_move_and_remove():
+    grid = SpatialHash(100)
+    first, second = Box(10, 10), Box(20, 20)
+    grid.insert(first)
+    grid.insert(second)
+    first.rect.x = 510
+    grid.move(first)
+    assert grid.query(pygame.Rect(0, 0, 100, 100)) == [second]
+    assert grid.query(pygame.Rect(500, 0, 100, 100)) == [first]
+
+    # Moving back keeps the original query order
+    first.rect.x = 10
+    grid.move(first)
+    assert grid.query(pygame.Rect(0, 0, 100, 100)) == [first, second]
+
+    grid.remove(first)
+    assert first not in grid
+    assert grid.query(pygame.Rect(0, 0, 100, 100)) == [second]
+    grid.clear()
+    assert len(grid) == 0 and grid.cells == {}
+
+def test_negative_coordinates_and_custom_rects():
+    grid = SpatialHash(64, 32)
+    box = Box(-100, -50)
+    grid.insert(box, box.rect.inflate(0, 100))
+    assert grid.query(pygame.Rect(-100, 20, 5, 5)) == [box]
+    assert grid.query(pygame.Rect(-100, 60, 5, 5)) == []
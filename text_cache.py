@@ -0,0 +1,48 @@
+import pygame
+from collections import OrderedDict
+from settings import *
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font size, text, colour)"""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.fonts = {}  # size -> Font, built once
+        self.surfaces = OrderedDict()  # (size, text, color) -> Surface
+
+        # Counters for debugging and benchmarks
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size):
+        """Get the default font at a size, creating it on first use"""
+        font = self.fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text, size, color):
+        """Get an antialiased text surface, rendering it only when not cached"""
+        key = (size, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # Evict the least recently used text
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+
+# Shared cache for the HUD, menus and debug text
+TEXT_CACHE = TextCache()